@@ -0,0 +1,272 @@
+"""Persistent on-disk caches for LLM error-analysis responses.
+
+Repeated runs against the same compose file produce the same errors, so the
+parsed ``analyze_error`` result is stored in ``~/.checkdk/llm_cache.json``
+and served from there instead of issuing another network round-trip.
+
+:class:`SemanticCache` extends this to near-duplicate errors (same failure,
+different port / container ID) using sentence embeddings.  It is opt-in via
+``ai.semantic_cache`` in the config, needs the optional ``fastembed`` +
+``numpy`` packages and an already-downloaded embedding model, and silently
+disables itself otherwise — a lookup never fetches the model.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+try:  # optional speed-up; the stdlib json path below is fully equivalent
+    import orjson
+except ImportError:  # pragma: no cover - depends on the install
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".checkdk" / "llm_cache.json"
+DEFAULT_SEMANTIC_CACHE_PATH = Path.home() / ".checkdk" / "llm_semantic_cache.json"
+
+# Container IDs / digests first, then any run of digits (ports, PIDs, …)
+_VOLATILE_TOKEN_RE = re.compile(r"[0-9a-f]{12,}|\d+")
+
+
+def normalize_error(error_message: str) -> str:
+    """Replace volatile tokens (ports, hex IDs) so near-duplicates compare equal."""
+    return _VOLATILE_TOKEN_RE.sub("N", error_message)
+
+
+def _read_json(path: Path):
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    raw = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(raw)
+    os.replace(tmp_path, path)
+
+
+class LLMCache:
+    """JSON-backed key/value store for parsed LLM responses.
+
+    The file is read lazily on first access and written back once at process
+    exit (or on an explicit :meth:`flush`) — lookups are plain dict hits.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else DEFAULT_CACHE_PATH
+        self._store: Optional[dict] = None
+        self._dirty = False
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        error_message: str,
+        config_snippet: str,
+        service_name: Optional[str],
+    ) -> str:
+        """Hash the inputs that determine an analysis into a compact key."""
+        raw = f"{provider}:{model}:{error_message}:{config_snippet}:{service_name}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _load(self) -> dict:
+        if self._store is None:
+            try:
+                data = _read_json(self.path)
+                self._store = data if isinstance(data, dict) else {}
+            except FileNotFoundError:
+                self._store = {}
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable LLM cache %s: %s", self.path, exc)
+                self._store = {}
+        return self._store
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a copy of the cached result for *key*, or None on a miss."""
+        hit = self._load().get(key)
+        return dict(hit) if hit is not None else None
+
+    def set(self, key: str, value: dict) -> None:
+        """Store *value* under *key*; persisted on the next :meth:`flush`."""
+        self._load()[key] = dict(value)
+        self._dirty = True
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._store = {}
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending entries to disk atomically (no-op when unchanged)."""
+        if not self._dirty or self._store is None:
+            return
+        try:
+            _write_json_atomic(self.path, self._store)
+            self._dirty = False
+        except OSError as exc:
+            logger.warning("Could not write LLM cache %s: %s", self.path, exc)
+
+
+class SemanticCache:
+    """Embedding-based cache that matches near-duplicate error messages.
+
+    Errors are normalised with :func:`normalize_error`, embedded, and compared
+    by cosine similarity against every stored entry.  A hit requires both
+    ``similarity > threshold`` *and* a matching :meth:`scope` — the same
+    provider, model, config snippet and ``service_name`` — so an edited
+    config or a different model never reuses an answer written for another.
+    """
+
+    MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+    THRESHOLD = 0.92
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        threshold: float = THRESHOLD,
+        embedder=None,
+        enabled: bool = True,
+    ):
+        self.path = Path(path) if path is not None else DEFAULT_SEMANTIC_CACHE_PATH
+        self.threshold = threshold
+        # Optional callable ``str -> sequence[float]``; defaults to fastembed.
+        self._embedder = embedder
+        if embedder is not None:
+            self._available: Optional[bool] = True
+        else:
+            self._available = None if enabled else False
+        self._entries: Optional[list] = None
+        self._matrix = None
+        self._last: Optional[tuple] = None
+        self._dirty = False
+
+    @staticmethod
+    def scope(provider: str, model: str, config_snippet: str, service_name: Optional[str]) -> dict:
+        """Return the fields an entry must share with a lookup to be a hit."""
+        config_hash = hashlib.blake2b(config_snippet.encode("utf-8"), digest_size=16).hexdigest()
+        return {"provider": provider, "model": model, "config": config_hash, "service": service_name}
+
+    def _get_embedder(self):
+        if self._available is None:
+            try:
+                import numpy  # noqa: F401
+                from fastembed import TextEmbedding
+
+                # Only a model already on disk is used; never download mid-analysis.
+                model = TextEmbedding(self.MODEL_NAME, local_files_only=True)
+                self._embedder = lambda text: next(iter(model.embed([text])))
+                self._available = True
+            except Exception as exc:  # ImportError or model not downloaded
+                logger.debug("Semantic LLM cache disabled: %s", exc)
+                self._available = False
+        return self._embedder if self._available else None
+
+    def _embed(self, text: str):
+        if self._last is not None and self._last[0] == text:
+            return self._last[1]
+        embedder = self._get_embedder()
+        if embedder is None:
+            return None
+        import numpy as np
+
+        try:
+            vec = np.asarray(embedder(text), dtype=np.float32)
+        except Exception as exc:
+            logger.debug("Embedding failed, skipping semantic cache: %s", exc)
+            return None
+        norm = float(np.linalg.norm(vec))
+        if norm:
+            vec = vec / norm
+        self._last = (text, vec)
+        return vec
+
+    def _load(self) -> list:
+        if self._entries is None:
+            try:
+                data = _read_json(self.path)
+                self._entries = data if isinstance(data, list) else []
+            except FileNotFoundError:
+                self._entries = []
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable semantic cache %s: %s", self.path, exc)
+                self._entries = []
+        return self._entries
+
+    def get(self, error_message: str, scope: dict) -> Optional[dict]:
+        """Return the result of the closest matching entry, or None."""
+        entries = self._load()
+        if not entries:
+            return None
+        vec = self._embed(normalize_error(error_message))
+        if vec is None:
+            return None
+        import numpy as np
+
+        if self._matrix is None:
+            self._matrix = np.asarray([e["embedding"] for e in entries], dtype=np.float32)
+        sims = self._matrix @ vec
+        for idx in np.argsort(sims)[::-1]:
+            if sims[idx] <= self.threshold:
+                break
+            entry = entries[idx]
+            if all(entry.get(field) == value for field, value in scope.items()):
+                return dict(entry["result"])
+        return None
+
+    def set(self, error_message: str, scope: dict, value: dict) -> None:
+        """Embed *error_message* and store *value* for future lookups."""
+        vec = self._embed(normalize_error(error_message))
+        if vec is None:
+            return
+        self._load().append({
+            **scope,
+            "embedding": [float(x) for x in vec],
+            "result": dict(value),
+        })
+        self._matrix = None
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending entries to disk atomically (no-op when unchanged)."""
+        if not self._dirty or self._entries is None:
+            return
+        try:
+            _write_json_atomic(self.path, self._entries)
+            self._dirty = False
+        except OSError as exc:
+            logger.warning("Could not write semantic cache %s: %s", self.path, exc)
+
+
+_cache: Optional[LLMCache] = None
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Return the process-wide LLM cache."""
+    global _cache
+    if _cache is None:
+        _cache = LLMCache()
+        atexit.register(_cache.flush)
+    return _cache
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Return the process-wide semantic LLM cache (disabled unless opted in)."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        from ..config import get_config
+
+        _semantic_cache = SemanticCache(enabled=get_config().ai.semantic_cache)
+        atexit.register(_semantic_cache.flush)
+    return _semantic_cache
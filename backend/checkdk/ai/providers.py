@@ -1,12 +1,14 @@
 """AI provider implementations – Mistral (primary) + Groq (fallback)."""
 
-from abc import ABC, abstractmethod
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Optional, Protocol
 import json
 import logging
 import os
 import re
 
+from .cache import LLMCache, SemanticCache, get_llm_cache, get_semantic_cache
+
 # Ensure .env is loaded before reading API keys from os.getenv().
 # env.py is a thin python-dotenv wrapper; the try/except guards against
 # import errors during tests or unusual install layouts.
@@ -66,13 +68,234 @@ Be precise and specific — cite exact resource names, values, and line numbers
 Do NOT hallucinate issues that are not present. If the config is clean, say so with a high score."""
 
 
+ERROR_SYSTEM_PROMPT = "You are a Docker and Kubernetes expert. Provide concise, actionable advice."
+
+POD_HEALTH_SYSTEM_PROMPT = (
+    "You are a DevOps SRE expert specialising in Docker and Kubernetes "
+    "reliability. Provide concise, actionable pod health assessments."
+)
+
+ERROR_PROMPT_TEMPLATE = """Analyze this Docker Compose configuration error:
+
+**Error**: {error}
+**Service**: {service}
+**Configuration**:
+```yaml
+{config}
+```
+
+Provide:
+1. **Explanation**: What's wrong in plain English (1-2 sentences)
+2. **Root Cause**: Why this happens (1 sentence)
+3. **Fix**: Exact steps to resolve (2-3 actionable steps)
+
+Keep it concise and practical."""
+
+ERROR_BATCH_PROMPT_TEMPLATE = """Analyze these {count} Docker Compose configuration errors.
+
+Answer each one under its own "### ERROR <n>" heading, in the same order, using:
+1. **Explanation**: What's wrong in plain English (1-2 sentences)
+2. **Root Cause**: Why this happens (1 sentence)
+3. **Fix**: Exact steps to resolve (2-3 actionable steps)
+
+Keep it concise and practical.
+
+{errors}"""
+
+ERROR_BATCH_ITEM_TEMPLATE = """### ERROR {n}
+**Error**: {error}
+**Service**: {service}
+**Configuration**:
+```yaml
+{config}
+```"""
+
+# Longer snippets only add prompt tokens (and latency) without helping the model
+_MAX_CONFIG_SNIPPET_CHARS = 2048
+
+# Errors per batched request, and the completion budget for each of them
+_MAX_ERRORS_PER_BATCH = 8
+_BATCH_TOKENS_PER_ERROR = 300
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# "**Explanation**: …", "2. Root Cause: …", "## Fix Steps" → (section, inline text)
+_SECTION_RE = re.compile(
+    r"^(?:#+\s*)?(?:\d+[.)]\s*)?(?:\*\*)?\s*"
+    r"(explanation|root\s*cause|fix(?:es|\s*steps)?)"
+    r"\s*(?:\([^)]*\))?\s*(?:\*\*)?\s*(?:[:\-]\s*(?:\*\*)?\s*(.*))?$",
+    re.IGNORECASE,
+)
+# "- step", "• step", "* step", "3. step" → step text without the marker.
+# A set lookup + str.lstrip is far cheaper than a regex on every line.
+_BULLET_STARTS = frozenset("-•*0123456789")
+_BULLET_STRIP = "-•*0123456789.) \t"
+_SECTION_WORD_RE = re.compile(r"explanation|root|fix", re.IGNORECASE)
+# "### ERROR 2" → 2
+_BATCH_SPLIT_RE = re.compile(r"^#{1,6}\s*error\s+(\d+)\b.*$", re.IGNORECASE | re.MULTILINE)
+
+_SECTION_KEYS = {"e": "explanation", "r": "root_cause", "f": "fix_steps"}
+
+# Pod-health sections, checked in priority order against the lower-cased line
+_POD_SECTION_WORDS = (
+    ("root cause", "root_cause"),
+    ("assessment", "assessment"),
+    ("recommendation", "recommendations"),
+)
+_MD_EMPHASIS_RE = re.compile(r"\*{1,2}([^*]+)\*{1,2}")
+_MD_HEADER_LINE_RE = re.compile(r"^#+\s+.*$", re.MULTILINE)
+
+
+def _strip_md_markers(text: str) -> str:
+    return _MD_EMPHASIS_RE.sub(r"\1", text).strip()
+
 def _strip_fences(raw: str) -> str:
     """Remove markdown code fences from LLM output."""
     return re.sub(r"^```(?:json)?\s*", "", raw.strip(), flags=re.MULTILINE).rstrip("`").strip()
 
 
+def _pooled_http_client():
+    """Build a keep-alive httpx client shared by every call of one provider.
+
+    HTTP/2 is used when the optional ``h2`` package is installed.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.Client(
+        http2=http2,
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+
+
+# Stop reading a streamed error analysis once this many fix steps have arrived
+_EARLY_STOP_FIX_STEPS = 3
+_ERROR_STOP_SEQUENCES = ["\n\n---"]
+
+
+def _read_error_stream(stream, delta_of) -> str:
+    """Accumulate a streamed error analysis, stopping as soon as it is complete.
+
+    *delta_of* maps one stream chunk to its text delta.  After each finished
+    line the buffer is re-parsed; once the explanation, root cause and
+    ``_EARLY_STOP_FIX_STEPS`` fix steps are present the stream is closed so
+    the model stops generating tokens nobody will read.
+    """
+    buffer = ""
+    try:
+        for chunk in stream:
+            try:
+                delta = delta_of(chunk) or ""
+            except (AttributeError, IndexError):  # e.g. trailing usage-only chunk
+                continue
+            buffer += delta
+            if "\n" not in delta:
+                continue
+            complete = buffer[: buffer.rfind("\n")]
+            parsed = _parse_ai_response(complete)
+            if (
+                parsed["explanation"]
+                and parsed["root_cause"]
+                and len(parsed["fix_steps"]) >= _EARLY_STOP_FIX_STEPS
+            ):
+                return complete
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+    return buffer
+
+
+def _truncate_words(text: str, limit: int) -> str:
+    """Cut *text* to at most *limit* characters without splitting a word."""
+    if len(text) <= limit:
+        return text
+    head = text[:limit]
+    if not text[limit].isspace():
+        parts = head.rsplit(None, 1)
+        if len(parts) == 2:
+            head = parts[0]
+    return head.rstrip()
+
+
+def _parse_ai_response(text: str | bytes) -> dict:
+    """Parse a free-text error analysis into explanation / root_cause / fix_steps."""
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode("utf-8", "replace")
+    result: dict = {"explanation": "", "root_cause": "", "fix_steps": []}
+    current_section: str | None = None
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        m = _SECTION_RE.match(line)
+        if m:
+            current_section = _SECTION_KEYS[m.group(1)[0].lower()]
+            inline = (m.group(2) or "").strip()
+            if inline and current_section != "fix_steps":
+                result[current_section] = inline
+            continue
+        if current_section == "fix_steps" and line[0] in _BULLET_STARTS:
+            step = line.lstrip(_BULLET_STRIP)
+            if step:
+                result["fix_steps"].append(step)
+            continue
+        # Only the first plain line of a prose section is kept; check that
+        # before the (comparatively slow) case-insensitive word search.
+        if (
+            current_section in ("explanation", "root_cause")
+            and not result[current_section]
+            and not _SECTION_WORD_RE.search(line)
+        ):
+            result[current_section] = line
+
+    if not result["explanation"]:
+        result["explanation"] = _truncate_words(text.strip(), 200)
+    return result
+
+
+def _split_batch_response(text: str, count: int) -> list[str | None]:
+    """Split a batched answer on its "### ERROR <n>" headings.
+
+    Returns one chunk per error (1-based numbering in the text), with None for
+    any error the model skipped.
+    """
+    chunks: list[str | None] = [None] * count
+    matches = list(_BATCH_SPLIT_RE.finditer(text))
+    for i, m in enumerate(matches):
+        n = int(m.group(1))
+        if 1 <= n <= count and chunks[n - 1] is None:
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+            chunks[n - 1] = text[m.end():end].strip()
+    return chunks
+
+
+def _build_prompt(
+    template: str, error_message: str, config_snippet: str, context: dict, **extra
+) -> str:
+    """Fill an error-analysis template's ``{error}``/``{service}``/``{config}`` fields."""
+    return template.format_map({
+        "error": error_message,
+        "service": context.get("service_name", "unknown"),
+        "config": config_snippet[:_MAX_CONFIG_SNIPPET_CHARS],
+        **extra,
+    })
+
+
+def _chat_messages(system: str, user: str) -> list[dict]:
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user},
+    ]
+
+
 def _build_user_message(content: str, filename: str | None = None) -> str:
     tag = f" ({filename})" if filename else ""
     return (
@@ -81,28 +304,28 @@ def _build_user_message(content: str, filename: str | None = None) -> str:
     )
 
 
-# ── Base class ────────────────────────────────────────────────────────────────
+# ── Provider interface ────────────────────────────────────────────────────────
 
 
-class AIProvider(ABC):
-    """Base class for AI providers."""
+class AIProvider(Protocol):
+    """Interface every AI provider satisfies (structurally — no inheritance)."""
 
-    @abstractmethod
     def analyze_error(self, error_message: str, config_snippet: str, context: dict) -> dict:
         """Analyze an error and return explanation and fixes."""
         ...
 
-    @abstractmethod
+    def analyze_errors_batch(self, items: list[tuple[str, str, dict]]) -> list[dict]:
+        """Analyze several errors, sharing LLM requests where possible."""
+        ...
+
     def is_available(self) -> bool:
         """Check if the provider is available and configured."""
         ...
 
-    @abstractmethod
     def analyze_pod_health(self, prediction: dict) -> dict:
         """Analyse a Random Forest prediction result and return a risk assessment."""
         ...
 
-    @abstractmethod
     def analyze_config(self, content: str, filename: str | None = None) -> dict:
         """Full security / best-practice audit used by the Playground endpoint.
 
@@ -111,26 +334,116 @@ class AIProvider(ABC):
         """
         ...
 
+
+# ── Shared implementation ─────────────────────────────────────────────────────
+
+
+class _ProviderBase:
+    """Caching, prompt and parsing helpers shared by the concrete providers.
+
+    Subclasses supply ``is_available``, ``analyze_error`` and ``_complete``.
+    """
+
+    # ── Shared response cache ─────────────────────────────────────────────────
+
+    def _error_cache_key(self, error_message: str, config_snippet: str, context: dict) -> str:
+        return LLMCache.make_key(
+            type(self).__name__,
+            getattr(self, "model", ""),
+            error_message,
+            config_snippet,
+            context.get("service_name"),
+        )
+
+    def _semantic_scope(self, config_snippet: str, context: dict) -> dict:
+        return SemanticCache.scope(
+            type(self).__name__,
+            getattr(self, "model", ""),
+            config_snippet,
+            context.get("service_name"),
+        )
+
+    def _cached_error_result(
+        self, cache_key: str, error_message: str, config_snippet: str, context: dict
+    ) -> dict | None:
+        """Return a cached analysis (exact hash first, then semantic), or None."""
+        hit = get_llm_cache().get(cache_key)
+        if hit is None:
+            scope = self._semantic_scope(config_snippet, context)
+            hit = get_semantic_cache().get(error_message, scope)
+        return hit
+
+    def _remember_error_result(
+        self, cache_key: str, error_message: str, config_snippet: str, context: dict, result: dict
+    ) -> None:
+        get_llm_cache().set(cache_key, result)
+        scope = self._semantic_scope(config_snippet, context)
+        get_semantic_cache().set(error_message, scope, result)
+
+    # ── Batched error analysis ────────────────────────────────────────────────
+
+    def analyze_errors_batch(self, items: list[tuple[str, str, dict]]) -> list[dict]:
+        """Analyze several ``(error_message, config_snippet, context)`` items.
+
+        Cache hits are served locally; the remaining errors share one request
+        per :data:`_MAX_ERRORS_PER_BATCH` items instead of one round-trip
+        each.  Results come back in input order.  An error the model skipped
+        in its batched answer is retried on its own; a failed request yields
+        ``{"error": ...}`` dicts rather than repeating the call per item.
+        """
+        if not self.is_available():
+            message = f"{type(self).__name__} is not configured"
+            return [{"error": message} for _ in items]
+
+        results: list[dict | None] = [None] * len(items)
+        misses: list[tuple[int, str]] = []
+        for i, (error_message, config_snippet, context) in enumerate(items):
+            cache_key = self._error_cache_key(error_message, config_snippet, context)
+            results[i] = self._cached_error_result(cache_key, error_message, config_snippet, context)
+            if results[i] is None:
+                misses.append((i, cache_key))
+
+        if len(misses) == 1:
+            i, _ = misses[0]
+            results[i] = self.analyze_error(*items[i])
+            return results
+
+        for start in range(0, len(misses), _MAX_ERRORS_PER_BATCH):
+            batch = misses[start:start + _MAX_ERRORS_PER_BATCH]
+            prompt = self._build_error_batch_prompt([items[i] for i, _ in batch])
+            try:
+                text = self._complete(
+                    ERROR_SYSTEM_PROMPT, prompt, _BATCH_TOKENS_PER_ERROR * len(batch)
+                )
+            except Exception as e:
+                for i, _ in batch:
+                    results[i] = {"error": f"{type(self).__name__} batch error: {e}"}
+                continue
+            for (i, cache_key), chunk in zip(batch, _split_batch_response(text, len(batch))):
+                if chunk is None:
+                    # Section missing or malformed — ask about this one alone
+                    results[i] = self.analyze_error(*items[i])
+                    continue
+                results[i] = self._parse_error_response(chunk)
+                error_message, config_snippet, context = items[i]
+                self._remember_error_result(
+                    cache_key, error_message, config_snippet, context, results[i]
+                )
+        return results
+
     # ── Shared prompt builders ────────────────────────────────────────────────
 
     @staticmethod
     def _build_error_prompt(error_message: str, config_snippet: str, context: dict) -> str:
-        service = context.get("service_name", "unknown")
-        return f"""Analyze this Docker Compose configuration error:
-
-**Error**: {error_message}
-**Service**: {service}
-**Configuration**:
-```yaml
-{config_snippet}
-```
-
-Provide:
-1. **Explanation**: What's wrong in plain English (1-2 sentences)
-2. **Root Cause**: Why this happens (1 sentence)
-3. **Fix**: Exact steps to resolve (2-3 actionable steps)
+        return _build_prompt(ERROR_PROMPT_TEMPLATE, error_message, config_snippet, context)
 
-Keep it concise and practical."""
+    @staticmethod
+    def _build_error_batch_prompt(items: list[tuple[str, str, dict]]) -> str:
+        errors = "\n\n".join(
+            _build_prompt(ERROR_BATCH_ITEM_TEMPLATE, error_message, config_snippet, context, n=n)
+            for n, (error_message, config_snippet, context) in enumerate(items, 1)
+        )
+        return ERROR_BATCH_PROMPT_TEMPLATE.format_map({"count": len(items), "errors": errors})
 
     @staticmethod
     def _build_pod_health_prompt(prediction: dict) -> str:
@@ -168,47 +481,7 @@ Be concise and practical. Focus on the highest-impact metrics."""
     @staticmethod
     def _parse_error_response(response: str) -> dict:
         """Parse a free-text error analysis response into structured dict."""
-        lines = response.strip().split("\n")
-        result: dict = {"explanation": "", "root_cause": "", "fix_steps": []}
-        current_section: str | None = None
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            lower = line.lower()
-            if "explanation" in lower and ":" in line:
-                current_section = "explanation"
-                parts = line.split(":", 1)
-                if len(parts) > 1 and parts[1].strip():
-                    result["explanation"] = parts[1].strip()
-            elif "root cause" in lower and ":" in line:
-                current_section = "root_cause"
-                parts = line.split(":", 1)
-                if len(parts) > 1 and parts[1].strip():
-                    result["root_cause"] = parts[1].strip()
-            elif "fix" in lower and ":" in line:
-                current_section = "fix_steps"
-            elif current_section == "fix_steps" and (
-                line.startswith("-")
-                or line.startswith("•")
-                or line.startswith("*")
-                or (len(line) > 0 and line[0].isdigit())
-            ):
-                clean = line.lstrip("-•*0123456789. ").strip()
-                if clean:
-                    result["fix_steps"].append(clean)
-            elif current_section and not any(
-                x in lower for x in ("explanation", "root", "fix")
-            ):
-                if current_section == "explanation" and not result["explanation"]:
-                    result["explanation"] = line
-                elif current_section == "root_cause" and not result["root_cause"]:
-                    result["root_cause"] = line
-
-        if not result["explanation"]:
-            result["explanation"] = response[:200]
-        return result
+        return _parse_ai_response(response)
 
     @staticmethod
     def _parse_pod_health_response(response: str) -> dict:
@@ -218,58 +491,38 @@ Be concise and practical. Focus on the highest-impact metrics."""
         and block style           (``## Assessment\n\ntext…``)
         and accumulates multi-line content for each section.
         """
-        _strip_md_markers = lambda s: re.sub(r"\*{1,2}([^*]+)\*{1,2}", r"\1", s).strip()
-
-        lines = response.strip().split("\n")
         result: dict = {"assessment": "", "root_cause": "", "recommendations": []}
         current_section: str | None = None
         section_lines: dict = {"assessment": [], "root_cause": []}
 
-        for line in lines:
+        for line in response.splitlines():
             stripped = line.strip()
             if not stripped:
                 continue
             lower = stripped.lower()
+            keyword = next((key for word, key in _POD_SECTION_WORDS if word in lower), None)
             # Detect section header regardless of colon or ## prefix
-            is_header = ":" in stripped or stripped.startswith("#") or stripped.startswith("**")
-            if "assessment" in lower and is_header and "root cause" not in lower:
-                current_section = "assessment"
-                if ":" in stripped:
-                    inline = stripped.split(":", 1)[1].strip()
-                    inline = _strip_md_markers(inline)
+            if keyword and (":" in stripped or stripped.startswith(("#", "**"))):
+                current_section = keyword
+                if keyword != "recommendations" and ":" in stripped:
+                    inline = _strip_md_markers(stripped.split(":", 1)[1])
                     if inline:
-                        section_lines["assessment"].append(inline)
-            elif "root cause" in lower and is_header:
-                current_section = "root_cause"
-                if ":" in stripped:
-                    inline = stripped.split(":", 1)[1].strip()
-                    inline = _strip_md_markers(inline)
-                    if inline:
-                        section_lines["root_cause"].append(inline)
-            elif "recommendation" in lower and is_header:
-                current_section = "recommendations"
+                        section_lines[keyword].append(inline)
             elif current_section == "recommendations":
-                if (
-                    stripped.startswith("-")
-                    or stripped.startswith("•")
-                    or stripped.startswith("*")
-                    or (stripped and stripped[0].isdigit())
-                ):
-                    clean = re.sub(r"^[-•*\d.)\s]+", "", stripped).strip()
-                    clean = _strip_md_markers(clean)
+                if stripped[0] in _BULLET_STARTS:
+                    clean = _strip_md_markers(stripped.lstrip(_BULLET_STRIP))
                     if clean:
                         result["recommendations"].append(clean)
-            elif current_section in ("assessment", "root_cause"):
-                if not any(x in lower for x in ("assessment", "root cause", "recommendation")):
-                    section_lines[current_section].append(_strip_md_markers(stripped))
+            elif current_section in ("assessment", "root_cause") and keyword is None:
+                section_lines[current_section].append(_strip_md_markers(stripped))
 
         result["assessment"] = " ".join(section_lines["assessment"]).strip()
         result["root_cause"] = " ".join(section_lines["root_cause"]).strip()
 
         if not result["assessment"]:
             # Fallback: strip ## headers then use first 300 chars
-            clean_response = re.sub(r"^#+\s+.*$", "", response, flags=re.MULTILINE).strip()
-            result["assessment"] = clean_response[:300]
+            clean_response = _MD_HEADER_LINE_RE.sub("", response).strip()
+            result["assessment"] = _truncate_words(clean_response, 300)
         return result
 
     @staticmethod
@@ -287,37 +540,74 @@ Be concise and practical. Focus on the highest-impact metrics."""
 # ── Mistral (primary) ────────────────────────────────────────────────────────
 
 
-class MistralProvider(AIProvider):
+class MistralProvider(_ProviderBase):
     """Mistral AI provider (primary)."""
 
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or os.getenv("MISTRAL_API_KEY")
         self.model = "mistral-large-latest"
+        self._client = None
 
     _PLACEHOLDERS = {"your_mistral_api_key_here", "your_api_key_here", "", "placeholder", "changeme"}
 
-    def is_available(self) -> bool:
+    @cached_property
+    def _available(self) -> bool:
         return bool(self.api_key) and self.api_key.strip().lower() not in self._PLACEHOLDERS
 
+    def is_available(self) -> bool:
+        return self._available
+
+    def _get_client(self):
+        """Return the Mistral client, constructing it on first use."""
+        if self._client is None:
+            from mistralai import Mistral
+
+            self._http_client = _pooled_http_client()
+            self._client = Mistral(api_key=self.api_key, client=self._http_client)
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._client is not None:
+            self._http_client.close()
+            self._client = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # interpreter shutdown or partially-initialised instance
+            pass
+
+    def _complete(self, system: str, prompt: str, max_tokens: int) -> str:
+        response = self._get_client().chat.complete(
+            model=self.model,
+            messages=_chat_messages(system, prompt),
+            temperature=0.3,
+            max_tokens=max_tokens,
+        )
+        return response.choices[0].message.content or ""
+
     def analyze_error(self, error_message: str, config_snippet: str, context: dict) -> dict:
         if not self.is_available():
             return {"error": "Mistral API key not configured"}
+        cache_key = self._error_cache_key(error_message, config_snippet, context)
+        hit = self._cached_error_result(cache_key, error_message, config_snippet, context)
+        if hit is not None:
+            return hit
         try:
-            from mistralai import Mistral
-
-            client = Mistral(api_key=self.api_key)
+            client = self._get_client()
             prompt = self._build_error_prompt(error_message, config_snippet, context)
-            response = client.chat.complete(
+            stream = client.chat.stream(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a Docker and Kubernetes expert. Provide concise, actionable advice."},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=_chat_messages(ERROR_SYSTEM_PROMPT, prompt),
                 temperature=0.3,
                 max_tokens=500,
+                stop=_ERROR_STOP_SEQUENCES,
             )
-            text = response.choices[0].message.content or ""
-            return self._parse_error_response(text)
+            text = _read_error_stream(stream, lambda event: event.data.choices[0].delta.content)
+            result = self._parse_error_response(text)
+            self._remember_error_result(cache_key, error_message, config_snippet, context, result)
+            return result
         except ImportError:
             return {"error": "Mistral package not installed. Run: pip install mistralai"}
         except Exception as e:
@@ -327,19 +617,11 @@ class MistralProvider(AIProvider):
         if not self.is_available():
             return {"error": "Mistral API key not configured"}
         try:
-            from mistralai import Mistral
-
-            client = Mistral(api_key=self.api_key)
+            client = self._get_client()
             prompt = self._build_pod_health_prompt(prediction)
             response = client.chat.complete(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": (
-                        "You are a DevOps SRE expert specialising in Docker and Kubernetes "
-                        "reliability. Provide concise, actionable pod health assessments."
-                    )},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=_chat_messages(POD_HEALTH_SYSTEM_PROMPT, prompt),
                 temperature=0.3,
                 max_tokens=700,
             )
@@ -354,15 +636,10 @@ class MistralProvider(AIProvider):
         if not self.is_available():
             raise RuntimeError("Mistral API key not configured")
         try:
-            from mistralai import Mistral
-
-            client = Mistral(api_key=self.api_key)
+            client = self._get_client()
             response = client.chat.complete(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": PLAYGROUND_SYSTEM_PROMPT},
-                    {"role": "user", "content": _build_user_message(content, filename)},
-                ],
+                messages=_chat_messages(PLAYGROUND_SYSTEM_PROMPT, _build_user_message(content, filename)),
                 temperature=0.1,
                 max_tokens=4096,
             )
@@ -380,37 +657,74 @@ class MistralProvider(AIProvider):
 # ── Groq (fallback) ──────────────────────────────────────────────────────────
 
 
-class GroqProvider(AIProvider):
+class GroqProvider(_ProviderBase):
     """Groq AI provider (fast, free fallback)."""
 
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         self.model = "llama-3.3-70b-versatile"
+        self._client = None
 
     _PLACEHOLDERS = {"your_groq_api_key_here", "your_api_key_here", "", "placeholder", "changeme"}
 
-    def is_available(self) -> bool:
+    @cached_property
+    def _available(self) -> bool:
         return bool(self.api_key) and self.api_key.strip().lower() not in self._PLACEHOLDERS
 
+    def is_available(self) -> bool:
+        return self._available
+
+    def _get_client(self):
+        """Return the Groq client, constructing it on first use."""
+        if self._client is None:
+            from groq import Groq
+
+            self._client = Groq(api_key=self.api_key, http_client=_pooled_http_client())
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # interpreter shutdown or partially-initialised instance
+            pass
+
+    def _complete(self, system: str, prompt: str, max_tokens: int) -> str:
+        response = self._get_client().chat.completions.create(
+            model=self.model,
+            messages=_chat_messages(system, prompt),
+            temperature=0.3,
+            max_tokens=max_tokens,
+        )
+        return response.choices[0].message.content or ""
+
     def analyze_error(self, error_message: str, config_snippet: str, context: dict) -> dict:
         if not self.is_available():
             return {"error": "Groq API key not configured"}
+        cache_key = self._error_cache_key(error_message, config_snippet, context)
+        hit = self._cached_error_result(cache_key, error_message, config_snippet, context)
+        if hit is not None:
+            return hit
         try:
-            from groq import Groq
-
-            client = Groq(api_key=self.api_key)
+            client = self._get_client()
             prompt = self._build_error_prompt(error_message, config_snippet, context)
-            response = client.chat.completions.create(
+            stream = client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a Docker and Kubernetes expert. Provide concise, actionable advice."},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=_chat_messages(ERROR_SYSTEM_PROMPT, prompt),
                 temperature=0.3,
                 max_tokens=500,
+                stop=_ERROR_STOP_SEQUENCES,
+                stream=True,
             )
-            text = response.choices[0].message.content or ""
-            return self._parse_error_response(text)
+            text = _read_error_stream(stream, lambda chunk: chunk.choices[0].delta.content)
+            result = self._parse_error_response(text)
+            self._remember_error_result(cache_key, error_message, config_snippet, context, result)
+            return result
         except ImportError:
             return {"error": "Groq package not installed. Run: pip install groq"}
         except Exception as e:
@@ -420,19 +734,11 @@ class GroqProvider(AIProvider):
         if not self.is_available():
             return {"error": "Groq API key not configured"}
         try:
-            from groq import Groq
-
-            client = Groq(api_key=self.api_key)
+            client = self._get_client()
             prompt = self._build_pod_health_prompt(prediction)
             response = client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": (
-                        "You are a DevOps SRE expert specialising in Docker and Kubernetes "
-                        "reliability. Provide concise, actionable pod health assessments."
-                    )},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=_chat_messages(POD_HEALTH_SYSTEM_PROMPT, prompt),
                 temperature=0.3,
                 max_tokens=700,
             )
@@ -447,15 +753,10 @@ class GroqProvider(AIProvider):
         if not self.is_available():
             raise RuntimeError("Groq API key not configured")
         try:
-            from groq import Groq
-
-            client = Groq(api_key=self.api_key)
+            client = self._get_client()
             response = client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": PLAYGROUND_SYSTEM_PROMPT},
-                    {"role": "user", "content": _build_user_message(content, filename)},
-                ],
+                messages=_chat_messages(PLAYGROUND_SYSTEM_PROMPT, _build_user_message(content, filename)),
                 temperature=0.1,
                 max_tokens=4096,
             )
@@ -474,7 +775,12 @@ class GroqProvider(AIProvider):
 
 
 def get_ai_provider(config=None) -> Optional[AIProvider]:
-    """Get the best available AI provider (Mistral first, Groq fallback)."""
+    """Get the best available AI provider (Mistral first, Groq fallback).
+
+    The resolved provider is memoised per (preferred provider, API key), so
+    repeated calls within a process reuse one instance and its HTTP client.
+    When no key is set at all, None is returned without building anything.
+    """
     if config is None:
         from ..config import get_config
         config = get_config()
@@ -482,7 +788,14 @@ def get_ai_provider(config=None) -> Optional[AIProvider]:
     # Respect user preference from config if set
     preferred = getattr(getattr(config, "ai", None), "provider", "mistral")
     api_key = getattr(getattr(config, "ai", None), "api_key", None)
+    # Nothing configured anywhere: skip provider construction entirely.
+    if not (api_key or os.getenv("MISTRAL_API_KEY") or os.getenv("GROQ_API_KEY")):
+        return None
+    return _resolve_provider(preferred, api_key)
+
 
+@lru_cache(maxsize=4)
+def _resolve_provider(preferred: str, api_key: Optional[str]) -> Optional[AIProvider]:
     # config.ai.api_key is the key **for the preferred provider only**.
     # The fallback provider always reads its key from the environment so
     # that a single config.ai.api_key value is never passed to the wrong SDK.
@@ -13,9 +13,11 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from ...auth.dependencies import get_optional_user
+from ...config import load_yaml
 from ...db.dynamodb import save_history
 from ...models import (
     AnalysisResult,
+    Severity,
     PlaygroundHighlight,
     PlaygroundIssue,
     PlaygroundResult,
@@ -33,6 +35,14 @@ class AnalyzeRequest(BaseModel):
         None,
         description="Optional filename hint (e.g. 'docker-compose.yml', 'deployment.yaml')",
     )
+    include_fixes: bool = Field(
+        True,
+        description="Set to false to get only the issues, skipping fix generation (and AI)",
+    )
+    min_severity: Optional[Severity] = Field(
+        None,
+        description="Only report issues at this severity or worse (e.g. 'critical')",
+    )
 
 
 # ── History helpers ────────────────────────────────────────────────────────────
@@ -100,7 +110,12 @@ async def analyze_docker_compose_endpoint(
 
         from ...services.analysis import analyze_docker_compose
 
-        result = analyze_docker_compose(Path(tmp.name), use_ai=True)
+        result = analyze_docker_compose(
+            Path(tmp.name),
+            use_ai=True,
+            include_fixes=request.include_fixes,
+            min_severity=request.min_severity,
+        )
 
         if current_user:
             hist = _analysis_result_to_history_data(result)
@@ -150,7 +165,11 @@ async def analyze_kubernetes_endpoint(
 
         from ...services.analysis import analyze_kubernetes
 
-        result = analyze_kubernetes(tmp.name)
+        result = analyze_kubernetes(
+            tmp.name,
+            include_fixes=request.include_fixes,
+            min_severity=request.min_severity,
+        )
 
         if current_user:
             hist = _analysis_result_to_history_data(result)
@@ -216,7 +235,7 @@ def _run_rule_based(content: str, filename: str | None) -> list[PlaygroundIssue]
     config_type = _detect_config_type(content, filename)
 
     try:
-        parsed = yaml.safe_load(content)
+        parsed = load_yaml(content)
     except yaml.YAMLError as exc:
         mark = getattr(exc, "problem_mark", None)
         issues.append(PlaygroundIssue(
@@ -594,15 +613,13 @@ def _status_from_score(score: int | float) -> str:
 def _summary_from_rules(issues: list[PlaygroundIssue]) -> str:
     if not issues:
         return "No issues detected by rule-based analysis. Config looks clean."
-    crit = sum(1 for i in issues if i.severity == "critical")
-    high = sum(1 for i in issues if i.severity == "high")
-    med = sum(1 for i in issues if i.severity == "medium")
-    low = sum(1 for i in issues if i.severity == "low")
-    parts = []
-    if crit: parts.append(f"{crit} critical")
-    if high: parts.append(f"{high} high")
-    if med:  parts.append(f"{med} medium")
-    if low:  parts.append(f"{low} low")
+    # One pass over the issues instead of one per severity level
+    counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+    for i in issues:
+        sev = getattr(i.severity, "value", i.severity)
+        if sev in counts:
+            counts[sev] += 1
+    parts = [f"{n} {sev}" for sev, n in counts.items() if n]
     total = len(issues)
     return f"Rule-based analysis found {total} issue{'s' if total != 1 else ''} ({', '.join(parts)})."
 
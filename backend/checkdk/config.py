@@ -1,11 +1,60 @@
 """Configuration management for checkDK."""
 
+import json
 import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import yaml
 from pydantic import BaseModel, Field
 
+try:  # optional speed-up for the JSON sidecar; stdlib json is equivalent
+    import orjson
+except ImportError:  # pragma: no cover - depends on the install
+    orjson = None
+
+# libyaml-backed loader when PyYAML was built with it; the pure-Python
+# SafeLoader is several times slower on large compose / manifest files.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def load_yaml(stream):
+    """``yaml.safe_load`` equivalent that uses the C loader when available."""
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def load_yaml_all(stream):
+    """``yaml.safe_load_all`` equivalent that uses the C loader when available."""
+    return yaml.load_all(stream, Loader=YAML_LOADER)
+
+
+def dump_yaml(data, stream=None, **kwargs):
+    """``yaml.safe_dump`` equivalent that uses the C emitter when available."""
+    return yaml.dump(data, stream, Dumper=YAML_DUMPER, **kwargs)
+
+
+def _sidecar_path(config_path: Path) -> Path:
+    return config_path.with_name(config_path.name + ".json")
+
+
+def _read_sidecar(path: Path) -> dict:
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _write_sidecar(path: Path, data: dict) -> None:
+    """Atomically write the JSON copy of a parsed config (best effort)."""
+    raw = orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8')
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
 
 class AIConfig(BaseModel):
     """AI provider configuration."""
@@ -14,6 +63,7 @@ class AIConfig(BaseModel):
     api_key: Optional[str] = None
     enabled: bool = True
     fallback_provider: Optional[str] = "groq"
+    semantic_cache: bool = False  # opt-in; needs fastembed and a downloaded model
 
 
 class CheckDKConfig(BaseModel):
@@ -29,12 +79,24 @@ class CheckDKConfig(BaseModel):
         if config_path is None:
             config_path = Path.home() / ".checkdk" / "config.yaml"
         
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f) or {}
-                return cls(**data)
-        
-        return cls()
+        try:
+            yaml_mtime = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return cls()
+
+        # Parsed copy of the YAML, refreshed whenever the YAML is newer.
+        sidecar = _sidecar_path(config_path)
+        try:
+            if sidecar.stat().st_mtime_ns >= yaml_mtime:
+                return cls(**_read_sidecar(sidecar))
+        except (OSError, ValueError, TypeError):  # missing, unreadable or stale schema
+            pass
+
+        with open(config_path, 'r') as f:
+            data = load_yaml(f) or {}
+        config = cls(**data)
+        _write_sidecar(sidecar, config.model_dump())
+        return config
     
     def save(self, config_path: Optional[Path] = None):
         """Save configuration to file."""
@@ -43,10 +105,19 @@ class CheckDKConfig(BaseModel):
         
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
+        data = self.model_dump()
         with open(config_path, 'w') as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False)
+            dump_yaml(data, f, default_flow_style=False)
+        # Written after the YAML, so the next load() takes the fast path.
+        _write_sidecar(_sidecar_path(config_path), data)
+        get_config.cache_clear()
 
 
+@lru_cache(maxsize=1)
 def get_config() -> CheckDKConfig:
-    """Get the current configuration."""
+    """Get the current configuration (loaded once per process).
+
+    :meth:`CheckDKConfig.save` clears this cache; call
+    ``get_config.cache_clear()`` after editing the file by other means.
+    """
     return CheckDKConfig.load()
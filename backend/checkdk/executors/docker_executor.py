@@ -2,12 +2,18 @@
 
 import subprocess
 import sys
+from functools import cache
 from typing import List
-from rich.console import Console
 
 from ..models import AnalysisResult
 
-console = Console()
+
+@cache
+def _get_console():
+    """Build the rich Console on first use; importing rich is not free."""
+    from rich.console import Console
+
+    return Console()
 
 
 class DockerExecutor:
@@ -21,20 +27,20 @@ class DockerExecutor:
         
         # If critical errors and not forced, block execution
         if analysis_result.has_critical_errors() and not force:
-            console.print("\n[bold red]✗ Execution blocked due to critical issues.[/]")
-            console.print("[yellow]Fix the issues above or use --force to execute anyway.[/]")
+            _get_console().print("\n[bold red]✗ Execution blocked due to critical issues.[/]")
+            _get_console().print("[yellow]Fix the issues above or use --force to execute anyway.[/]")
             return 1
         
         # If warnings, prompt user
         if analysis_result.has_warnings() and not force:
-            console.print("\n[yellow]⚠ Warnings detected. Proceed with execution?[/]")
-            response = console.input("[bold]Continue? (y/N): [/]").strip().lower()
+            _get_console().print("\n[yellow]⚠ Warnings detected. Proceed with execution?[/]")
+            response = _get_console().input("[bold]Continue? (y/N): [/]").strip().lower()
             if response not in ['y', 'yes']:
-                console.print("[yellow]Execution cancelled.[/]")
+                _get_console().print("[yellow]Execution cancelled.[/]")
                 return 0
         
         # Execute the command
-        console.print(f"\n[bold green]→ Executing:[/] [cyan]{' '.join(self.original_command)}[/]\n")
+        _get_console().print(f"\n[bold green]→ Executing:[/] [cyan]{' '.join(self.original_command)}[/]\n")
         
         try:
             result = subprocess.run(
@@ -45,9 +51,9 @@ class DockerExecutor:
             )
             return result.returncode
         except FileNotFoundError:
-            console.print(f"[bold red]Error:[/] Command not found: {self.original_command[0]}")
-            console.print("[yellow]Make sure Docker is installed and in your PATH.[/]")
+            _get_console().print(f"[bold red]Error:[/] Command not found: {self.original_command[0]}")
+            _get_console().print("[yellow]Make sure Docker is installed and in your PATH.[/]")
             return 127
         except Exception as e:
-            console.print(f"[bold red]Error executing command:[/] {str(e)}")
+            _get_console().print(f"[bold red]Error executing command:[/] {str(e)}")
             return 1
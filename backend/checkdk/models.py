@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 class Severity(str, Enum):
@@ -29,7 +29,12 @@ class IssueType(str, Enum):
 
 
 class Issue(BaseModel):
-    """Represents a detected issue."""
+    """Represents a detected issue.
+
+    A pydantic model because it is part of the API schema, so it keeps a
+    per-instance ``__dict__`` (pydantic models cannot be slotted); bulk
+    producers should build it with :meth:`fast`.
+    """
     type: IssueType
     severity: Severity
     message: str
@@ -38,6 +43,15 @@ class Issue(BaseModel):
     service_name: Optional[str] = None
     details: Dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def fast(cls, **data: Any) -> "Issue":
+        """Build an Issue without validation, for trusted already-typed values.
+
+        Validators emit thousands of these on large manifests; anything built
+        from external input (YAML, API payloads) should go through ``Issue()``.
+        """
+        return cls.model_construct(**data)
+
 
 class Fix(BaseModel):
     """Represents a suggested fix."""
@@ -49,21 +63,59 @@ class Fix(BaseModel):
     explanation: Optional[str] = None
     root_cause: Optional[str] = None
 
+    @classmethod
+    def fast(cls, **data: Any) -> "Fix":
+        """Build a Fix without validation; see :meth:`Issue.fast`."""
+        return cls.model_construct(**data)
+
 
 class AnalysisResult(BaseModel):
-    """Result of configuration analysis."""
+    """Result of configuration analysis.
+
+    ``fixes`` is parallel to ``issues``: ``fixes[i]`` is the fix for
+    ``issues[i]``.  Results that carry no fixes (parse failures) leave it empty.
+    """
     success: bool
     issues: List[Issue] = Field(default_factory=list)
     fixes: List[Fix] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
-    
+
+    # Per-severity counts, computed once after validation.  ``_counted`` is
+    # the (list, length) they were taken from, so appending to or replacing
+    # ``issues`` is noticed; call :meth:`invalidate` after in-place edits.
+    _severity_counts: Dict[Severity, int] = PrivateAttr(default_factory=dict)
+    _counted: tuple = PrivateAttr(default=(None, -1))
+
+    @model_validator(mode="after")
+    def _count_severities(self) -> "AnalysisResult":
+        counts = dict.fromkeys(Severity, 0)
+        for issue in self.issues:
+            counts[issue.severity] += 1
+        self._severity_counts = counts
+        self._counted = (self.issues, len(self.issues))
+        return self
+
+    def invalidate(self) -> None:
+        """Recompute the severity counts after editing ``issues`` in place."""
+        self._count_severities()
+
+    def _count(self, severity: Severity) -> int:
+        counted_list, counted_len = self._counted
+        if counted_list is not self.issues or counted_len != len(self.issues):
+            self._count_severities()
+        return self._severity_counts[severity]
+
+    def fix_for(self, index: int) -> Optional[Fix]:
+        """Return the fix for ``issues[index]``, or None when there is none."""
+        return self.fixes[index] if 0 <= index < len(self.fixes) else None
+
     def has_critical_errors(self) -> bool:
         """Check if there are any critical issues."""
-        return any(issue.severity == Severity.CRITICAL for issue in self.issues)
-    
+        return self._count(Severity.CRITICAL) > 0
+
     def has_warnings(self) -> bool:
         """Check if there are any warnings."""
-        return any(issue.severity == Severity.WARNING for issue in self.issues) or bool(self.warnings)
+        return self._count(Severity.WARNING) > 0 or bool(self.warnings)
 
 
 class DockerComposeConfig(BaseModel):
@@ -74,6 +126,11 @@ class DockerComposeConfig(BaseModel):
     volumes: Dict[str, Any] = Field(default_factory=dict)
     raw_config: Dict[str, Any] = Field(default_factory=dict)
 
+    @property
+    def services_empty(self) -> bool:
+        """True when no services are defined (nothing for validators to check)."""
+        return not self.services
+
 
 # --------------- Playground (LLM audit) models ---------------
 
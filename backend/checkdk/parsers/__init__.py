@@ -1,6 +1,6 @@
 """Configuration parsers for Docker and Kubernetes."""
 
 from .docker_compose import DockerComposeParser
-from .kubernetes_parser import KubernetesParser
+from .kubernetes_parser import KubernetesParser, KubernetesResources
 
-__all__ = ["DockerComposeParser", "KubernetesParser"]
+__all__ = ["DockerComposeParser", "KubernetesParser", "KubernetesResources"]
@@ -2,14 +2,32 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import yaml
-from rich.console import Console
 
+from ..config import load_yaml
 from ..models import DockerComposeConfig, Issue, IssueType, Severity
 
-console = Console()
+
+# ``${VAR}`` / ``${VAR:-default}``, anywhere inside a string
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+
+@lru_cache(maxsize=32)
+def _load_compose_yaml(raw: bytes) -> Tuple[Any, bool]:
+    """Load compose file bytes, memoised on the content itself.
+
+    Keyed on content rather than ``(path, mtime)``: a file rewritten within
+    the filesystem's timestamp granularity would otherwise parse stale.
+    Returns the document and whether the text contains ``${`` at all —
+    a single bytes scan that lets files without references skip the
+    resolution walk.  The cached document is the one *before* ``${VAR}``
+    resolution, so the environment is still consulted on every parse.
+    Callers must not mutate it.
+    """
+    return load_yaml(raw), b'${' in raw  # libyaml decodes the bytes itself
 
 
 class DockerComposeParser:
@@ -19,10 +37,26 @@ class DockerComposeParser:
         self.file_path = Path(file_path)
         self.config: Optional[DockerComposeConfig] = None
         self.issues: list[Issue] = []
+        # Plain-dict copy of os.environ, taken on the first ${VAR} of a parse
+        self._env: Optional[Dict[str, str]] = None
+        # Unset variables already reported in this parse (one issue each)
+        self._missing_vars: set[str] = set()
+        # Compose YAML given in memory (see from_string); None means read the file
+        self._text: Optional[str] = None
+    
+    @classmethod
+    def from_string(cls, text: str, file_path: str = "<string>") -> "DockerComposeParser":
+        """Create a parser for compose YAML already in memory.
+
+        *file_path* only labels the issues; nothing is read from disk.
+        """
+        parser = cls(file_path)
+        parser._text = text
+        return parser
     
     def parse(self) -> DockerComposeConfig:
         """Parse the Docker Compose file."""
-        if not self.file_path.exists():
+        if self._text is None and not self.file_path.exists():
             self.issues.append(Issue(
                 type=IssueType.INVALID_YAML,
                 severity=Severity.CRITICAL,
@@ -32,8 +66,10 @@ class DockerComposeParser:
             return DockerComposeConfig()
         
         try:
-            with open(self.file_path, 'r') as f:
-                raw_config = yaml.safe_load(f)
+            if self._text is not None:
+                raw_config, has_env_refs = load_yaml(self._text), '${' in self._text
+            else:
+                raw_config, has_env_refs = _load_compose_yaml(self.file_path.read_bytes())
             
             if not isinstance(raw_config, dict):
                 self.issues.append(Issue(
@@ -44,8 +80,10 @@ class DockerComposeParser:
                 ))
                 return DockerComposeConfig()
             
-            # Resolve environment variables
-            resolved_config = self._resolve_env_vars(raw_config)
+            # Resolve environment variables against this run's environment
+            self._env = None
+            self._missing_vars = set()
+            resolved_config = self._resolve_env_vars(raw_config) if has_env_refs else raw_config
             
             # Extract components
             version = resolved_config.get('version')
@@ -83,33 +121,64 @@ class DockerComposeParser:
             ))
             return DockerComposeConfig()
     
-    def _resolve_env_vars(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Resolve environment variables in the configuration."""
+    def _resolve_env_vars(self, config: Any) -> Any:
+        """Resolve environment variables in the configuration.
+
+        Copy-on-write: a dict or list with nothing to substitute is returned
+        as-is, so untouched subtrees stay shared with the cached document
+        (which is never mutated), and only containers are recursed into —
+        scalar leaves cost no call frame.
+        """
+        if isinstance(config, str):
+            return self._resolve_str(config) if '${' in config else config
         if isinstance(config, dict):
-            return {k: self._resolve_env_vars(v) for k, v in config.items()}
+            items = config.items()
         elif isinstance(config, list):
-            return [self._resolve_env_vars(item) for item in config]
-        elif isinstance(config, str):
-            # Resolve all ${VAR} and ${VAR:-default} occurrences (inline too)
-            def _replace(m: re.Match) -> str:
-                expr = m.group(1)
-                if ':-' in expr:
-                    var_name, default_value = expr.split(':-', 1)
-                else:
-                    var_name, default_value = expr, None
-                value = os.getenv(var_name, default_value)
-                if value is None:
-                    self.issues.append(Issue(
-                        type=IssueType.MISSING_ENV_VAR,
-                        severity=Severity.WARNING,
-                        message=f"Environment variable not set: {var_name}",
-                        details={"variable": var_name}
-                    ))
-                    return m.group(0)  # keep original placeholder
-                return value
+            items = enumerate(config)
+        else:
+            return config
+
+        copy = None
+        for key, value in items:
+            if isinstance(value, str):
+                if '${' not in value:
+                    continue
+                new = self._resolve_str(value)
+            elif isinstance(value, (dict, list)):
+                new = self._resolve_env_vars(value)
+            else:
+                continue
+            if new is not value:
+                if copy is None:
+                    copy = config.copy()
+                copy[key] = new
+        return config if copy is None else copy
+
+    def _resolve_str(self, value: str) -> str:
+        """Resolve all ${VAR} and ${VAR:-default} occurrences (inline too)."""
+        if self._env is None:
+            # os.environ encodes/decodes on every lookup; a dict does not
+            self._env = dict(os.environ)
+        env = self._env
+        missing = self._missing_vars
+
+        def _replace(m: re.Match) -> str:
+            var_name, sep, default_value = m.group(1).partition(':-')
+            value = env.get(var_name, default_value if sep else None)
+            if value is None:
+                if var_name in missing:
+                    return m.group(0)
+                missing.add(var_name)
+                self.issues.append(Issue(
+                    type=IssueType.MISSING_ENV_VAR,
+                    severity=Severity.WARNING,
+                    message=f"Environment variable not set: {var_name}",
+                    details={"variable": var_name}
+                ))
+                return m.group(0)  # keep original placeholder
+            return value
 
-            return re.sub(r'\$\{([^}]+)\}', _replace, config)
-        return config
+        return _ENV_VAR_RE.sub(_replace, value)
     
     def _validate_structure(self):
         """Validate the basic structure of the Docker Compose file."""
@@ -117,7 +186,7 @@ class DockerComposeParser:
             return
         
         # Check if services are defined
-        if not self.config.services:
+        if self.config.services_empty:
             self.issues.append(Issue(
                 type=IssueType.INVALID_YAML,
                 severity=Severity.CRITICAL,
@@ -160,16 +229,19 @@ class DockerComposeParser:
         service = self.config.services[service_name]
         ports = service.get('ports', [])
         
-        # Normalize port formats
-        normalized_ports = []
+        # Normalize port formats.  YAML only produces plain str/dict, so exact
+        # type checks are safe; short syntax is the common case, tested first.
+        normalized_ports: list[str] = []
+        append = normalized_ports.append
         for port in ports:
-            if isinstance(port, str):
-                normalized_ports.append(port)
-            elif isinstance(port, dict):
+            kind = type(port)
+            if kind is str:
+                append(port)
+            elif kind is dict:
                 # Handle long syntax
                 target = port.get('target')
                 published = port.get('published', target)
                 if published:
-                    normalized_ports.append(f"{published}:{target}")
+                    append(f"{published}:{target}")
         
         return normalized_ports
@@ -1,7 +1,106 @@
 """Kubernetes YAML parser."""
-import yaml
+from functools import cached_property, lru_cache
+from heapq import merge
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Set, Tuple
+
+from ..config import load_yaml_all
+
+
+# Larger manifests are streamed from the file and not memoised: keeping a
+# whole copy in memory (and up to 32 of them in the cache) costs more than
+# the occasional re-parse saves.
+_MAX_CACHED_BYTES = 1 << 20
+
+
+@lru_cache(maxsize=32)
+def _parse_documents(content: bytes) -> Tuple[Dict[str, Any], ...]:
+    """Parse every non-empty document in *content*, memoised on the raw bytes.
+
+    Keyed on content rather than path: the API writes each request to a fresh
+    temp file, so the same manifest analysed twice never shares a path.  The
+    returned resources are shared between calls and must not be mutated.
+    """
+    return tuple(doc for doc in load_yaml_all(content) if doc)
+
+
+_KindIndex = Dict[Any, List[Tuple[int, Dict[str, Any]]]]
+
+
+def _index_resource(index: _KindIndex, namespaces: Set[str], position: int, resource: Any) -> None:
+    """Record *resource* (at *position*) in the kind index and namespace set."""
+    if not isinstance(resource, dict):
+        return
+    index.setdefault(resource.get('kind'), []).append((position, resource))
+    metadata = resource.get('metadata')
+    if isinstance(metadata, dict):
+        ns = metadata.get('namespace')
+        if ns:
+            namespaces.add(ns)
+
+
+class KubernetesResources(list):
+    """Parsed resources that also know how to find a ``kind`` without a scan.
+
+    A plain list of resource dicts (what :meth:`KubernetesParser.parse` has
+    always returned) plus a kind index and the set of namespaces.  Built via
+    :meth:`from_documents` both are filled in while the list is; otherwise
+    they are built in one pass on first use.  Neither is updated if the list
+    is modified afterwards.
+    """
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Any]) -> "KubernetesResources":
+        """Collect the non-empty *documents*, indexing each as it arrives.
+
+        One pass over a document stream: no intermediate list, and no second
+        walk to build the index the validators always ask for.
+        """
+        resources = cls()
+        append = resources.append
+        index: _KindIndex = {}
+        namespaces: Set[str] = set()
+        for doc in documents:
+            if not doc:
+                continue
+            _index_resource(index, namespaces, len(resources), doc)
+            append(doc)
+        resources.__dict__['_summary'] = (index, frozenset(namespaces))
+        return resources
+
+    @cached_property
+    def _summary(self) -> Tuple[_KindIndex, frozenset]:
+        index: _KindIndex = {}
+        namespaces: Set[str] = set()
+        for position, resource in enumerate(self):
+            _index_resource(index, namespaces, position, resource)
+        return index, frozenset(namespaces)
+
+    @property
+    def namespaces(self) -> frozenset:
+        """Every ``metadata.namespace`` set on a resource."""
+        return self._summary[1]
+
+    def has_kind(self, *kinds: str) -> bool:
+        """True if any resource has one of *kinds*."""
+        index = self._summary[0]
+        return any(kind in index for kind in kinds)
+
+    def of_kind(self, *kinds: str) -> List[Dict[str, Any]]:
+        """Resources whose ``kind`` is one of *kinds*, in document order."""
+        index = self._summary[0]
+        groups = [index.get(kind, ()) for kind in kinds]
+        if len(groups) == 1:
+            return [resource for _, resource in groups[0]]
+        return [resource for _, resource in merge(*groups, key=lambda pair: pair[0])]
+
+
+def resources_of_kind(resources: List[Dict[str, Any]], *kinds: str) -> List[Dict[str, Any]]:
+    """Filter *resources* by kind — an index lookup for parser output."""
+    if isinstance(resources, KubernetesResources):
+        return resources.of_kind(*kinds)
+    wanted = frozenset(kinds)
+    return [r for r in resources if r.get('kind') in wanted]
 
 
 class KubernetesParser:
@@ -16,42 +115,40 @@ class KubernetesParser:
             file_path: Path to k8s YAML file
             
         Returns:
-            List of Kubernetes resources
+            List of Kubernetes resources (a :class:`KubernetesResources`)
         """
         path = Path(file_path)
         
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(path, 'r') as f:
-            content = f.read()
-        
-        # Parse YAML documents (multiple resources in one file)
-        resources = []
-        for doc in yaml.safe_load_all(content):
-            if doc:  # Skip empty documents
-                resources.append(doc)
-        
-        return resources
+        # Parse YAML documents (multiple resources in one file).  Raw bytes
+        # either way: libyaml detects the encoding itself, no str decode.
+        if path.stat().st_size > _MAX_CACHED_BYTES:
+            with open(path, 'rb') as f:
+                return KubernetesResources.from_documents(load_yaml_all(f))
+        return KubernetesResources.from_documents(_parse_documents(path.read_bytes()))
     
     @staticmethod
     def get_services(resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract Service resources."""
-        return [r for r in resources if r.get('kind') == 'Service']
+        return resources_of_kind(resources, 'Service')
     
     @staticmethod
     def get_deployments(resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract Deployment resources."""
-        return [r for r in resources if r.get('kind') == 'Deployment']
+        return resources_of_kind(resources, 'Deployment')
     
     @staticmethod
     def get_pods(resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract Pod resources."""
-        return [r for r in resources if r.get('kind') == 'Pod']
+        return resources_of_kind(resources, 'Pod')
     
     @staticmethod
     def get_namespaces(resources: List[Dict[str, Any]]) -> List[str]:
         """Extract all namespaces used."""
+        if isinstance(resources, KubernetesResources):
+            return list(resources.namespaces)
         namespaces = set()
         for resource in resources:
             ns = resource.get('metadata', {}).get('namespace')
@@ -6,15 +6,156 @@ both the FastAPI routes and (optionally) other consumers.
 
 from __future__ import annotations
 
-import yaml
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Optional, Union
 
 from ..models import AnalysisResult, Issue, IssueType, Severity, Fix
-from ..parsers import DockerComposeParser
-from ..validators import PortValidator
-from ..config import get_config
-from ..ai import get_ai_provider
+
+# Parsers, validators, yaml and the AI layer are imported inside the analysis
+# functions so that importing this module (e.g. for the API's route table)
+# stays cheap.
+
+
+# ── AI helpers ────────────────────────────────────────────────────────────────
+
+def _analyze_errors(ai_provider, payloads: list[dict]) -> list:
+    """Run AI analysis for every payload, batching several into one request.
+
+    Each element of the returned list is the provider's result dict, or the
+    exception it raised.  A single payload takes the plain ``analyze_error``
+    path (streamed, with early stop).
+    """
+    if not payloads:
+        return []
+    try:
+        if len(payloads) == 1:
+            return [ai_provider.analyze_error(**payloads[0])]
+        return ai_provider.analyze_errors_batch([
+            (p["error_message"], p["config_snippet"], p["context"]) for p in payloads
+        ])
+    except Exception as exc:
+        return [exc] * len(payloads)
+
+
+def _resolve_ai_provider():
+    """Return the configured AI provider, or None when AI is off or unusable.
+
+    Only called once a critical issue needs it — clean files never import the
+    AI layer or read the config.
+    """
+    from ..ai import get_ai_provider
+    from ..config import get_config
+
+    try:
+        cfg = get_config()
+        if cfg.ai.enabled:
+            return get_ai_provider(cfg)
+    except Exception:
+        pass
+    return None
+
+
+# Compose issue types whose AI snippet is one section of the service, not all of it
+_SNIPPET_SECTIONS = {
+    IssueType.PORT_CONFLICT: "ports",
+    IssueType.SERVICE_DEPENDENCY: "depends_on",
+}
+
+
+def _bounded_snippet(value: Any, limit: int = 500) -> str:
+    """Compact JSON for *value*, cut to about *limit* characters, for AI prompts.
+
+    orjson (when installed) serialises in C, so a large service block costs
+    little even though most of it is thrown away; ``str(dict)`` walks and
+    reprs everything in Python first.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(value, default=str, separators=(",", ":"))[:limit]
+    return orjson.dumps(value, default=str)[:limit].decode("utf-8", "ignore")
+
+
+def _ai_fix(ai_result) -> Optional[Fix]:
+    """Convert a provider result into a Fix, or None if it is unusable."""
+    if not isinstance(ai_result, dict) or "error" in ai_result or not ai_result.get("fix_steps"):
+        return None
+    return Fix(
+        description=ai_result.get("explanation", "AI-generated fix"),
+        steps=ai_result.get("fix_steps", []),
+        auto_applicable=False,
+        explanation=ai_result.get("explanation", ""),
+        root_cause=ai_result.get("root_cause", ""),
+    )
+
+
+# ── Validators ────────────────────────────────────────────────────────────────
+
+@cache
+def _k8s_validators() -> tuple[tuple[Callable[[list], list[Issue]], frozenset], ...]:
+    """The Kubernetes resource validators and the kinds each inspects, resolved once."""
+    from ..validators.k8s_validator import KubernetesValidator
+
+    return tuple(
+        (getattr(KubernetesValidator, name), KubernetesValidator.TARGET_KINDS[name])
+        for name in (
+            "validate_services",
+            "validate_deployments",
+            "validate_security",
+            "validate_probes",
+            "validate_labels",
+        )
+    )
+
+
+def _dedupe_issues(issues: list[Issue]) -> list[Issue]:
+    """Drop repeats of the same ``(type, service_name, message)``, keeping order.
+
+    The parser and the validators can report the same problem (e.g. one unset
+    variable used in several places); each duplicate would otherwise cost an
+    AI round-trip and a line of output.
+    """
+    seen: set[tuple] = set()
+    unique: list[Issue] = []
+    for issue in issues:
+        key = (issue.type, issue.service_name, issue.message)
+        if key not in seen:
+            seen.add(key)
+            unique.append(issue)
+    return unique
+
+
+# Most severe first; an issue passes a ``min_severity`` filter when its rank
+# is at or below the threshold's.
+_SEVERITY_RANK = {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2}
+
+
+def _at_least(issues: list[Issue], min_severity: Optional[Severity]) -> list[Issue]:
+    """Keep the issues at *min_severity* or worse (all of them when None)."""
+    if min_severity is None or min_severity is Severity.INFO:
+        return issues
+    limit = _SEVERITY_RANK[min_severity]
+    return [issue for issue in issues if _SEVERITY_RANK[issue.severity] <= limit]
+
+
+def _run_validators(checks: list[tuple[Callable[[Any], list[Issue]], Any]]) -> list[Issue]:
+    """Run independent ``(validator, target)`` calls concurrently.
+
+    The port validator probes sockets, so overlapping it with the pure-Python
+    checks hides its latency.  Issues are returned in the order of *checks*
+    regardless of which finishes first.
+    """
+    if not checks:
+        return []
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(validate, target) for validate, target in checks]
+    issues: list[Issue] = []
+    for future in futures:
+        issues.extend(future.result())
+    return issues
 
 
 # ── Docker Compose ────────────────────────────────────────────────────────────
@@ -22,9 +163,18 @@ from ..ai import get_ai_provider
 def analyze_docker_compose(
     file_path: Union[str, Path],
     use_ai: bool = True,
+    include_fixes: bool = True,
+    min_severity: Optional[Severity] = None,
 ) -> AnalysisResult:
-    """Analyse a Docker Compose YAML file and return an AnalysisResult."""
+    """Analyse a Docker Compose YAML file and return an AnalysisResult.
+
+    With ``include_fixes=False`` only the issues are produced: no fix is
+    built and the AI provider is never consulted (it only supplies fixes).
+    ``min_severity`` drops less severe issues before any fix work is done.
+    """
 
+    from ..parsers import DockerComposeParser
+    from ..validators import PortValidator
     from ..validators.compose_validator import DockerComposeValidator
 
     parser = DockerComposeParser(str(file_path))
@@ -32,75 +182,65 @@ def analyze_docker_compose(
 
     all_issues = parser.issues.copy()
 
-    # Rule-based validators
-    for validator in [PortValidator()]:
-        all_issues.extend(validator.validate(config))
-
-    compose_dict = {
-        "services": config.services,
-        "volumes": config.volumes,
-        "networks": config.networks,
-    }
-    all_issues.extend(DockerComposeValidator.validate_images(compose_dict))
-    all_issues.extend(DockerComposeValidator.validate_environment_variables(compose_dict))
-    all_issues.extend(DockerComposeValidator.validate_dependencies(compose_dict))
-    all_issues.extend(DockerComposeValidator.validate_volumes(compose_dict))
-    all_issues.extend(DockerComposeValidator.validate_networks(compose_dict))
-    all_issues.extend(DockerComposeValidator.validate_resource_limits(compose_dict))
-
-    # AI provider (optional)
-    ai_provider = None
-    if use_ai:
-        try:
-            cfg = get_config()
-            if cfg.ai.enabled:
-                ai_provider = get_ai_provider(cfg)
-        except Exception:
-            pass
+    # Rule-based validators share the parser's env-resolved document.  With no
+    # services the parser has already said so and there is nothing to check.
+    if not config.services_empty:
+        compose_dict = config.raw_config
+        all_issues.extend(_run_validators([
+            (PortValidator().validate, config),
+            # All compose checks in one walk over the services
+            (DockerComposeValidator.validate_all, compose_dict),
+        ]))
+    all_issues = _at_least(_dedupe_issues(all_issues), min_severity)
 
-    fixes: list[Fix] = []
-    for issue in all_issues:
-        if issue.severity == Severity.CRITICAL and ai_provider:
-            try:
-                service_config = config.services.get(issue.service_name, {})
-                if issue.type == IssueType.PORT_CONFLICT:
-                    snippet = str(service_config.get("ports", []))
-                elif issue.type == IssueType.SERVICE_DEPENDENCY:
-                    snippet = str(service_config.get("depends_on", []))
-                else:
-                    snippet = str(service_config)[:500]
+    # AI provider (optional) — resolved only if some issue is critical
+    critical = [idx for idx, issue in enumerate(all_issues) if issue.severity is Severity.CRITICAL]
+    if not include_fixes:
+        return AnalysisResult(success=not critical, issues=all_issues)
+    ai_provider = _resolve_ai_provider() if use_ai and critical else None
 
-                ai_result = ai_provider.analyze_error(
-                    error_message=issue.message,
-                    config_snippet=snippet,
-                    context={
-                        "service_name": issue.service_name,
-                        "issue_type": issue.type.value,
-                        "platform": "docker-compose",
-                    },
-                )
-                if "error" not in ai_result and ai_result.get("fix_steps"):
-                    fixes.append(
-                        Fix(
-                            description=ai_result.get("explanation", "AI-generated fix"),
-                            steps=ai_result.get("fix_steps", []),
-                            auto_applicable=False,
-                            explanation=ai_result.get("explanation", ""),
-                            root_cause=ai_result.get("root_cause", ""),
-                        )
-                    )
+    ai_payloads: dict[int, dict] = {}
+    snippets: dict[tuple, str] = {}
+    if ai_provider:
+        for idx in critical:
+            issue = all_issues[idx]
+            # Several issues often point at the same service section; render
+            # each (service, section) snippet once.
+            section = _SNIPPET_SECTIONS.get(issue.type)
+            key = (issue.service_name, section)
+            if key not in snippets:
+                try:
+                    service_config = config.services.get(issue.service_name, {})
+                    relevant = service_config if section is None else service_config.get(section, [])
+                    snippets[key] = _bounded_snippet(relevant)
+                except Exception:
                     continue
-            except Exception:
-                pass
+            ai_payloads[idx] = {
+                "error_message": issue.message,
+                "config_snippet": snippets[key],
+                "context": {
+                    "service_name": issue.service_name,
+                    "issue_type": issue.type.value,
+                    "platform": "docker-compose",
+                },
+            }
+    ai_results = dict(zip(ai_payloads, _analyze_errors(ai_provider, list(ai_payloads.values()))))
+
+    fixes: list[Fix] = []
+    for idx, issue in enumerate(all_issues):
+        ai_fix = _ai_fix(ai_results.get(idx))
+        if ai_fix is not None:
+            fixes.append(ai_fix)
+            continue
 
         # Rule-based fallback
-        if issue.type == IssueType.PORT_CONFLICT:
+        if issue.type is IssueType.PORT_CONFLICT:
             fixes.append(PortValidator.generate_fix(issue))
         else:
             fixes.append(DockerComposeValidator.generate_fix(issue))
 
     return AnalysisResult(
-        success=not any(i.severity == Severity.CRITICAL for i in all_issues),
+        success=not critical,
         issues=all_issues,
         fixes=fixes,
     )
@@ -108,8 +248,18 @@ def analyze_docker_compose(
 
 # ── Kubernetes ────────────────────────────────────────────────────────────────
 
-def analyze_kubernetes(file_path: Union[str, Path]) -> AnalysisResult:
-    """Analyse a Kubernetes manifest YAML file and return an AnalysisResult."""
+def analyze_kubernetes(
+    file_path: Union[str, Path],
+    include_fixes: bool = True,
+    min_severity: Optional[Severity] = None,
+) -> AnalysisResult:
+    """Analyse a Kubernetes manifest YAML file and return an AnalysisResult.
+
+    ``include_fixes`` and ``min_severity`` behave as for
+    :func:`analyze_docker_compose`.
+    """
+
+    import yaml
 
     from ..parsers.kubernetes_parser import KubernetesParser
     from ..validators.k8s_validator import KubernetesValidator
@@ -129,29 +279,26 @@ def analyze_kubernetes(file_path: Union[str, Path]) -> AnalysisResult:
                 ],
             )
 
-        all_issues: list[Issue] = []
-        all_issues.extend(KubernetesValidator.validate_services(resources))
-        all_issues.extend(KubernetesValidator.validate_deployments(resources))
-        all_issues.extend(KubernetesValidator.validate_security(resources))
-        all_issues.extend(KubernetesValidator.validate_probes(resources))
-        all_issues.extend(KubernetesValidator.validate_labels(resources))
-
-        ai_provider = None
-        try:
-            cfg = get_config()
-            if cfg.ai.enabled:
-                ai_provider = get_ai_provider(cfg)
-        except Exception:
-            pass
+        # Validators whose kinds are absent from the manifest are not run
+        all_issues: list[Issue] = _at_least(_dedupe_issues(_run_validators([
+            (validate, resources)
+            for validate, kinds in _k8s_validators()
+            if resources.has_kind(*kinds)
+        ])), min_severity)
 
-        fixes: list[Fix] = []
-        for issue in all_issues:
-            if issue.severity == Severity.CRITICAL and ai_provider:
-                try:
-                    if issue.type == IssueType.PORT_CONFLICT:
-                        port = issue.details.get("port")
-                        namespace = issue.details.get("namespace", "default")
-                        snippet = f"""apiVersion: v1
+        critical = [idx for idx, issue in enumerate(all_issues) if issue.severity is Severity.CRITICAL]
+        if not include_fixes:
+            return AnalysisResult(success=not critical, issues=all_issues)
+        ai_provider = _resolve_ai_provider() if critical else None
+
+        ai_payloads: dict[int, dict] = {}
+        if ai_provider:
+            for idx in critical:
+                issue = all_issues[idx]
+                if issue.type is IssueType.PORT_CONFLICT:
+                    port = issue.details.get("port")
+                    namespace = issue.details.get("namespace", "default")
+                    snippet = f"""apiVersion: v1
 kind: Service
 metadata:
   name: {issue.service_name}
@@ -163,37 +310,31 @@ spec:
     port: 8080
     targetPort: 80
 """
-                    else:
-                        snippet = f"Service: {issue.service_name}, Details: {issue.details}"
-
-                    ai_result = ai_provider.analyze_error(
-                        error_message=issue.message,
-                        config_snippet=snippet,
-                        context={
-                            "service_name": issue.service_name,
-                            "issue_type": issue.type.value,
-                            "platform": "kubernetes",
-                            "namespace": issue.details.get("namespace", "default"),
-                        },
-                    )
-                    if "error" not in ai_result and ai_result.get("fix_steps"):
-                        fixes.append(
-                            Fix(
-                                description=ai_result.get("explanation", "AI-generated fix"),
-                                steps=ai_result.get("fix_steps", []),
-                                auto_applicable=False,
-                                explanation=ai_result.get("explanation", ""),
-                                root_cause=ai_result.get("root_cause", ""),
-                            )
-                        )
-                        continue
-                except Exception:
-                    pass
+                else:
+                    snippet = f"Service: {issue.service_name}, Details: {issue.details}"
+                ai_payloads[idx] = {
+                    "error_message": issue.message,
+                    "config_snippet": snippet,
+                    "context": {
+                        "service_name": issue.service_name,
+                        "issue_type": issue.type.value,
+                        "platform": "kubernetes",
+                        "namespace": issue.details.get("namespace", "default"),
+                    },
+                }
+        ai_results = dict(zip(ai_payloads, _analyze_errors(ai_provider, list(ai_payloads.values()))))
+
+        fixes: list[Fix] = []
+        for idx, issue in enumerate(all_issues):
+            ai_fix = _ai_fix(ai_results.get(idx))
+            if ai_fix is not None:
+                fixes.append(ai_fix)
+                continue
 
             fixes.append(KubernetesValidator.generate_fix(issue))
 
         return AnalysisResult(
-            success=not any(i.severity == Severity.CRITICAL for i in all_issues),
+            success=not critical,
             issues=all_issues,
             fixes=fixes,
         )
@@ -1,12 +1,34 @@
 """Base validator class."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 from ..models import Issue, DockerComposeConfig
 
 
+def split_image_tag(image: str) -> Tuple[str, str]:
+    """Split an image reference into ``(name, tag)``; the tag is '' if absent.
+
+    A digest (``app@sha256:...``) counts as the tag.  Otherwise the tag is
+    what follows the last ':' unless a '/' comes after it, so a registry
+    port (``registry:5000/app``) is not mistaken for one.
+    """
+    name, at, digest = image.partition('@')
+    if at:
+        return name, digest
+    head, sep, tag = image.rpartition(':')
+    if not sep or '/' in tag:
+        return image, ''
+    return head, tag
+
+
 class BaseValidator(ABC):
-    """Base class for all validators."""
+    """Base class for all validators.
+
+    Slotted (``ABC`` itself declares empty ``__slots__``), so validator
+    instances built per analysed file carry no ``__dict__``.
+    """
+
+    __slots__ = ('issues',)
     
     def __init__(self):
         self.issues: List[Issue] = []
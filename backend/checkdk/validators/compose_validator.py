@@ -1,265 +1,311 @@
 """Docker Compose configuration validator."""
 import re
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Set, Tuple
 from ..models import Issue, IssueType, Severity, Fix
+from .base import split_image_tag
+
+# Volume sources that are host paths rather than named volumes.  '.' covers
+# './', '../' and a bare '.' (the project directory), as Compose does.
+_BIND_MOUNT_PREFIXES = ('/', '.', '~')
+
+# Restart policies that keep a service running indefinitely
+_LONG_RUNNING_RESTARTS = frozenset({'always', 'unless-stopped'})
+
+# Pattern to match ${VAR_NAME} or $VAR_NAME
+_ENV_REF_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
 
 
 class DockerComposeValidator:
-    """Comprehensive Docker Compose configuration validator."""
+    """Comprehensive Docker Compose configuration validator.
+
+    Each ``_check_*`` helper inspects one service and appends to ``issues``.
+    :meth:`validate_all` runs every check in a single walk over the services;
+    the public ``validate_*`` methods run one check each.  Either way issues
+    come back grouped by check, so the output order is the same.
+
+    Service names are YAML keys and need not be strings (``80:`` is an int),
+    hence ``service_name: Any`` — the mypyc build would reject them otherwise.
+    """
     
     @staticmethod
-    def validate_images(config: Dict[str, Any]) -> List[Issue]:
-        """Validate image specifications."""
-        issues = []
+    def _context(config: Dict[str, Any]) -> Dict[str, Any]:
+        """File-level facts the per-service checks share, computed once."""
         services = config.get('services', {})
+        service_names = frozenset(services)
+        defined_volumes = frozenset(config.get('volumes', {}))
+        # The default network always exists
+        defined_networks = frozenset(config.get('networks', {})) | {'default'}
+        # The name tuples go into Issue.details; one immutable copy is shared
+        # by every issue instead of a fresh list per issue.
+        return {
+            'service_names': service_names,
+            'available_services': tuple(service_names),
+            'defined_volumes': defined_volumes,
+            'defined_volumes_list': tuple(defined_volumes),
+            'defined_networks': defined_networks,
+            'defined_networks_list': tuple(defined_networks),
+        }
+    
+    @staticmethod
+    def _check_images(service_name: Any, service_config: Dict[str, Any],
+                      ctx: Dict[str, Any], issues: List[Issue]) -> None:
+        """Validate image specifications."""
+        # Check if image is specified
+        if 'image' not in service_config and 'build' not in service_config:
+            issues.append(Issue.fast(
+                type=IssueType.MISSING_IMAGE,
+                severity=Severity.CRITICAL,
+                message=f"Service '{service_name}' has no image or build specification",
+                service_name=service_name,
+                details={'reason': 'Every service needs either an image or build directive'}
+            ))
         
-        for service_name, service_config in services.items():
-            if not isinstance(service_config, dict):
-                continue
-            
-            # Check if image is specified
-            if 'image' not in service_config and 'build' not in service_config:
-                issues.append(Issue(
-                    type=IssueType.MISSING_IMAGE,
-                    severity=Severity.CRITICAL,
-                    message=f"Service '{service_name}' has no image or build specification",
+        # Check for latest tag usage
+        image = service_config.get('image', '')
+        if image:
+            if split_image_tag(image)[1] in ('', 'latest'):
+                issues.append(Issue.fast(
+                    type=IssueType.IMAGE_VERSION,
+                    severity=Severity.WARNING,
+                    message=f"Service '{service_name}' uses 'latest' tag or no tag for image '{image}'",
                     service_name=service_name,
-                    details={'reason': 'Every service needs either an image or build directive'}
+                    details={
+                        'image': image,
+                        'reason': 'Using :latest can lead to unpredictable deployments'
+                    }
                 ))
-            
-            # Check for latest tag usage
-            image = service_config.get('image', '')
-            if image:
-                if image.endswith(':latest') or ':' not in image:
-                    issues.append(Issue(
-                        type=IssueType.IMAGE_VERSION,
-                        severity=Severity.WARNING,
-                        message=f"Service '{service_name}' uses 'latest' tag or no tag for image '{image}'",
-                        service_name=service_name,
-                        details={
-                            'image': image,
-                            'reason': 'Using :latest can lead to unpredictable deployments'
-                        }
-                    ))
-        
-        return issues
     
     @staticmethod
-    def validate_environment_variables(config: Dict[str, Any]) -> List[Issue]:
+    def _check_environment_variables(service_name: Any, service_config: Dict[str, Any],
+                                     ctx: Dict[str, Any], issues: List[Issue]) -> None:
         """Validate environment variable references."""
-        issues = []
-        services = config.get('services', {})
+        environment = service_config.get('environment', [])
         
-        # Pattern to match ${VAR_NAME} or $VAR_NAME
-        env_var_pattern = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+        # Handle both list and dict format
+        if isinstance(environment, list):
+            env_entries = environment
+        elif isinstance(environment, dict):
+            env_entries = [f"{k}={v}" if v is not None else k for k, v in environment.items()]
+        else:
+            return
         
-        for service_name, service_config in services.items():
-            if not isinstance(service_config, dict):
-                continue
-            
-            environment = service_config.get('environment', [])
-            
-            # Handle both list and dict format
-            if isinstance(environment, list):
-                env_entries = environment
-            elif isinstance(environment, dict):
-                env_entries = [f"{k}={v}" if v is not None else k for k, v in environment.items()]
-            else:
+        # One issue per variable per service, pointing at its first use
+        flagged: Set[str] = set()
+        finditer = _ENV_REF_RE.finditer
+        for entry in env_entries:
+            if not isinstance(entry, str) or '$' not in entry:
                 continue
             
-            for entry in env_entries:
-                if not isinstance(entry, str):
-                    continue
-                
-                # Find all env var references
-                matches = env_var_pattern.findall(entry)
-                for match in matches:
-                    var_name = match[0] or match[1]
+            # Walk the env var references
+            for match in finditer(entry):
+                raw_ref = match.group(1) or ''  # the part inside ${...}
+                var_name = raw_ref or match.group(2)
 
-                    # Only flag bare references without a shell default
-                    # (e.g. ${VAR} but not ${VAR:-fallback}).
-                    # We deliberately do NOT check os.getenv() here: the
-                    # validator runs inside the API container, which is a
-                    # different environment from where the user will deploy.
-                    # Checking the server's env would produce false positives
-                    # for every variable that is correctly set in the user's
-                    # deployment env but happens to be absent in this container.
-                    raw_ref = match[0]  # the part inside ${...}
-                    has_default = (":-" in raw_ref or ":=" in raw_ref or ":?" in raw_ref or ":+" in raw_ref)
-                    if not has_default:
-                        issues.append(Issue(
-                            type=IssueType.MISSING_ENV_VAR,
-                            severity=Severity.INFO,
-                            message=(
-                                f"Service '{service_name}' references '${{{var_name}}}' "
-                                f"with no inline default — ensure it is set in your "
-                                f"deployment environment or .env file"
-                            ),
-                            service_name=service_name,
-                            details={
-                                'variable': var_name,
-                                'entry': entry,
-                            }
-                        ))
-        
-        return issues
-    
-    @staticmethod
-    def validate_dependencies(config: Dict[str, Any]) -> List[Issue]:
-        """Validate service dependencies."""
-        issues = []
-        services = config.get('services', {})
-        service_names = set(services.keys())
-        
-        for service_name, service_config in services.items():
-            if not isinstance(service_config, dict):
-                continue
-            
-            # Check depends_on
-            depends_on = service_config.get('depends_on', [])
-            if isinstance(depends_on, dict):
-                depends_on = list(depends_on.keys())
-            
-            for dep in depends_on:
-                if dep not in service_names:
-                    issues.append(Issue(
-                        type=IssueType.SERVICE_DEPENDENCY,
-                        severity=Severity.CRITICAL,
-                        message=f"Service '{service_name}' depends on non-existent service '{dep}'",
+                # Only flag bare references without a shell default
+                # (e.g. ${VAR} but not ${VAR:-fallback}).
+                # We deliberately do NOT check os.getenv() here: the
+                # validator runs inside the API container, which is a
+                # different environment from where the user will deploy.
+                # Checking the server's env would produce false positives
+                # for every variable that is correctly set in the user's
+                # deployment env but happens to be absent in this container.
+                if var_name in flagged:
+                    continue
+                has_default = (":-" in raw_ref or ":=" in raw_ref or ":?" in raw_ref or ":+" in raw_ref)
+                if not has_default:
+                    flagged.add(var_name)
+                    issues.append(Issue.fast(
+                        type=IssueType.MISSING_ENV_VAR,
+                        severity=Severity.INFO,
+                        message=(
+                            f"Service '{service_name}' references '${{{var_name}}}' "
+                            f"with no inline default — ensure it is set in your "
+                            f"deployment environment or .env file"
+                        ),
                         service_name=service_name,
                         details={
-                            'missing_dependency': dep,
-                            'available_services': list(service_names)
+                            'variable': var_name,
+                            'entry': entry,
                         }
                     ))
-            
-            # Check links (deprecated but still used)
-            links = service_config.get('links', [])
-            for link in links:
-                link_service = link.split(':')[0]
-                if link_service not in service_names:
-                    issues.append(Issue(
-                        type=IssueType.SERVICE_DEPENDENCY,
-                        severity=Severity.CRITICAL,
-                        message=f"Service '{service_name}' links to non-existent service '{link_service}'",
-                        service_name=service_name,
-                        details={'missing_link': link_service}
-                    ))
+    
+    @staticmethod
+    def _check_dependencies(service_name: Any, service_config: Dict[str, Any],
+                            ctx: Dict[str, Any], issues: List[Issue]) -> None:
+        """Validate service dependencies."""
+        service_names = ctx['service_names']
+        
+        # Check depends_on (the dict form iterates over its keys)
+        depends_on = service_config.get('depends_on', [])
+        
+        for dep in depends_on:
+            if dep not in service_names:
+                issues.append(Issue.fast(
+                    type=IssueType.SERVICE_DEPENDENCY,
+                    severity=Severity.CRITICAL,
+                    message=f"Service '{service_name}' depends on non-existent service '{dep}'",
+                    service_name=service_name,
+                    details={
+                        'missing_dependency': dep,
+                        'available_services': ctx['available_services']
+                    }
+                ))
         
-        return issues
+        # Check links (deprecated but still used)
+        links = service_config.get('links', [])
+        for link in links:
+            link_service = link.partition(':')[0]
+            if link_service not in service_names:
+                issues.append(Issue.fast(
+                    type=IssueType.SERVICE_DEPENDENCY,
+                    severity=Severity.CRITICAL,
+                    message=f"Service '{service_name}' links to non-existent service '{link_service}'",
+                    service_name=service_name,
+                    details={'missing_link': link_service}
+                ))
     
     @staticmethod
-    def validate_volumes(config: Dict[str, Any]) -> List[Issue]:
+    def _check_volumes(service_name: Any, service_config: Dict[str, Any],
+                       ctx: Dict[str, Any], issues: List[Issue]) -> None:
         """Validate volume configurations."""
-        issues = []
-        services = config.get('services', {})
-        defined_volumes = set(config.get('volumes', {}).keys())
+        volumes = service_config.get('volumes', [])
         
-        for service_name, service_config in services.items():
-            if not isinstance(service_config, dict):
+        for volume in volumes:
+            if not isinstance(volume, str):
                 continue
             
-            volumes = service_config.get('volumes', [])
-            
-            for volume in volumes:
-                if not isinstance(volume, str):
-                    continue
+            # Named volume reference (e.g., "db_data:/var/lib/mysql")
+            if ':' in volume:
+                source = volume.partition(':')[0]
                 
-                # Named volume reference (e.g., "db_data:/var/lib/mysql")
-                if ':' in volume:
-                    source = volume.split(':')[0]
-                    
-                    # Check if it's a named volume (not a path)
-                    if not source.startswith('/') and not source.startswith('./') and not source.startswith('~'):
-                        if source not in defined_volumes:
-                            issues.append(Issue(
-                                type=IssueType.VOLUME_MOUNT,
-                                severity=Severity.WARNING,
-                                message=f"Service '{service_name}' uses undefined volume '{source}'",
-                                service_name=service_name,
-                                details={
-                                    'volume': source,
-                                    'defined_volumes': list(defined_volumes),
-                                    'suggestion': 'Define the volume in the top-level volumes section'
-                                }
-                            ))
-        
-        return issues
+                # Check if it's a named volume (not a path)
+                if not source.startswith(_BIND_MOUNT_PREFIXES):
+                    if source not in ctx['defined_volumes']:
+                        issues.append(Issue.fast(
+                            type=IssueType.VOLUME_MOUNT,
+                            severity=Severity.WARNING,
+                            message=f"Service '{service_name}' uses undefined volume '{source}'",
+                            service_name=service_name,
+                            details={
+                                'volume': source,
+                                'defined_volumes': ctx['defined_volumes_list'],
+                                'suggestion': 'Define the volume in the top-level volumes section'
+                            }
+                        ))
     
     @staticmethod
-    def validate_networks(config: Dict[str, Any]) -> List[Issue]:
+    def _check_networks(service_name: Any, service_config: Dict[str, Any],
+                        ctx: Dict[str, Any], issues: List[Issue]) -> None:
         """Validate network configurations."""
-        issues = []
-        services = config.get('services', {})
-        defined_networks = set(config.get('networks', {}).keys())
-        
-        # Add default network
-        defined_networks.add('default')
-        
-        for service_name, service_config in services.items():
-            if not isinstance(service_config, dict):
-                continue
-            
-            networks = service_config.get('networks', [])
-            
-            # Handle both list and dict format
-            if isinstance(networks, dict):
-                networks = list(networks.keys())
-            
-            for network in networks:
-                if network not in defined_networks:
-                    issues.append(Issue(
-                        type=IssueType.NETWORK_CONFIG,
-                        severity=Severity.WARNING,
-                        message=f"Service '{service_name}' uses undefined network '{network}'",
-                        service_name=service_name,
-                        details={
-                            'network': network,
-                            'defined_networks': list(defined_networks)
-                        }
-                    ))
+        # Handle both list and dict format (a dict iterates over its keys)
+        networks = service_config.get('networks', [])
         
-        return issues
+        for network in networks:
+            if network not in ctx['defined_networks']:
+                issues.append(Issue.fast(
+                    type=IssueType.NETWORK_CONFIG,
+                    severity=Severity.WARNING,
+                    message=f"Service '{service_name}' uses undefined network '{network}'",
+                    service_name=service_name,
+                    details={
+                        'network': network,
+                        'defined_networks': ctx['defined_networks_list']
+                    }
+                ))
     
     @staticmethod
-    def validate_resource_limits(config: Dict[str, Any]) -> List[Issue]:
+    def _check_resource_limits(service_name: Any, service_config: Dict[str, Any],
+                               ctx: Dict[str, Any], issues: List[Issue]) -> None:
         """Validate resource limit configurations."""
-        issues = []
-        services = config.get('services', {})
+        deploy = service_config.get('deploy', {})
+        limits = deploy.get('resources', {}).get('limits', {})
+        
+        # Check if production-like services have resource limits
+        # (services with restart policies or multiple replicas)
+        restart = service_config.get('restart', '')
+        replicas = deploy.get('replicas', 1)
+        
+        if (restart in _LONG_RUNNING_RESTARTS or replicas > 1) and not limits:
+            issues.append(Issue.fast(
+                type=IssueType.RESOURCE_LIMIT,
+                severity=Severity.WARNING,
+                message=f"Production service '{service_name}' has no resource limits",
+                service_name=service_name,
+                details={
+                    'reason': 'Services without limits can consume all available resources',
+                    'restart': restart,
+                    'replicas': replicas
+                }
+            ))
+    
+    @classmethod
+    def _run_checks(cls, config: Dict[str, Any], checks: Tuple[Callable[..., None], ...]) -> List[Issue]:
+        """Run *checks* over every service in one pass, grouped by check."""
+        services = config.get('services')
+        if not services:
+            # The parser already reported the empty file; skip building the context
+            return []
+        ctx = cls._context(config)
+        buckets: List[List[Issue]] = [[] for _ in checks]
+        pairs = tuple(zip(checks, buckets))
         
         for service_name, service_config in services.items():
             if not isinstance(service_config, dict):
                 continue
-            
-            deploy = service_config.get('deploy', {})
-            resources = deploy.get('resources', {})
-            limits = resources.get('limits', {})
-            
-            # Check if production-like services have resource limits
-            # (services with restart policies or multiple replicas)
-            restart = service_config.get('restart', '')
-            replicas = deploy.get('replicas', 1)
-            
-            if (restart in ['always', 'unless-stopped'] or replicas > 1) and not limits:
-                issues.append(Issue(
-                    type=IssueType.RESOURCE_LIMIT,
-                    severity=Severity.WARNING,
-                    message=f"Production service '{service_name}' has no resource limits",
-                    service_name=service_name,
-                    details={
-                        'reason': 'Services without limits can consume all available resources',
-                        'restart': restart,
-                        'replicas': replicas
-                    }
-                ))
+            for check, bucket in pairs:
+                check(service_name, service_config, ctx, bucket)
         
-        return issues
+        if len(buckets) == 1:
+            return buckets[0]
+        return [issue for bucket in buckets for issue in bucket]
+    
+    @classmethod
+    def validate_all(cls, config: Dict[str, Any]) -> List[Issue]:
+        """Run every check in a single walk over the services."""
+        return cls._run_checks(config, (
+            cls._check_images,
+            cls._check_environment_variables,
+            cls._check_dependencies,
+            cls._check_volumes,
+            cls._check_networks,
+            cls._check_resource_limits,
+        ))
+    
+    @classmethod
+    def validate_images(cls, config: Dict[str, Any]) -> List[Issue]:
+        """Validate image specifications."""
+        return cls._run_checks(config, (cls._check_images,))
+    
+    @classmethod
+    def validate_environment_variables(cls, config: Dict[str, Any]) -> List[Issue]:
+        """Validate environment variable references."""
+        return cls._run_checks(config, (cls._check_environment_variables,))
+    
+    @classmethod
+    def validate_dependencies(cls, config: Dict[str, Any]) -> List[Issue]:
+        """Validate service dependencies."""
+        return cls._run_checks(config, (cls._check_dependencies,))
+    
+    @classmethod
+    def validate_volumes(cls, config: Dict[str, Any]) -> List[Issue]:
+        """Validate volume configurations."""
+        return cls._run_checks(config, (cls._check_volumes,))
+    
+    @classmethod
+    def validate_networks(cls, config: Dict[str, Any]) -> List[Issue]:
+        """Validate network configurations."""
+        return cls._run_checks(config, (cls._check_networks,))
+    
+    @classmethod
+    def validate_resource_limits(cls, config: Dict[str, Any]) -> List[Issue]:
+        """Validate resource limit configurations."""
+        return cls._run_checks(config, (cls._check_resource_limits,))
     
     @staticmethod
     def generate_fix(issue: Issue) -> Fix:
         """Generate fix suggestions for Docker Compose issues."""
-        if issue.type == IssueType.MISSING_IMAGE:
-            return Fix(
+        if issue.type is IssueType.MISSING_IMAGE:
+            return Fix.fast(
                 description=f"Add image specification to service '{issue.service_name}'",
                 steps=[
                     "Add an image directive to the service:",
@@ -275,11 +321,11 @@ class DockerComposeValidator:
                 auto_applicable=False
             )
         
-        elif issue.type == IssueType.IMAGE_VERSION:
+        elif issue.type is IssueType.IMAGE_VERSION:
             image = issue.details.get('image', '')
-            base_image = image.split(':')[0] if ':' in image else image
+            base_image = split_image_tag(image)[0]
             
-            return Fix(
+            return Fix.fast(
                 description=f"Pin specific version for '{issue.service_name}'",
                 steps=[
                     "Replace 'latest' with a specific version:",
@@ -292,10 +338,10 @@ class DockerComposeValidator:
                 auto_applicable=False
             )
         
-        elif issue.type == IssueType.MISSING_ENV_VAR:
+        elif issue.type is IssueType.MISSING_ENV_VAR:
             var_name = issue.details.get('variable', '')
             
-            return Fix(
+            return Fix.fast(
                 description=f"Define environment variable '{var_name}'",
                 steps=[
                     "Option 1: Create a .env file in the same directory:",
@@ -311,10 +357,10 @@ class DockerComposeValidator:
                 auto_applicable=False
             )
         
-        elif issue.type == IssueType.SERVICE_DEPENDENCY:
+        elif issue.type is IssueType.SERVICE_DEPENDENCY:
             missing_dep = issue.details.get('missing_dependency') or issue.details.get('missing_link')
             
-            return Fix(
+            return Fix.fast(
                 description=f"Fix missing service dependency '{missing_dep}'",
                 steps=[
                     f"Option 1: Remove the dependency on '{missing_dep}':",
@@ -329,10 +375,10 @@ class DockerComposeValidator:
                 auto_applicable=False
             )
         
-        elif issue.type == IssueType.VOLUME_MOUNT:
+        elif issue.type is IssueType.VOLUME_MOUNT:
             volume = issue.details.get('volume', '')
             
-            return Fix(
+            return Fix.fast(
                 description=f"Define volume '{volume}'",
                 steps=[
                     "Add the volume to the top-level volumes section:",
@@ -347,8 +393,8 @@ class DockerComposeValidator:
                 auto_applicable=False
             )
         
-        elif issue.type == IssueType.RESOURCE_LIMIT:
-            return Fix(
+        elif issue.type is IssueType.RESOURCE_LIMIT:
+            return Fix.fast(
                 description=f"Add resource limits to '{issue.service_name}'",
                 steps=[
                     "Add resource limits using deploy section:",
@@ -366,7 +412,7 @@ class DockerComposeValidator:
                 auto_applicable=False
             )
         
-        return Fix(
+        return Fix.fast(
             description="Manual review required",
             steps=["Review the configuration manually"],
             auto_applicable=False
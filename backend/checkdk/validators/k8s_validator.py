@@ -1,27 +1,61 @@
 """Kubernetes configuration validator."""
-from typing import List, Dict, Any
+from collections import defaultdict
+from typing import Any, Callable, ClassVar, Dict, List, Set, Tuple
 from ..models import Issue, IssueType, Severity, Fix
+from .base import split_image_tag
+from ..parsers.kubernetes_parser import resources_of_kind
+
+
+# Resource kinds each check applies to
+_WORKLOAD_KINDS = frozenset({'Deployment', 'Pod', 'StatefulSet', 'DaemonSet'})
+_PROBED_KINDS = frozenset({'Deployment', 'StatefulSet'})
+_CONTROLLER_KINDS = frozenset({'Deployment', 'StatefulSet', 'DaemonSet'})
+
+
+def _meta(resource: Dict[str, Any]) -> Tuple[Any, Any]:
+    """``(name, namespace)`` of a resource, with the usual defaults.
+
+    Both are returned as written in the YAML (``name: 123`` stays an int,
+    ``namespace: null`` stays None), so they are typed ``Any``: the mypyc
+    build checks annotations at runtime and must accept what Python does.
+    """
+    metadata = resource.get('metadata') or {}
+    return metadata.get('name', 'unknown'), metadata.get('namespace', 'default')
+
+
+def _workload(resource: Dict[str, Any]) -> Tuple[Any, Any, List[Dict[str, Any]]]:
+    """``(name, namespace, containers)`` of a Pod or pod-templated workload."""
+    name, namespace = _meta(resource)
+    spec = resource.get('spec') or {}
+    if resource.get('kind') != 'Pod':
+        spec = (spec.get('template') or {}).get('spec') or {}
+    return name, namespace, spec.get('containers') or []
 
 
 class KubernetesValidator:
     """Validates Kubernetes configurations."""
     
+    # The kinds each validator inspects; on a manifest with none of them a
+    # validator has nothing to do and need not be run.
+    TARGET_KINDS: ClassVar[Dict[str, frozenset]] = {
+        'validate_services': frozenset({'Service'}),
+        'validate_deployments': frozenset({'Deployment'}),
+        'validate_security': _WORKLOAD_KINDS,
+        'validate_probes': _PROBED_KINDS,
+        'validate_labels': _CONTROLLER_KINDS,
+    }
+    
     @staticmethod
     def validate_security(resources: List[Dict[str, Any]]) -> List[Issue]:
         """Validate security configurations."""
-        issues = []
-        deployments = [r for r in resources if r.get('kind') in ['Deployment', 'Pod', 'StatefulSet', 'DaemonSet']]
+        issues: List[Issue] = []
+        append = issues.append
+        deployments = resources_of_kind(resources, *_WORKLOAD_KINDS)
         
         for resource in deployments:
-            name = resource.get('metadata', {}).get('name', 'unknown')
-            namespace = resource.get('metadata', {}).get('namespace', 'default')
-            kind = resource.get('kind')
-            
-            # Get containers from appropriate location
-            if kind == 'Pod':
-                containers = resource.get('spec', {}).get('containers', [])
-            else:
-                containers = resource.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
+            name, namespace, containers = _workload(resource)
+            # Shared head of every message about this resource
+            owner = f"{resource.get('kind')} '{name}'"
             
             for container in containers:
                 container_name = container.get('name', 'unknown')
@@ -29,10 +63,10 @@ class KubernetesValidator:
                 
                 # Check for privileged containers
                 if security_context.get('privileged'):
-                    issues.append(Issue(
+                    append(Issue.fast(
                         type=IssueType.SECURITY_ISSUE,
                         severity=Severity.CRITICAL,
-                        message=f"{kind} '{name}' container '{container_name}' runs in privileged mode",
+                        message=f"{owner} container '{container_name}' runs in privileged mode",
                         service_name=name,
                         details={
                             'container': container_name,
@@ -45,10 +79,10 @@ class KubernetesValidator:
                 if not security_context.get('runAsNonRoot'):
                     run_as_user = security_context.get('runAsUser')
                     if run_as_user is None or run_as_user == 0:
-                        issues.append(Issue(
+                        append(Issue.fast(
                             type=IssueType.SECURITY_ISSUE,
                             severity=Severity.WARNING,
-                            message=f"{kind} '{name}' container '{container_name}' may run as root",
+                            message=f"{owner} container '{container_name}' may run as root",
                             service_name=name,
                             details={
                                 'container': container_name,
@@ -62,23 +96,23 @@ class KubernetesValidator:
     @staticmethod
     def validate_probes(resources: List[Dict[str, Any]]) -> List[Issue]:
         """Validate liveness and readiness probes."""
-        issues = []
-        deployments = [r for r in resources if r.get('kind') in ['Deployment', 'StatefulSet']]
+        issues: List[Issue] = []
+        append = issues.append
+        deployments = resources_of_kind(resources, *_PROBED_KINDS)
         
         for deployment in deployments:
-            name = deployment.get('metadata', {}).get('name', 'unknown')
-            namespace = deployment.get('metadata', {}).get('namespace', 'default')
-            containers = deployment.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
+            name, namespace, containers = _workload(deployment)
+            owner = f"Deployment '{name}'"
             
             for container in containers:
                 container_name = container.get('name', 'unknown')
                 
                 # Check for liveness probe
                 if 'livenessProbe' not in container:
-                    issues.append(Issue(
+                    append(Issue.fast(
                         type=IssueType.HEALTH_CHECK,
                         severity=Severity.WARNING,
-                        message=f"Deployment '{name}' container '{container_name}' has no liveness probe",
+                        message=f"{owner} container '{container_name}' has no liveness probe",
                         service_name=name,
                         details={
                             'container': container_name,
@@ -89,10 +123,10 @@ class KubernetesValidator:
                 
                 # Check for readiness probe
                 if 'readinessProbe' not in container:
-                    issues.append(Issue(
+                    append(Issue.fast(
                         type=IssueType.HEALTH_CHECK,
                         severity=Severity.WARNING,
-                        message=f"Deployment '{name}' container '{container_name}' has no readiness probe",
+                        message=f"{owner} container '{container_name}' has no readiness probe",
                         service_name=name,
                         details={
                             'container': container_name,
@@ -106,52 +140,51 @@ class KubernetesValidator:
     @staticmethod
     def validate_labels(resources: List[Dict[str, Any]]) -> List[Issue]:
         """Validate label selectors and matching."""
-        issues = []
+        issues: List[Issue] = []
+        append = issues.append
+        workloads = resources_of_kind(resources, *_CONTROLLER_KINDS)
         
-        for resource in resources:
+        for resource in workloads:
             kind = resource.get('kind')
-            if kind not in ['Deployment', 'StatefulSet', 'DaemonSet']:
-                continue
-            
-            name = resource.get('metadata', {}).get('name', 'unknown')
-            namespace = resource.get('metadata', {}).get('namespace', 'default')
+            name, namespace = _meta(resource)
             spec = resource.get('spec', {})
             
             # Get selector and template labels
             selector = spec.get('selector', {}).get('matchLabels', {})
             template_labels = spec.get('template', {}).get('metadata', {}).get('labels', {})
             
-            # Check if selector matches template labels
-            for key, value in selector.items():
-                if key not in template_labels or template_labels[key] != value:
-                    issues.append(Issue(
-                        type=IssueType.LABEL_MISMATCH,
-                        severity=Severity.CRITICAL,
-                        message=f"{kind} '{name}' selector doesn't match pod template labels",
-                        service_name=name,
-                        details={
-                            'namespace': namespace,
-                            'selector': selector,
-                            'template_labels': template_labels,
-                            'reason': 'Mismatched labels will prevent the deployment from managing pods'
-                        }
-                    ))
-                    break
+            # Every selector pair must appear in the template labels.  A dict
+            # items-view subset test does this in C (length check first).
+            # Charts often alias one map for both (``matchLabels: *labels``);
+            # the parser then hands back the same dict, which trivially matches.
+            if selector is not template_labels and not selector.items() <= template_labels.items():
+                append(Issue.fast(
+                    type=IssueType.LABEL_MISMATCH,
+                    severity=Severity.CRITICAL,
+                    message=f"{kind} '{name}' selector doesn't match pod template labels",
+                    service_name=name,
+                    details={
+                        'namespace': namespace,
+                        'selector': selector,
+                        'template_labels': template_labels,
+                        'reason': 'Mismatched labels will prevent the deployment from managing pods'
+                    }
+                ))
         
         return issues
     
     @staticmethod
     def validate_services(resources: List[Dict[str, Any]]) -> List[Issue]:
         """Validate Kubernetes Services for common issues."""
-        issues = []
-        services = [r for r in resources if r.get('kind') == 'Service']
+        issues: List[Issue] = []
+        append = issues.append
+        services = resources_of_kind(resources, 'Service')
         
-        # Check for NodePort conflicts
-        nodeport_map = {}
+        # Services claiming each NodePort, in document order
+        nodeport_owners: Dict[str, List[Tuple[Any, Any, Any]]] = defaultdict(list)
         
         for service in services:
-            name = service.get('metadata', {}).get('name', 'unknown')
-            namespace = service.get('metadata', {}).get('namespace', 'default')
+            name, namespace = _meta(service)
             spec = service.get('spec', {})
             
             # Check for NodePort conflicts (NodePorts are cluster-wide)
@@ -159,31 +192,17 @@ class KubernetesValidator:
                 for port_config in spec.get('ports', []):
                     node_port = port_config.get('nodePort')
                     if node_port:
-                        key = str(node_port)
-                        if key in nodeport_map:
-                            issues.append(Issue(
-                                type=IssueType.PORT_CONFLICT,
-                                severity=Severity.CRITICAL,
-                                message=f"NodePort {node_port} is used by multiple services: '{nodeport_map[key]}' and '{name}'",
-                                service_name=name,
-                                details={
-                                    'port': node_port,
-                                    'namespace': namespace,
-                                    'conflicting_service': nodeport_map[key]
-                                }
-                            ))
-                        else:
-                            nodeport_map[key] = name
+                        nodeport_owners[str(node_port)].append((node_port, name, namespace))
             
             # Check for port conflicts within service
-            port_numbers = {}
+            port_numbers: Set[Tuple[Any, Any]] = set()
             for port_config in spec.get('ports', []):
                 port = port_config.get('port')
                 protocol = port_config.get('protocol', 'TCP')
-                key = f"{port}:{protocol}"
+                key = (port, protocol)
                 
                 if key in port_numbers:
-                    issues.append(Issue(
+                    append(Issue.fast(
                         type=IssueType.PORT_CONFLICT,
                         severity=Severity.CRITICAL,
                         message=f"Service '{name}' has duplicate port {port}/{protocol}",
@@ -195,182 +214,234 @@ class KubernetesValidator:
                         }
                     ))
                 else:
-                    port_numbers[key] = True
+                    port_numbers.add(key)
+        
+        # One issue per shared NodePort, naming every service that claims it
+        for owners in nodeport_owners.values():
+            if len(owners) < 2:
+                continue
+            node_port = owners[0][0]
+            names = tuple(owner[1] for owner in owners)
+            listed = ", ".join(f"'{n}'" for n in names[:-1]) + f" and '{names[-1]}'"
+            append(Issue.fast(
+                type=IssueType.PORT_CONFLICT,
+                severity=Severity.CRITICAL,
+                message=f"NodePort {node_port} is used by multiple services: {listed}",
+                service_name=names[1],
+                details={
+                    'port': node_port,
+                    'namespace': owners[1][2],
+                    'conflicting_service': names[0],
+                    'services': names
+                }
+            ))
         
         return issues
     
     @staticmethod
     def validate_deployments(resources: List[Dict[str, Any]]) -> List[Issue]:
         """Validate Kubernetes Deployments."""
-        issues = []
-        deployments = [r for r in resources if r.get('kind') == 'Deployment']
+        issues: List[Issue] = []
+        append = issues.append
+        deployments = resources_of_kind(resources, 'Deployment')
         
         for deployment in deployments:
-            name = deployment.get('metadata', {}).get('name', 'unknown')
-            namespace = deployment.get('metadata', {}).get('namespace', 'default')
-            spec = deployment.get('spec', {})
-            template = spec.get('template', {})
+            name, namespace, containers = _workload(deployment)
+            owner = f"Deployment '{name}'"
             
-            # Check for latest tag usage
-            containers = template.get('spec', {}).get('containers', [])
+            # One walk over the containers; limit issues are held back so
+            # they still follow all of this deployment's image issues.
+            missing_limits: List[Issue] = []
             for container in containers:
+                container_name = container.get('name')
+                
+                # Check for latest tag usage
                 image = container.get('image', '')
-                if image.endswith(':latest') or ':' not in image:
-                    issues.append(Issue(
+                if split_image_tag(image)[1] in ('', 'latest'):
+                    append(Issue.fast(
                         type=IssueType.IMAGE_VERSION,
                         severity=Severity.WARNING,
-                        message=f"Deployment '{name}' uses 'latest' tag for container '{container.get('name')}'",
+                        message=f"{owner} uses 'latest' tag for container '{container_name}'",
                         service_name=name,
                         details={
-                            'container': container.get('name'),
+                            'container': container_name,
                             'image': image,
                             'namespace': namespace,
                             'reason': 'Using :latest can lead to unpredictable deployments'
                         }
                     ))
-            
-            # Check for missing resource limits
-            for container in containers:
-                container_resources = container.get('resources', {})
-                if not container_resources.get('limits'):
-                    issues.append(Issue(
+                
+                # Check for missing resource limits
+                if not (container.get('resources') or {}).get('limits'):
+                    missing_limits.append(Issue.fast(
                         type=IssueType.RESOURCE_LIMIT,
                         severity=Severity.WARNING,
-                        message=f"Deployment '{name}' container '{container.get('name')}' has no resource limits",
+                        message=f"{owner} container '{container_name}' has no resource limits",
                         service_name=name,
                         details={
-                            'container': container.get('name'),
+                            'container': container_name,
                             'namespace': namespace,
                             'reason': 'Missing limits can cause resource exhaustion'
                         }
                     ))
+            issues.extend(missing_limits)
         
         return issues
     
     @staticmethod
     def generate_fix(issue: Issue) -> Fix:
         """Generate fix for Kubernetes issues."""
-        if issue.type == IssueType.PORT_CONFLICT:
-            port = issue.details.get('port') or 30000
-            namespace = issue.details.get('namespace', 'default')
-            
-            # Suggest new port
-            new_port = port + 1
-            
-            return Fix(
-                description=f"Fix NodePort {port} conflict in namespace '{namespace}'",
-                steps=[
-                    f"Option 1: Change one service's nodePort to {new_port}",
-                    "  spec:",
-                    "    ports:",
-                    f"    - nodePort: {new_port}",
-                    "",
-                    "Option 2: Remove nodePort specification to let Kubernetes assign automatically",
-                    "  spec:",
-                    "    ports:",
-                    "    - port: 8080",
-                    "      targetPort: 80"
-                ],
-                auto_applicable=False
-            )
-        
-        elif issue.type == IssueType.IMAGE_VERSION:
-            container = issue.details.get('container')
-            image = issue.details.get('image', '')
-            base_image = image.split(':')[0]
-            
-            return Fix(
-                description=f"Pin specific version for {container}",
-                steps=[
-                    f"Replace 'latest' with specific version tag:",
-                    "  containers:",
-                    f"  - name: {container}",
-                    f"    image: {base_image}:1.21.0  # Use specific version",
-                    "",
-                    "Check available versions at: https://hub.docker.com"
-                ],
-                auto_applicable=False
-            )
-        
-        elif issue.type == IssueType.RESOURCE_LIMIT:
-            container = issue.details.get('container')
-            
-            return Fix(
-                description=f"Add resource limits for {container}",
-                steps=[
-                    "Add resource limits to prevent resource exhaustion:",
-                    "  containers:",
-                    f"  - name: {container}",
-                    "    resources:",
-                    "      limits:",
-                    '        memory: "256Mi"',
-                    '        cpu: "500m"',
-                    "      requests:",
-                    '        memory: "128Mi"',
-                    '        cpu: "250m"'
-                ],
-                auto_applicable=False
-            )
-        
-        elif issue.type == IssueType.SECURITY_ISSUE:
-            container = issue.details.get('container', 'unknown')
-            return Fix(
-                description=f"Harden security context for {container}",
-                steps=[
-                    "Add a restrictive securityContext:",
-                    "  containers:",
-                    f"  - name: {container}",
-                    "    securityContext:",
-                    "      privileged: false",
-                    "      runAsNonRoot: true",
-                    "      readOnlyRootFilesystem: true",
-                    "      allowPrivilegeEscalation: false",
-                ],
-                auto_applicable=False,
-            )
-        
-        elif issue.type == IssueType.HEALTH_CHECK:
-            container = issue.details.get('container', 'unknown')
-            return Fix(
-                description=f"Add health probes for {container}",
-                steps=[
-                    "Add liveness and readiness probes:",
-                    "  containers:",
-                    f"  - name: {container}",
-                    "    livenessProbe:",
-                    "      httpGet:",
-                    "        path: /healthz",
-                    "        port: 8080",
-                    "      initialDelaySeconds: 15",
-                    "      periodSeconds: 10",
-                    "    readinessProbe:",
-                    "      httpGet:",
-                    "        path: /ready",
-                    "        port: 8080",
-                    "      initialDelaySeconds: 5",
-                    "      periodSeconds: 5",
-                ],
-                auto_applicable=False,
-            )
-        
-        elif issue.type == IssueType.LABEL_MISMATCH:
-            selector = issue.details.get('selector', {})
-            return Fix(
-                description="Fix label selector / template mismatch",
-                steps=[
-                    "Ensure spec.selector.matchLabels matches spec.template.metadata.labels:",
-                    "  selector:",
-                    "    matchLabels:",
-                ] + [f"      {k}: {v}" for k, v in selector.items()] + [
-                    "  template:",
-                    "    metadata:",
-                    "      labels:",
-                ] + [f"        {k}: {v}" for k, v in selector.items()],
-                auto_applicable=False,
-            )
-        
-        return Fix(
-            description="Manual review required",
-            steps=["Review the configuration manually"],
-            auto_applicable=False
-        )
+        return _FIXERS.get(issue.type, _fix_manual_review)(issue)
+
+
+# ── Fix builders ──────────────────────────────────────────────────────────────
+
+def _fix_port_conflict(issue: Issue) -> Fix:
+    """Move one of two Services sharing a NodePort."""
+    port = issue.details.get('port') or 30000
+    namespace = issue.details.get('namespace', 'default')
+
+    # Suggest new port
+    new_port = port + 1
+
+    return Fix.fast(
+        description=f"Fix NodePort {port} conflict in namespace '{namespace}'",
+        steps=[
+            f"Option 1: Change one service's nodePort to {new_port}",
+            "  spec:",
+            "    ports:",
+            f"    - nodePort: {new_port}",
+            "",
+            "Option 2: Remove nodePort specification to let Kubernetes assign automatically",
+            "  spec:",
+            "    ports:",
+            "    - port: 8080",
+            "      targetPort: 80"
+        ],
+        auto_applicable=False
+    )
+
+
+def _fix_image_version(issue: Issue) -> Fix:
+    """Pin the image tag of a container."""
+    container = issue.details.get('container')
+    image = issue.details.get('image', '')
+    base_image = split_image_tag(image)[0]
+
+    return Fix.fast(
+        description=f"Pin specific version for {container}",
+        steps=[
+            f"Replace 'latest' with specific version tag:",
+            "  containers:",
+            f"  - name: {container}",
+            f"    image: {base_image}:1.21.0  # Use specific version",
+            "",
+            "Check available versions at: https://hub.docker.com"
+        ],
+        auto_applicable=False
+    )
+
+
+def _fix_resource_limit(issue: Issue) -> Fix:
+    """Add CPU and memory limits to a container."""
+    container = issue.details.get('container')
+
+    return Fix.fast(
+        description=f"Add resource limits for {container}",
+        steps=[
+            "Add resource limits to prevent resource exhaustion:",
+            "  containers:",
+            f"  - name: {container}",
+            "    resources:",
+            "      limits:",
+            '        memory: "256Mi"',
+            '        cpu: "500m"',
+            "      requests:",
+            '        memory: "128Mi"',
+            '        cpu: "250m"'
+        ],
+        auto_applicable=False
+    )
+
+
+def _fix_security(issue: Issue) -> Fix:
+    """Tighten a container's securityContext."""
+    container = issue.details.get('container', 'unknown')
+    return Fix.fast(
+        description=f"Harden security context for {container}",
+        steps=[
+            "Add a restrictive securityContext:",
+            "  containers:",
+            f"  - name: {container}",
+            "    securityContext:",
+            "      privileged: false",
+            "      runAsNonRoot: true",
+            "      readOnlyRootFilesystem: true",
+            "      allowPrivilegeEscalation: false",
+        ],
+        auto_applicable=False,
+    )
+
+
+def _fix_health_check(issue: Issue) -> Fix:
+    """Add liveness and readiness probes to a container."""
+    container = issue.details.get('container', 'unknown')
+    return Fix.fast(
+        description=f"Add health probes for {container}",
+        steps=[
+            "Add liveness and readiness probes:",
+            "  containers:",
+            f"  - name: {container}",
+            "    livenessProbe:",
+            "      httpGet:",
+            "        path: /healthz",
+            "        port: 8080",
+            "      initialDelaySeconds: 15",
+            "      periodSeconds: 10",
+            "    readinessProbe:",
+            "      httpGet:",
+            "        path: /ready",
+            "        port: 8080",
+            "      initialDelaySeconds: 5",
+            "      periodSeconds: 5",
+        ],
+        auto_applicable=False,
+    )
+
+
+def _fix_label_mismatch(issue: Issue) -> Fix:
+    """Align a workload's selector and pod template labels."""
+    selector = issue.details.get('selector', {})
+    return Fix.fast(
+        description="Fix label selector / template mismatch",
+        steps=[
+            "Ensure spec.selector.matchLabels matches spec.template.metadata.labels:",
+            "  selector:",
+            "    matchLabels:",
+        ] + [f"      {k}: {v}" for k, v in selector.items()] + [
+            "  template:",
+            "    metadata:",
+            "      labels:",
+        ] + [f"        {k}: {v}" for k, v in selector.items()],
+        auto_applicable=False,
+    )
+
+
+def _fix_manual_review(issue: Issue) -> Fix:
+    """Fallback for issue types without a specific fix."""
+    return Fix.fast(
+        description="Manual review required",
+        steps=["Review the configuration manually"],
+        auto_applicable=False
+    )
+
+
+# One lookup per issue instead of a chain of type comparisons
+_FIXERS: Dict[IssueType, Callable[[Issue], Fix]] = {
+    IssueType.PORT_CONFLICT: _fix_port_conflict,
+    IssueType.IMAGE_VERSION: _fix_image_version,
+    IssueType.RESOURCE_LIMIT: _fix_resource_limit,
+    IssueType.SECURITY_ISSUE: _fix_security,
+    IssueType.HEALTH_CHECK: _fix_health_check,
+    IssueType.LABEL_MISMATCH: _fix_label_mismatch,
+}
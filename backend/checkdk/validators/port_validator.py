@@ -1,70 +1,109 @@
 """Port conflict validator."""
 
+import errno
+import selectors
 import socket
+import time
+from collections import defaultdict
 import psutil
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from ..models import Issue, IssueType, Severity, DockerComposeConfig, Fix
 from .base import BaseValidator
 
 
+# How long to wait for the localhost probes (the fallback when the socket
+# table cannot be read), all ports together
+_PROBE_TIMEOUT = 0.5
+
+
+def _to_port(value: Any) -> Optional[int]:
+    """``int(value)`` for a port number or numeric string, else None.
+
+    Plain digit strings (nearly all of them) are converted without entering
+    a ``try`` block; only odd values such as ``" 8080"`` or ranges fall
+    through to the general conversion.
+    """
+    if isinstance(value, int):
+        return value
+    if not isinstance(value, str):
+        return None
+    if value.isdecimal():
+        return int(value)
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
 class PortValidator(BaseValidator):
     """Validate port configurations and detect conflicts."""
+
+    __slots__ = ()
     
     def validate(self, config: DockerComposeConfig) -> List[Issue]:
         """Validate port configurations."""
         self.clear_issues()
+        append = self.issues.append
         
-        # Track used ports across services
-        used_ports: Dict[int, str] = {}
+        # Services publishing each host port, in file order
+        mappings = list(self._iter_host_ports(config))
+        owners: Dict[int, List[str]] = defaultdict(list)
+        for service_name, host_port in mappings:
+            owners[host_port].append(service_name)
         
-        for service_name, service_config in config.services.items():
-            if not isinstance(service_config, dict):
+        # One issue per duplicated port, naming every service that uses it
+        for host_port, services in owners.items():
+            if len(services) < 2:
                 continue
-            
-            ports = service_config.get('ports', [])
-            
-            for port_mapping in ports:
-                host_port = self._extract_host_port(port_mapping)
-                
-                if host_port is None:
-                    continue
+            names = tuple(services)
+            listed = ", ".join(f"'{name}'" for name in names[:-1]) + f" and '{names[-1]}'"
+            append(Issue.fast(
+                type=IssueType.PORT_CONFLICT,
+                severity=Severity.CRITICAL,
+                message=f"Port {host_port} is used by multiple services: {listed}",
+                service_name=names[1],
+                details={
+                    "port": host_port,
+                    "conflicting_service": names[0],
+                    "services": names
+                }
+            ))
+        
+        # Check which ports are already in use on the system, and by what
+        in_use, processes = self._find_listeners(set(owners)) if owners else (set(), {})
+        
+        for service_name, host_port in mappings:
+            if host_port in in_use:
+                process_info = processes.get(host_port)
+                message = f"Port {host_port} on service '{service_name}' is already in use"
                 
-                # Check for duplicate ports across services
-                if host_port in used_ports:
-                    self.issues.append(Issue(
-                        type=IssueType.PORT_CONFLICT,
-                        severity=Severity.CRITICAL,
-                        message=f"Port {host_port} is used by multiple services: '{used_ports[host_port]}' and '{service_name}'",
-                        service_name=service_name,
-                        details={
-                            "port": host_port,
-                            "conflicting_service": used_ports[host_port]
-                        }
-                    ))
-                else:
-                    used_ports[host_port] = service_name
+                if process_info:
+                    message += f" by {process_info['name']} (PID {process_info['pid']})"
                 
-                # Check if port is already in use on the system
-                if self._is_port_in_use(host_port):
-                    process_info = self._get_process_using_port(host_port)
-                    message = f"Port {host_port} on service '{service_name}' is already in use"
-                    
-                    if process_info:
-                        message += f" by {process_info['name']} (PID {process_info['pid']})"
-                    
-                    self.issues.append(Issue(
-                        type=IssueType.PORT_CONFLICT,
-                        severity=Severity.CRITICAL,
-                        message=message,
-                        service_name=service_name,
-                        details={
-                            "port": host_port,
-                            "process": process_info
-                        }
-                    ))
+                append(Issue.fast(
+                    type=IssueType.PORT_CONFLICT,
+                    severity=Severity.CRITICAL,
+                    message=message,
+                    service_name=service_name,
+                    details={
+                        "port": host_port,
+                        "process": process_info
+                    }
+                ))
         
         return self.issues
     
+    def _iter_host_ports(self, config: DockerComposeConfig) -> Iterator[Tuple[str, int]]:
+        """Yield ``(service_name, host_port)`` for every published port, in file order."""
+        extract = self._extract_host_port
+        for service_name, service_config in config.services.items():
+            if not isinstance(service_config, dict):
+                continue
+            for port_mapping in service_config.get('ports') or ():
+                host_port = extract(port_mapping)
+                if host_port is not None:
+                    yield service_name, host_port
+    
     def _extract_host_port(self, port_mapping) -> Optional[int]:
         """Extract the host port from various port mapping formats."""
         if isinstance(port_mapping, int):
@@ -73,52 +112,104 @@ class PortValidator(BaseValidator):
         if isinstance(port_mapping, str):
             # Formats: "8080:80", "8080", "127.0.0.1:8080:80"
             parts = port_mapping.split(':')
-            try:
-                if len(parts) == 3:
-                    # ip:hostPort:containerPort
-                    return int(parts[1])
-                return int(parts[0])
-            except (ValueError, IndexError):
-                return None
+            # ip:hostPort:containerPort
+            return _to_port(parts[1] if len(parts) == 3 else parts[0])
         
         if isinstance(port_mapping, dict):
             # Long syntax: {published: 8080, target: 80}
             published = port_mapping.get('published')
             if published:
-                try:
-                    return int(published)
-                except ValueError:
-                    return None
+                return _to_port(published)
         
         return None
     
-    def _is_port_in_use(self, port: int) -> bool:
-        """Check if a port is currently in use."""
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(0.5)
-                result = s.connect_ex(('localhost', port))
-                return result == 0
-        except Exception:
-            return False
+    @staticmethod
+    def _probe_ports(ports: Iterable[int], timeout: float = _PROBE_TIMEOUT) -> Set[int]:
+        """Return the *ports* that accept a TCP connection on localhost.
+
+        Every connect is started non-blocking and the results are gathered
+        with one selector, so the wait is about *timeout* in total rather
+        than per port.
+        """
+        in_use: Set[int] = set()
+        with selectors.DefaultSelector() as selector:
+            try:
+                for port in ports:
+                    try:
+                        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    except OSError:
+                        continue
+                    sock.setblocking(False)
+                    # An address literal: 'localhost' would mean a blocking lookup per port
+                    result = sock.connect_ex(('127.0.0.1', port))
+                    if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        selector.register(sock, selectors.EVENT_WRITE, port)
+                        continue
+                    if result == 0:
+                        in_use.add(port)
+                    sock.close()
+                
+                deadline = time.monotonic() + timeout
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in selector.select(remaining):
+                        sock = key.fileobj
+                        if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                            in_use.add(key.data)
+                        selector.unregister(sock)
+                        sock.close()
+            except Exception:
+                pass
+            finally:
+                for key in list(selector.get_map().values()):
+                    key.fileobj.close()
+        return in_use
     
-    def _get_process_using_port(self, port: int) -> Optional[Dict[str, Any]]:
-        """Get information about the process using a specific port."""
+    @staticmethod
+    def _find_listeners(ports: Set[int]) -> Tuple[Set[int], Dict[int, Dict[str, Any]]]:
+        """Return the *ports* being listened on, and what is known of their processes.
+
+        One ``net_connections`` snapshot answers both questions for every
+        port, with no connection attempts; each process is looked up once.
+        Only TCP sockets can be listening, so UDP tables are not read.
+        Where the socket table is not readable (macOS without root) the
+        ports are probed instead, without process information.
+        """
         try:
-            for conn in psutil.net_connections(kind='inet'):
-                if conn.laddr.port == port and conn.status == 'LISTEN':
-                    try:
-                        process = psutil.Process(conn.pid)
-                        return {
-                            "pid": conn.pid,
-                            "name": process.name(),
-                            "cmdline": " ".join(process.cmdline()[:3])  # First 3 args
-                        }
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        return {"pid": conn.pid, "name": "unknown"}
+            connections = psutil.net_connections(kind='tcp')
         except Exception:
-            pass
-        return None
+            return PortValidator._probe_ports(ports), {}
+        
+        in_use: Set[int] = set()
+        owners: Dict[int, Dict[str, Any]] = {}
+        by_pid: Dict[Any, Dict[str, Any]] = {}
+        for conn in connections:
+            if conn.status != 'LISTEN' or not conn.laddr:
+                continue
+            port = conn.laddr.port
+            if port not in ports:
+                continue
+            in_use.add(port)
+            pid = conn.pid
+            if pid is None or port in owners:
+                # Owner hidden (another user's socket); Process(None) would be us
+                continue
+            if pid not in by_pid:
+                try:
+                    process = psutil.Process(pid)
+                    by_pid[pid] = {
+                        "pid": pid,
+                        "name": process.name(),
+                        "cmdline": " ".join(process.cmdline()[:3])  # First 3 args
+                    }
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    by_pid[pid] = {"pid": pid, "name": "unknown"}
+                except Exception:
+                    continue
+            owners[port] = by_pid[pid]
+        return in_use, owners
     
     @staticmethod
     def generate_fix(issue: Issue) -> Fix:
@@ -138,7 +229,7 @@ class PortValidator(BaseValidator):
         steps.append(f"  ports:")
         steps.append(f"    - \"{port + 1}:80\"  # Change {port} to {port + 1}")
         
-        return Fix(
+        return Fix.fast(
             description=f"Fix port {port} conflict",
             steps=steps,
             auto_applicable=False
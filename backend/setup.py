@@ -0,0 +1,29 @@
+"""Build hook for optional mypyc-compiled validators.
+
+All package metadata lives in ``pyproject.toml``; a plain ``pip install .``
+is unaffected by this file.  For batch/CI use over many compose files or
+manifests the compose and Kubernetes validator loops can be compiled to C::
+
+    pip install mypy
+    CHECKDK_MYPYC=1 pip install --no-build-isolation .
+
+The compiled modules are drop-in replacements; the pure-Python source is
+still what runs everywhere else.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("CHECKDK_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        "checkdk/validators/compose_validator.py",
+        "checkdk/validators/k8s_validator.py",
+        # Only the compiled modules must type-check, not everything they import
+        "--follow-imports=silent",
+    ])
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,131 @@
+"""Tests for the AI error-analysis response parser."""
+
+from checkdk.ai.providers import _parse_ai_response, _read_error_stream, _split_batch_response
+
+
+def test_parse_inline_sections_and_bullets():
+    """Test parsing numbered bold headings with inline text and bullet steps."""
+    response = """1. **Explanation**: Port 8080 is already bound by another service.
+2. **Root Cause**: Two services publish the same host port.
+3. **Fix**:
+   - Change the host port of web to 8081
+   2. Run docker compose up again
+"""
+    result = _parse_ai_response(response)
+
+    assert result["explanation"] == "Port 8080 is already bound by another service."
+    assert result["root_cause"] == "Two services publish the same host port."
+    assert result["fix_steps"] == [
+        "Change the host port of web to 8081",
+        "Run docker compose up again",
+    ]
+
+
+def test_parse_markdown_heading_sections():
+    """Test parsing '## Heading' sections with content on following lines."""
+    response = "## Explanation\nThe tag is missing.\n\n## Root Cause\nDefaults to latest.\n\n## Fix Steps\n* Pin the tag\n"
+    result = _parse_ai_response(response)
+
+    assert result["explanation"] == "The tag is missing."
+    assert result["root_cause"] == "Defaults to latest."
+    assert result["fix_steps"] == ["Pin the tag"]
+
+
+def test_parse_unstructured_falls_back_to_raw_text():
+    """Test that unstructured output is used as the explanation."""
+    result = _parse_ai_response("no sections here")
+
+    assert result["explanation"] == "no sections here"
+    assert result["fix_steps"] == []
+
+
+def test_stream_stops_after_third_fix_step():
+    """Test that a streamed response is cut off once all sections are filled."""
+    text = "**Explanation**: a\n**Root Cause**: b\n**Fix**:\n- one\n- two\n- three\n- four\n- five\n"
+    chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+    consumed = []
+
+    def stream():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    result = _parse_ai_response(_read_error_stream(stream(), lambda chunk: chunk))
+
+    assert result["fix_steps"] == ["one", "two", "three"]
+    assert len(consumed) < len(chunks)
+
+
+def test_split_batch_response_by_error_heading():
+    """Test that a batched answer is split per error, with None for skipped ones."""
+    response = (
+        "### ERROR 2\n**Explanation**: Second.\n\n"
+        "### ERROR 1\n**Explanation**: First.\n"
+    )
+    chunks = _split_batch_response(response, 3)
+
+    assert _parse_ai_response(chunks[0])["explanation"] == "First."
+    assert _parse_ai_response(chunks[1])["explanation"] == "Second."
+    assert chunks[2] is None
+
+
+def test_analyze_errors_batch_uses_one_request(monkeypatch, tmp_path):
+    """Test that uncached errors share a single completion call."""
+    from checkdk.ai import providers
+    from checkdk.ai.cache import LLMCache, SemanticCache
+
+    monkeypatch.setattr(providers, "get_llm_cache", lambda: LLMCache(tmp_path / "c.json"))
+    monkeypatch.setattr(
+        providers, "get_semantic_cache", lambda: SemanticCache(tmp_path / "s.json")
+    )
+    monkeypatch.setattr(SemanticCache, "_get_embedder", lambda self: None)
+
+    class FakeProvider(providers.GroqProvider):
+        calls = 0
+
+        def _complete(self, system, prompt, max_tokens):
+            FakeProvider.calls += 1
+            assert "### ERROR 2" in prompt and max_tokens == 600
+            return "### ERROR 1\nExplanation: a\nFix:\n- do a\n### ERROR 2\nExplanation: b\nFix:\n- do b\n"
+
+    provider = FakeProvider(api_key="real-key")
+    results = provider.analyze_errors_batch([
+        ("Port 80 in use", "ports: [80]", {"service_name": "web"}),
+        ("Image tag missing", "image: nginx", {"service_name": "db"}),
+    ])
+
+    assert FakeProvider.calls == 1
+    assert [r["fix_steps"] for r in results] == [["do a"], ["do b"]]
+
+
+def test_unstructured_fallback_decodes_bytes_and_keeps_words_whole():
+    """Test that byte responses are decoded and the fallback is cut on a word boundary."""
+    response = ("Ports clash between services " * 10).encode("utf-8")  # 200 falls mid-word
+    result = _parse_ai_response(response)
+
+    assert len(result["explanation"]) <= 200
+    assert set(result["explanation"].split()) == {"Ports", "clash", "between", "services"}
+
+
+def test_analyze_errors_batch_retries_skipped_errors_individually(monkeypatch, tmp_path):
+    """Test that an error missing from the batched answer falls back to analyze_error."""
+    from checkdk.ai import providers
+    from checkdk.ai.cache import LLMCache, SemanticCache
+
+    monkeypatch.setattr(providers, "get_llm_cache", lambda: LLMCache(tmp_path / "c.json"))
+    monkeypatch.setattr(providers, "get_semantic_cache", lambda: SemanticCache(tmp_path / "s.json"))
+    monkeypatch.setattr(SemanticCache, "_get_embedder", lambda self: None)
+
+    class FakeProvider(providers.GroqProvider):
+        def _complete(self, system, prompt, max_tokens):
+            return "### ERROR 1\nExplanation: a\nFix:\n- do a\n"
+
+        def analyze_error(self, error_message, config_snippet, context):
+            return {"explanation": "single", "root_cause": "", "fix_steps": ["do b"]}
+
+    results = FakeProvider(api_key="real-key").analyze_errors_batch([
+        ("Port 80 in use", "ports: [80]", {"service_name": "web"}),
+        ("Image tag missing", "image: nginx", {"service_name": "db"}),
+    ])
+
+    assert [r["fix_steps"] for r in results] == [["do a"], ["do b"]]
@@ -0,0 +1,104 @@
+"""Tests for the analysis service."""
+
+from checkdk.models import IssueType, Severity
+from checkdk.services.analysis import analyze_docker_compose
+
+
+def test_repeated_issues_are_reported_once(tmp_path, monkeypatch):
+    """Test that one unset variable used twice yields a single parser issue."""
+    monkeypatch.delenv("CHECKDK_TEST_UNSET", raising=False)
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text(
+        "services:\n"
+        "  web:\n"
+        "    image: nginx:1.25\n"
+        "    command: \"${CHECKDK_TEST_UNSET}\"\n"
+        "  api:\n"
+        "    image: nginx:1.25\n"
+        "    command: \"${CHECKDK_TEST_UNSET}\"\n"
+    )
+
+    result = analyze_docker_compose(compose, use_ai=False)
+
+    unset = [i for i in result.issues if i.message == "Environment variable not set: CHECKDK_TEST_UNSET"]
+    assert len(unset) == 1
+    assert unset[0].type is IssueType.MISSING_ENV_VAR
+    assert len(result.fixes) == len(result.issues)
+
+
+def test_ai_provider_not_resolved_without_critical_issues(tmp_path, monkeypatch):
+    """Test that a file with no critical issues never touches the AI config."""
+    from checkdk.services import analysis
+
+    def _fail():
+        raise AssertionError("AI provider resolved for a clean file")
+
+    monkeypatch.setattr(analysis, "_resolve_ai_provider", _fail)
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text("services:\n  web:\n    image: nginx:1.25\n")
+
+    assert analyze_docker_compose(compose, use_ai=True).success
+
+
+def test_empty_services_skip_validators(tmp_path, monkeypatch):
+    """Test a file without services reports one issue and runs no validators."""
+    from checkdk.services import analysis
+
+    def _fail(checks):
+        raise AssertionError("validators run for a file without services")
+
+    monkeypatch.setattr(analysis, "_run_validators", _fail)
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text("services: {}\n")
+
+    result = analyze_docker_compose(compose, use_ai=False)
+
+    assert [i.message for i in result.issues] == ["No services defined in Docker Compose file"]
+    assert not result.success
+
+
+def test_include_fixes_false_skips_fixes_and_ai(tmp_path, monkeypatch):
+    """Test that an issues-only analysis builds no fixes and never resolves AI."""
+    from checkdk.services import analysis
+
+    def _fail():
+        raise AssertionError("AI provider resolved for an issues-only analysis")
+
+    monkeypatch.setattr(analysis, "_resolve_ai_provider", _fail)
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text("services:\n  web:\n    build: .\n    depends_on: [db]\n")
+
+    result = analyze_docker_compose(compose, use_ai=True, include_fixes=False)
+
+    assert result.issues and not result.success
+    assert result.fixes == []
+    assert result.fix_for(0) is None
+
+
+def test_min_severity_drops_lesser_issues_before_fixes(tmp_path):
+    """Test that a critical-only analysis returns only critical issues and their fixes."""
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text("services:\n  web:\n    image: nginx\n  api:\n    build: .\n    depends_on: [db]\n")
+
+    full = analyze_docker_compose(compose, use_ai=False)
+    critical = analyze_docker_compose(compose, use_ai=False, min_severity=Severity.CRITICAL)
+
+    assert any(i.severity is Severity.WARNING for i in full.issues)
+    assert critical.issues == [i for i in full.issues if i.severity is Severity.CRITICAL]
+    assert len(critical.fixes) == len(critical.issues) > 0
+
+
+def test_kubernetes_validators_skipped_for_absent_kinds(tmp_path, monkeypatch):
+    """Test a manifest with no workloads or Services runs no validators."""
+    from checkdk.services import analysis
+    from checkdk.services.analysis import analyze_kubernetes
+
+    seen = []
+    run = analysis._run_validators
+    monkeypatch.setattr(analysis, "_run_validators", lambda checks: seen.append(len(checks)) or run(checks))
+    manifest = tmp_path / "config.yaml"
+    manifest.write_text("kind: ConfigMap\nmetadata: {name: cfg}\n---\nkind: Service\nmetadata: {name: web}\nspec: {}\n")
+
+    result = analyze_kubernetes(manifest)
+
+    assert result.success and seen == [1]
@@ -0,0 +1,93 @@
+"""Tests for Docker Compose validator."""
+
+from checkdk.validators.compose_validator import DockerComposeValidator
+
+
+def test_validate_all_matches_individual_checks():
+    """Test the fused single-pass run reports exactly what the six checks do, in order."""
+    config = {
+        'services': {
+            'web': {
+                'image': 'nginx',
+                'depends_on': ['db'],
+                'volumes': ['data:/srv', './src:/app'],
+                'networks': ['front'],
+                'environment': ['TOKEN=${TOKEN}'],
+                'restart': 'always',
+            },
+            'worker': {'build': '.', 'links': ['queue:q']},
+            'broken': 'not-a-mapping',
+        },
+    }
+
+    separate = []
+    for check in (
+        DockerComposeValidator.validate_images,
+        DockerComposeValidator.validate_environment_variables,
+        DockerComposeValidator.validate_dependencies,
+        DockerComposeValidator.validate_volumes,
+        DockerComposeValidator.validate_networks,
+        DockerComposeValidator.validate_resource_limits,
+    ):
+        separate.extend(check(config))
+
+    fused = DockerComposeValidator.validate_all(config)
+
+    assert [(i.type, i.message) for i in fused] == [(i.type, i.message) for i in separate]
+    assert len(fused) == 7
+
+
+def test_env_reference_flagged_once_per_service():
+    """Test a variable referenced by several entries yields one issue per service."""
+    config = {
+        'services': {
+            'web': {'image': 'nginx:1.25', 'environment': ['A=${DB_HOST}', 'B=${DB_HOST}/x', 'C=${PORT:-80}']},
+            'api': {'image': 'nginx:1.25', 'environment': {'URL': '${DB_HOST}'}},
+        },
+    }
+
+    issues = DockerComposeValidator.validate_environment_variables(config)
+
+    assert [(i.service_name, i.details['variable'], i.details['entry']) for i in issues] == [
+        ('web', 'DB_HOST', 'A=${DB_HOST}'),
+        ('api', 'DB_HOST', 'URL=${DB_HOST}'),
+    ]
+
+
+def test_relative_bind_mounts_are_not_named_volumes():
+    """Test '.', '../' and './' sources are treated as host paths."""
+    config = {
+        'services': {
+            'web': {'image': 'nginx:1.25', 'volumes': ['.:/app', '../shared:/shared', './conf:/etc/conf', 'data:/data']},
+        },
+    }
+
+    issues = DockerComposeValidator.validate_volumes(config)
+
+    assert [i.details['volume'] for i in issues] == ['data']
+
+
+def test_image_tag_check_handles_registry_ports_and_digests():
+    """Test a registry port is not taken for a tag and a digest counts as pinned."""
+    images = {
+        'a': 'nginx', 'b': 'nginx:latest', 'c': 'registry:5000/app',
+        'd': 'registry:5000/app:1.2', 'e': 'app@sha256:abc', 'f': 'nginx:1.25',
+    }
+    config = {'services': {name: {'image': image} for name, image in images.items()}}
+
+    issues = DockerComposeValidator.validate_images(config)
+
+    assert [i.service_name for i in issues] == ['a', 'b', 'c']
+
+
+def test_non_string_service_names_are_validated():
+    """Test that integer service names (``80:``) work like string ones.
+
+    Guards the mypyc build, which checks ``service_name`` annotations at runtime.
+    """
+    config = {'services': {80: {'image': 'nginx', 'restart': 'always', 'depends_on': ['db']}}}
+
+    issues = DockerComposeValidator.validate_all(config)
+
+    assert len(issues) == 3
+    assert all(i.service_name == 80 for i in issues)
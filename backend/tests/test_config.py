@@ -0,0 +1,109 @@
+"""Tests for configuration loading."""
+
+import os
+
+import pytest
+import yaml
+
+from checkdk.config import CheckDKConfig
+
+
+def test_load_writes_and_reuses_json_sidecar(tmp_path):
+    """Test that a parsed config is cached as JSON and served from it."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("timeout: 45\nai:\n  provider: groq\n")
+
+    config = CheckDKConfig.load(config_path)
+    sidecar = tmp_path / "config.yaml.json"
+
+    assert config.timeout == 45
+    assert sidecar.exists()
+
+    # A newer sidecar wins over the YAML
+    sidecar.write_text('{"timeout": 99}')
+    assert CheckDKConfig.load(config_path).timeout == 99
+
+
+def test_load_ignores_stale_sidecar(tmp_path):
+    """Test that editing the YAML invalidates an older sidecar."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("timeout: 45\n")
+    CheckDKConfig.load(config_path)
+
+    config_path.write_text("timeout: 10\n")
+    sidecar = tmp_path / "config.yaml.json"
+    old = config_path.stat().st_mtime_ns - 1_000_000_000
+    os.utime(sidecar, ns=(old, old))
+
+    assert CheckDKConfig.load(config_path).timeout == 10
+
+
+def test_load_ignores_non_mapping_sidecar(tmp_path):
+    """Test that a sidecar holding a JSON list or null falls back to the YAML."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("timeout: 45\n")
+    sidecar = tmp_path / "config.yaml.json"
+
+    for payload in ("[]", "null"):
+        sidecar.write_text(payload)
+        assert CheckDKConfig.load(config_path).timeout == 45
+
+
+def test_save_refreshes_sidecar(tmp_path):
+    """Test that save() rewrites the sidecar so the next load skips YAML."""
+    config_path = tmp_path / "config.yaml"
+    CheckDKConfig(timeout=12).save(config_path)
+    sidecar = tmp_path / "config.yaml.json"
+
+    assert sidecar.stat().st_mtime_ns >= config_path.stat().st_mtime_ns
+    assert CheckDKConfig.load(config_path).timeout == 12
+
+
+def test_load_missing_file_returns_defaults(tmp_path):
+    """Test that a missing config file yields the defaults."""
+    config = CheckDKConfig.load(tmp_path / "missing.yaml")
+
+    assert config == CheckDKConfig()
+
+
+def test_get_config_is_memoised_and_cleared_by_save(tmp_path, monkeypatch):
+    """Test that get_config loads once and save() invalidates it."""
+    from checkdk import config as config_module
+
+    monkeypatch.setattr(config_module.Path, "home", lambda: tmp_path)
+    config_module.get_config.cache_clear()
+
+    first = config_module.get_config()
+    assert config_module.get_config() is first
+
+    CheckDKConfig(timeout=7).save()
+    assert config_module.get_config().timeout == 7
+    config_module.get_config.cache_clear()
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+def test_yaml_loader_uses_libyaml():
+    """Test that PyYAML's C loader is picked when it is available."""
+    from checkdk.config import YAML_LOADER, load_yaml, load_yaml_all
+
+    assert YAML_LOADER is yaml.CSafeLoader
+    assert load_yaml("a: 1") == {"a": 1}
+    assert list(load_yaml_all("a: 1\n---\nb: 2\n")) == [{"a": 1}, {"b": 2}]
+
+
+def test_yaml_loader_falls_back_without_libyaml(monkeypatch):
+    """Test that a pure-Python PyYAML install uses the SafeLoader/SafeDumper pair."""
+    import importlib
+
+    import checkdk.config as config_module
+
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    monkeypatch.delattr(yaml, "CSafeDumper", raising=False)
+    try:
+        importlib.reload(config_module)
+        assert config_module.YAML_LOADER is yaml.SafeLoader
+        assert config_module.YAML_DUMPER is yaml.SafeDumper
+        assert config_module.load_yaml("a: 1") == {"a": 1}
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config_module)
@@ -1,10 +1,11 @@
 """Tests for Docker Compose parser."""
 
+import os
 import pytest
 from pathlib import Path
 import tempfile
-import yaml
 
+from checkdk.config import dump_yaml
 from checkdk.parsers import DockerComposeParser
 from checkdk.models import IssueType, Severity
 
@@ -21,20 +22,13 @@ def test_parse_valid_compose_file():
         }
     }
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-        yaml.dump(config, f)
-        temp_path = f.name
+    parser = DockerComposeParser.from_string(dump_yaml(config))
+    result = parser.parse()
     
-    try:
-        parser = DockerComposeParser(temp_path)
-        result = parser.parse()
-        
-        assert result.version == '3.8'
-        assert 'web' in result.services
-        assert result.services['web']['image'] == 'nginx:latest'
-        assert len(parser.issues) == 0
-    finally:
-        Path(temp_path).unlink()
+    assert result.version == '3.8'
+    assert 'web' in result.services
+    assert result.services['web']['image'] == 'nginx:latest'
+    assert len(parser.issues) == 0
 
 
 def test_parse_missing_file():
@@ -49,18 +43,11 @@ def test_parse_missing_file():
 
 def test_parse_invalid_yaml():
     """Test parsing invalid YAML."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-        f.write("invalid: yaml: content:")
-        temp_path = f.name
+    parser = DockerComposeParser.from_string("invalid: yaml: content:")
+    result = parser.parse()
     
-    try:
-        parser = DockerComposeParser(temp_path)
-        result = parser.parse()
-        
-        assert len(parser.issues) >= 1
-        assert any(issue.type == IssueType.INVALID_YAML for issue in parser.issues)
-    finally:
-        Path(temp_path).unlink()
+    assert len(parser.issues) >= 1
+    assert any(issue.type == IssueType.INVALID_YAML for issue in parser.issues)
 
 
 def test_service_without_image_or_build():
@@ -74,16 +61,90 @@ def test_service_without_image_or_build():
         }
     }
     
+    parser = DockerComposeParser.from_string(dump_yaml(config))
+    result = parser.parse()
+    
+    assert len(parser.issues) >= 1
+    assert any('image' in issue.message.lower() or 'build' in issue.message.lower() 
+               for issue in parser.issues)
+
+
+def test_reparse_picks_up_file_changes():
+    """Test the YAML load cache is invalidated when the file is rewritten."""
     with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-        yaml.dump(config, f)
+        dump_yaml({'services': {'web': {'image': 'nginx:1.25'}}}, f)
         temp_path = f.name
-    
+
     try:
-        parser = DockerComposeParser(temp_path)
-        result = parser.parse()
-        
-        assert len(parser.issues) >= 1
-        assert any('image' in issue.message.lower() or 'build' in issue.message.lower() 
-                   for issue in parser.issues)
+        first = DockerComposeParser(temp_path).parse()
+        assert first.raw_config['services']['web']['image'] == 'nginx:1.25'
+
+        # Same size and mtime as before: only the content tells them apart
+        before = Path(temp_path).stat()
+        with open(temp_path, 'w') as f:
+            dump_yaml({'services': {'api': {'image': 'nginx:1.26'}}}, f)
+        os.utime(temp_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert Path(temp_path).stat().st_size == before.st_size
+
+        second = DockerComposeParser(temp_path).parse()
+        assert list(second.services) == ['api']
+        assert second.raw_config['services'] == second.services
     finally:
         Path(temp_path).unlink()
+
+
+def test_env_resolution_does_not_touch_cached_document(tmp_path, monkeypatch):
+    """Test that re-parsing after an env change sees the new value."""
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text("services:\n  web:\n    image: \"nginx:${CHECKDK_TEST_TAG:-1.25}\"\n")
+
+    monkeypatch.setenv("CHECKDK_TEST_TAG", "1.26")
+    assert DockerComposeParser(str(compose)).parse().services['web']['image'] == 'nginx:1.26'
+
+    monkeypatch.delenv("CHECKDK_TEST_TAG")
+    assert DockerComposeParser(str(compose)).parse().services['web']['image'] == 'nginx:1.25'
+
+
+def test_file_without_env_refs_skips_resolution(tmp_path, monkeypatch):
+    """Test that a file with no ``${`` never walks the document for variables."""
+    def _fail(self, config):
+        raise AssertionError("env resolution ran for a file without references")
+
+    monkeypatch.setattr(DockerComposeParser, "_resolve_env_vars", _fail)
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text("services:\n  web:\n    image: nginx:1.25\n    command: echo $HOME\n")
+
+    parser = DockerComposeParser(str(compose))
+    assert parser.parse().services['web']['command'] == 'echo $HOME'
+    assert parser.issues == []
+
+
+def test_unset_variable_reported_once_per_parse(tmp_path, monkeypatch):
+    """Test an unset variable used in several places yields a single issue."""
+    monkeypatch.delenv("CHECKDK_TEST_UNSET", raising=False)
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text(
+        "services:\n"
+        "  web:\n    image: \"nginx:${CHECKDK_TEST_UNSET}\"\n"
+        "    environment: [\"A=${CHECKDK_TEST_UNSET}\", \"B=${CHECKDK_TEST_UNSET}\"]\n"
+        "  api:\n    image: \"api:${CHECKDK_TEST_UNSET}\"\n"
+    )
+
+    parser = DockerComposeParser(str(compose))
+    parser.parse()
+    assert [i.details['variable'] for i in parser.issues] == ['CHECKDK_TEST_UNSET']
+
+
+def test_get_ports_normalises_short_and_long_syntax(tmp_path):
+    """Test get_ports keeps short mappings and renders long ones."""
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text(
+        "services:\n  web:\n    image: nginx:1.25\n    ports:\n"
+        "      - \"8080:80\"\n      - {target: 443, published: 8443}\n      - {target: 9000}\n"
+    )
+
+    parser = DockerComposeParser(str(compose))
+    parser.parse()
+
+    assert parser.get_ports('web') == ['8080:80', '8443:443', '9000:9000']
+    assert parser.get_ports('missing') == []
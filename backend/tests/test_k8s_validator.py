@@ -0,0 +1,144 @@
+"""Tests for Kubernetes validator."""
+
+from checkdk.models import IssueType
+from checkdk.parsers.kubernetes_parser import KubernetesResources
+from checkdk.validators.k8s_validator import KubernetesValidator
+
+
+def _workload(kind, name, selector, labels):
+    return {
+        'kind': kind,
+        'metadata': {'name': name},
+        'spec': {
+            'selector': {'matchLabels': selector},
+            'template': {'metadata': {'labels': labels}, 'spec': {'containers': []}},
+        },
+    }
+
+
+def test_validate_labels_uses_kind_index():
+    """Test label checks give the same result on parser output and plain lists."""
+    resources = [
+        _workload('Deployment', 'web', {'app': 'web'}, {'app': 'web', 'tier': 'front'}),
+        {'kind': 'Service', 'metadata': {'name': 'web'}, 'spec': {}},
+        _workload('StatefulSet', 'db', {'app': 'db'}, {'app': 'database'}),
+        _workload('DaemonSet', 'agent', {'app': 'agent', 'tier': 'ops'}, {'app': 'agent'}),
+    ]
+
+    indexed = KubernetesValidator.validate_labels(KubernetesResources.from_documents(resources))
+    plain = KubernetesValidator.validate_labels(resources)
+
+    assert [i.service_name for i in indexed] == [i.service_name for i in plain] == ['db', 'agent']
+    assert all(i.type is IssueType.LABEL_MISMATCH for i in indexed)
+
+
+def test_workload_containers_from_pod_and_template():
+    """Test Pods read spec.containers and workloads their pod template's."""
+    pod = {'kind': 'Pod', 'metadata': {'name': 'p', 'namespace': 'ns'},
+           'spec': {'containers': [{'name': 'app', 'image': 'app:1'}]}}
+    bare = {'kind': 'Deployment', 'metadata': None, 'spec': {'template': None}}
+
+    issues = KubernetesValidator.validate_security([pod, bare])
+
+    assert [(i.service_name, i.details['namespace']) for i in issues] == [('p', 'ns')]
+    assert KubernetesValidator.validate_probes([bare]) == []
+
+
+def test_duplicate_service_port_per_protocol():
+    """Test a repeated port is flagged only when the protocol matches too."""
+    service = {
+        'kind': 'Service',
+        'metadata': {'name': 'dns'},
+        'spec': {'ports': [{'port': 53}, {'port': 53, 'protocol': 'UDP'}, {'port': 53, 'protocol': 'TCP'}]},
+    }
+
+    issues = KubernetesValidator.validate_services([service])
+
+    assert [(i.details['port'], i.details['protocol']) for i in issues] == [(53, 'TCP')]
+
+
+def test_shared_nodeport_is_one_issue():
+    """Test a NodePort claimed by several Services is reported once."""
+    def _service(name, node_port):
+        return {'kind': 'Service', 'metadata': {'name': name},
+                'spec': {'type': 'NodePort', 'ports': [{'port': 80, 'nodePort': node_port}]}}
+
+    issues = KubernetesValidator.validate_services(
+        [_service('a', 30080), _service('b', '30080'), _service('c', 30080), _service('d', 30081)]
+    )
+
+    assert [i.message for i in issues] == ["NodePort 30080 is used by multiple services: 'a', 'b' and 'c'"]
+    assert issues[0].service_name == 'b'
+
+
+def test_deployment_checks_keep_image_issues_first():
+    """Test image-tag issues precede resource-limit issues within a deployment."""
+    deployment = {
+        'kind': 'Deployment',
+        'metadata': {'name': 'web'},
+        'spec': {'template': {'spec': {'containers': [
+            {'name': 'app', 'image': 'app:latest'},
+            {'name': 'proxy', 'image': 'envoy', 'resources': {'limits': {'cpu': '1'}}},
+            {'name': 'log', 'image': 'fluent:1.0', 'resources': None},
+        ]}}},
+    }
+
+    issues = KubernetesValidator.validate_deployments([deployment])
+
+    assert [(i.type, i.details['container']) for i in issues] == [
+        (IssueType.IMAGE_VERSION, 'app'),
+        (IssueType.IMAGE_VERSION, 'proxy'),
+        (IssueType.RESOURCE_LIMIT, 'app'),
+        (IssueType.RESOURCE_LIMIT, 'log'),
+    ]
+
+
+def test_aliased_selector_and_labels_match(tmp_path):
+    """Test a selector aliasing the template labels via a YAML anchor passes."""
+    from checkdk.parsers.kubernetes_parser import KubernetesParser
+
+    manifest = tmp_path / "app.yaml"
+    manifest.write_text(
+        "kind: Deployment\nmetadata: {name: web}\n"
+        "spec:\n  selector:\n    matchLabels: &labels {app: web}\n"
+        "  template:\n    metadata:\n      labels: *labels\n"
+    )
+
+    resources = KubernetesParser.parse(str(manifest))
+    spec = resources[0]['spec']
+
+    assert spec['selector']['matchLabels'] is spec['template']['metadata']['labels']
+    assert KubernetesValidator.validate_labels(resources) == []
+
+
+def test_non_string_metadata_is_passed_through():
+    """Test that YAML names/namespaces that are not strings do not break validation.
+
+    The mypyc build enforces annotations at runtime, so this guards against
+    the compiled and interpreted validators diverging on such input.
+    """
+    resources = [
+        {
+            'kind': 'Deployment',
+            'metadata': {'name': 123, 'namespace': None},
+            'spec': {'template': {'spec': {'containers': [{'name': 'app', 'image': 'nginx'}]}}},
+        },
+        {
+            'kind': 'Service',
+            'metadata': {'name': 456},
+            'spec': {'type': 'NodePort', 'ports': [{'port': 80, 'nodePort': 30080}]},
+        },
+    ]
+
+    for check in (
+        KubernetesValidator.validate_deployments,
+        KubernetesValidator.validate_security,
+        KubernetesValidator.validate_probes,
+        KubernetesValidator.validate_labels,
+        KubernetesValidator.validate_services,
+    ):
+        check(resources)
+
+    issues = KubernetesValidator.validate_deployments(resources)
+    assert issues and all(i.service_name == 123 for i in issues)
+    assert issues[0].details['namespace'] is None
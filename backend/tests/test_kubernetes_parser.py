@@ -0,0 +1,88 @@
+"""Tests for Kubernetes parser."""
+
+from checkdk.parsers.kubernetes_parser import KubernetesParser
+
+
+def test_kubernetes_parse_is_memoised_on_content(tmp_path):
+    """Test that identical manifests at different paths share one parse."""
+    manifest = "apiVersion: v1\nkind: Service\nmetadata:\n  name: web\n---\n"
+    first, second = tmp_path / "a.yaml", tmp_path / "b.yaml"
+    first.write_text(manifest)
+    second.write_text(manifest)
+
+    resources = KubernetesParser.parse(str(first))
+    again = KubernetesParser.parse(str(second))
+
+    assert [r["kind"] for r in resources] == ["Service"]
+    assert again is not resources and again[0] is resources[0]
+
+    second.write_text(manifest.replace("web", "api"))
+    assert KubernetesParser.parse(str(second))[0]["metadata"]["name"] == "api"
+
+
+def test_large_manifest_is_streamed_not_cached(tmp_path, monkeypatch):
+    """Test that manifests over the cache limit are parsed straight from the file."""
+    from checkdk.parsers import kubernetes_parser
+
+    monkeypatch.setattr(kubernetes_parser, "_MAX_CACHED_BYTES", 16)
+    manifest = tmp_path / "big.yaml"
+    manifest.write_text("kind: Service\n---\n\n---\nkind: Deployment\n")
+
+    before = kubernetes_parser._parse_documents.cache_info().currsize
+    resources = KubernetesParser.parse(str(manifest))
+
+    assert [r["kind"] for r in resources] == ["Service", "Deployment"]
+    assert kubernetes_parser._parse_documents.cache_info().currsize == before
+
+
+def test_of_kind_keeps_document_order_across_kinds(tmp_path):
+    """Test the kind index returns multi-kind matches in file order."""
+    manifest = tmp_path / "app.yaml"
+    manifest.write_text(
+        "kind: StatefulSet\nmetadata: {name: db}\n---\n"
+        "kind: Service\nmetadata: {name: web}\n---\n"
+        "kind: Deployment\nmetadata: {name: web}\n---\n"
+        "kind: StatefulSet\nmetadata: {name: cache}\n"
+    )
+
+    resources = KubernetesParser.parse(str(manifest))
+
+    names = [r["metadata"]["name"] for r in resources.of_kind("Deployment", "StatefulSet")]
+    assert names == ["db", "web", "cache"]
+    assert KubernetesParser.get_services(resources) == [resources[1]]
+    assert KubernetesParser.get_pods(list(resources)) == []
+
+
+def test_namespaces_collected_with_kind_index(tmp_path):
+    """Test get_namespaces reads the set gathered alongside the kind index."""
+    manifest = tmp_path / "app.yaml"
+    manifest.write_text(
+        "kind: Service\nmetadata: {name: web, namespace: shop}\n---\n"
+        "kind: Deployment\nmetadata: {name: web, namespace: shop}\n---\n"
+        "kind: Deployment\nmetadata: {name: api, namespace: billing}\n---\n"
+        "kind: ConfigMap\nmetadata: {name: cfg}\n"
+    )
+
+    resources = KubernetesParser.parse(str(manifest))
+
+    assert sorted(KubernetesParser.get_namespaces(resources)) == ["billing", "shop"]
+    assert sorted(KubernetesParser.get_namespaces(list(resources))) == ["billing", "shop"]
+
+
+def test_from_documents_indexes_while_collecting():
+    """Test the one-pass constructor matches the lazily built index."""
+    from checkdk.parsers.kubernetes_parser import KubernetesResources
+
+    docs = [
+        {"kind": "Service", "metadata": {"name": "web", "namespace": "shop"}},
+        None,
+        {"kind": "Deployment", "metadata": {"name": "web"}},
+        {"kind": "Service", "metadata": {"name": "api"}},
+    ]
+
+    built = KubernetesResources.from_documents(iter(docs))
+    lazy = KubernetesResources(d for d in docs if d)
+
+    assert built == lazy
+    assert built.of_kind("Service") == lazy.of_kind("Service") == [docs[0], docs[3]]
+    assert built.namespaces == lazy.namespaces == {"shop"}
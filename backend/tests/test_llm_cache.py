@@ -0,0 +1,87 @@
+"""Tests for the persistent LLM response cache."""
+
+import pytest
+
+from checkdk.ai.cache import LLMCache, SemanticCache, normalize_error
+
+
+def test_cache_roundtrip_persists_to_disk(tmp_path):
+    """Test that flushed entries are visible to a fresh cache instance."""
+    path = tmp_path / "llm_cache.json"
+    key = LLMCache.make_key("groq", "llama", "Port 80 in use", "ports: [80]", "web")
+
+    cache = LLMCache(path)
+    assert cache.get(key) is None
+    cache.set(key, {"explanation": "x", "root_cause": "y", "fix_steps": ["z"]})
+    cache.flush()
+
+    reloaded = LLMCache(path)
+    assert reloaded.get(key) == {"explanation": "x", "root_cause": "y", "fix_steps": ["z"]}
+
+
+def test_cache_key_depends_on_every_input():
+    """Test that changing any key component yields a different key."""
+    base = ("groq", "llama", "err", "cfg", "web")
+    keys = {LLMCache.make_key(*base)}
+    for i in range(len(base)):
+        changed = list(base)
+        changed[i] = f"{changed[i]}-other"
+        keys.add(LLMCache.make_key(*changed))
+    assert len(keys) == len(base) + 1
+
+
+def test_cache_ignores_corrupt_file(tmp_path):
+    """Test that an unreadable cache file is treated as empty."""
+    path = tmp_path / "llm_cache.json"
+    path.write_text("{not json")
+    assert LLMCache(path).get("anything") is None
+
+
+def test_normalize_error_masks_ports_and_ids():
+    """Test that volatile tokens are masked before embedding."""
+    assert normalize_error("bind for 0.0.0.0:5432 failed") == normalize_error(
+        "bind for 0.0.0.0:5433 failed"
+    )
+    assert "3f2a9c1b7d4e" not in normalize_error("container 3f2a9c1b7d4e exited")
+
+
+def test_semantic_cache_requires_matching_scope(tmp_path):
+    """Test near-duplicate hits need the same service, provider, model and config."""
+    pytest.importorskip("numpy")
+    # Toy embedder: identical normalised text -> identical vector
+    embedder = lambda text: [float(len(text)), float(text.count("N")), 1.0]
+    cache = SemanticCache(tmp_path / "semantic.json", embedder=embedder)
+    result = {"explanation": "port busy", "root_cause": "", "fix_steps": ["free it"]}
+    scope = SemanticCache.scope("GroqProvider", "llama", "ports: [5432]", "db")
+
+    cache.set("Port 5432 is already in use", scope, result)
+
+    assert cache.get("Port 5433 is already in use", scope) == result
+    for other in (
+        SemanticCache.scope("GroqProvider", "llama", "ports: [5432]", "web"),
+        SemanticCache.scope("MistralProvider", "llama", "ports: [5432]", "db"),
+        SemanticCache.scope("GroqProvider", "mixtral", "ports: [5432]", "db"),
+        SemanticCache.scope("GroqProvider", "llama", "ports: [5433]", "db"),
+    ):
+        assert cache.get("Port 5433 is already in use", other) is None
+
+
+def test_semantic_cache_disabled_never_loads_model(tmp_path, monkeypatch):
+    """Test that a cache not opted in skips the embedding model entirely."""
+    cache = SemanticCache(tmp_path / "semantic.json", enabled=False)
+    monkeypatch.setattr(cache, "_load", lambda: [{"embedding": [1.0]}])
+
+    assert cache._get_embedder() is None
+    assert cache.get("Port 80 in use", SemanticCache.scope("p", "m", "", None)) is None
+
+
+def test_cache_instances_do_not_register_exit_hooks(tmp_path, monkeypatch):
+    """Test that only the process-wide singletons flush at exit."""
+    import atexit
+
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    LLMCache(tmp_path / "c.json")
+    SemanticCache(tmp_path / "s.json")
+
+    assert registered == []
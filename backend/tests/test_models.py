@@ -0,0 +1,61 @@
+"""Tests for data models."""
+
+from checkdk.models import AnalysisResult, Fix, Issue, IssueType, Severity
+
+
+def _issue(severity: Severity) -> Issue:
+    return Issue(type=IssueType.PORT_CONFLICT, severity=severity, message="Port 80 in use")
+
+
+def test_severity_checks_use_counts_from_construction():
+    """Test has_critical_errors / has_warnings on a freshly built result."""
+    result = AnalysisResult(success=False, issues=[_issue(Severity.CRITICAL), _issue(Severity.INFO)])
+
+    assert result.has_critical_errors()
+    assert not result.has_warnings()
+
+
+def test_severity_counts_follow_issue_list_changes():
+    """Test that appending or replacing issues refreshes the cached counts."""
+    result = AnalysisResult(success=True)
+    assert not result.has_warnings()
+
+    result.issues.append(_issue(Severity.WARNING))
+    assert result.has_warnings()
+
+    result.issues = [_issue(Severity.CRITICAL)]
+    assert result.has_critical_errors()
+    assert not result.has_warnings()
+
+    result.issues[0] = _issue(Severity.INFO)
+    result.invalidate()
+    assert not result.has_critical_errors()
+
+
+def test_fix_for_pairs_fixes_with_issues_by_position():
+    """Test fix_for returns the parallel fix, even for same-type issues on one service."""
+    fixes = [Fix(description=f"Free port {port}", steps=[]) for port in (80, 443)]
+    result = AnalysisResult(success=False, issues=[_issue(Severity.CRITICAL)] * 2, fixes=fixes)
+
+    assert result.fix_for(1).description == "Free port 443"
+    assert result.fix_for(2) is None
+    assert AnalysisResult(success=False, issues=[_issue(Severity.CRITICAL)]).fix_for(0) is None
+
+
+def test_enum_members_are_singletons_after_validation():
+    """Test severities/types are the enum members themselves, so ``is`` comparisons hold."""
+    issue = Issue(type="port_conflict", severity="critical", message="Port 80 in use")
+
+    assert Severity("critical") is Severity.CRITICAL
+    assert issue.severity is Severity.CRITICAL
+    assert issue.type is IssueType.PORT_CONFLICT
+    assert Issue.model_validate_json(issue.model_dump_json()).severity is Severity.CRITICAL
+
+
+def test_fast_constructors_match_validated_models():
+    """Test Issue.fast / Fix.fast give the same models as the validating constructors."""
+    kwargs = dict(type=IssueType.PORT_CONFLICT, severity=Severity.CRITICAL, message="Port 80 in use")
+
+    assert Issue.fast(**kwargs) == Issue(**kwargs)
+    assert Issue.fast(**kwargs).details == {}
+    assert Fix.fast(description="Free it", steps=["stop nginx"]) == Fix(description="Free it", steps=["stop nginx"])
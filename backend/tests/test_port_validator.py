@@ -69,3 +69,108 @@ def test_extract_host_port_formats():
     
     # Invalid format
     assert validator._extract_host_port("invalid") is None
+
+
+def test_probe_ports_checks_all_ports_together():
+    """Test the batched localhost probe finds a listener and skips free ports."""
+    import socket
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener, \
+            socket.socket(socket.AF_INET, socket.SOCK_STREAM) as unused:
+        listener.bind(('127.0.0.1', 0))
+        listener.listen()
+        unused.bind(('127.0.0.1', 0))  # bound but not listening: refused
+        busy, free = listener.getsockname()[1], unused.getsockname()[1]
+
+        assert PortValidator._probe_ports([busy, free]) == {busy}
+
+
+def _no_probe(ports):
+    raise AssertionError("ports probed although the socket table was readable")
+
+
+def test_port_owners_from_one_connection_snapshot(monkeypatch):
+    """Test that one net_connections call finds every busy port and its owner."""
+    from types import SimpleNamespace
+    from checkdk.validators import port_validator
+
+    calls = []
+
+    def _connections(kind):
+        calls.append(kind)
+        return [
+            SimpleNamespace(laddr=SimpleNamespace(port=port), status='LISTEN', pid=pid)
+            for port, pid in ((8080, 41), (8081, 41), (9000, None), (5432, 42))
+        ]
+
+    class _Process:
+        def __init__(self, pid):
+            self.pid = pid
+
+        def name(self):
+            return f"proc{self.pid}"
+
+        def cmdline(self):
+            return ["proc", "--serve"]
+
+    monkeypatch.setattr(port_validator.psutil, "net_connections", _connections)
+    monkeypatch.setattr(port_validator.psutil, "Process", _Process)
+    monkeypatch.setattr(PortValidator, "_probe_ports", staticmethod(_no_probe))
+    config = DockerComposeConfig(services={'web': {'image': 'nginx', 'ports': ['8080:80', '8081:81', '9000:9000']}})
+
+    messages = [i.message for i in PortValidator().validate(config)]
+
+    assert calls == ['tcp']
+    assert messages == [
+        "Port 8080 on service 'web' is already in use by proc41 (PID 41)",
+        "Port 8081 on service 'web' is already in use by proc41 (PID 41)",
+        "Port 9000 on service 'web' is already in use",
+    ]
+
+
+def test_port_shared_by_three_services_is_one_issue(monkeypatch):
+    """Test a host port published by several services yields one conflict naming all of them."""
+    from checkdk.validators import port_validator
+
+    monkeypatch.setattr(port_validator.psutil, "net_connections", lambda kind: [])
+    config = DockerComposeConfig(services={
+        name: {'image': 'nginx', 'ports': ['8080:80']} for name in ('web', 'api', 'admin')
+    })
+
+    issues = PortValidator().validate(config)
+
+    assert [i.message for i in issues] == [
+        "Port 8080 is used by multiple services: 'web', 'api' and 'admin'"
+    ]
+    assert issues[0].details['services'] == ('web', 'api', 'admin')
+
+
+def test_unreadable_socket_table_falls_back_to_probing(monkeypatch):
+    """Test ports are probed when net_connections is denied."""
+    from checkdk.validators import port_validator
+
+    def _denied(kind):
+        raise port_validator.psutil.AccessDenied()
+
+    probed = []
+    monkeypatch.setattr(port_validator.psutil, "net_connections", _denied)
+    monkeypatch.setattr(PortValidator, "_probe_ports", staticmethod(lambda ports: probed.append(ports) or {3000}))
+    config = DockerComposeConfig(services={'web': {'image': 'node', 'ports': ['3000:3000']}})
+
+    issues = PortValidator().validate(config)
+
+    assert probed == [{3000}]
+    assert [i.message for i in issues] == ["Port 3000 on service 'web' is already in use"]
+
+
+def test_validators_are_slotted_and_must_override_validate():
+    """Test validators carry no __dict__ and a missing validate() fails at construction."""
+    from checkdk.validators import BaseValidator
+
+    assert not hasattr(PortValidator(), '__dict__')
+
+    class Incomplete(BaseValidator):
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        Incomplete()
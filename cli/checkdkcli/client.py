@@ -10,7 +10,8 @@ import os
 from pathlib import Path
 from typing import Optional
 
-import requests
+# requests is imported inside each call: it costs ~80 ms at start-up and
+# commands such as ``--help`` or ``init`` never touch the network.
 
 _DEFAULT_TIMEOUT = 60  # seconds
 
@@ -74,6 +75,8 @@ def _post(path: str, payload: dict, timeout: int = _DEFAULT_TIMEOUT) -> dict:
 
     Raises requests.HTTPError on non-2xx responses.
     """
+    import requests
+
     url = f"{get_api_url()}{path}"
     resp = requests.post(url, json=payload, headers=_auth_headers(), timeout=timeout)
     resp.raise_for_status()
@@ -82,6 +85,8 @@ def _post(path: str, payload: dict, timeout: int = _DEFAULT_TIMEOUT) -> dict:
 
 def _get(path: str, timeout: int = _DEFAULT_TIMEOUT) -> dict:
     """GET from the API and return the parsed JSON body."""
+    import requests
+
     url = f"{get_api_url()}{path}"
     resp = requests.get(url, headers=_auth_headers(), timeout=timeout)
     resp.raise_for_status()
@@ -90,6 +95,8 @@ def _get(path: str, timeout: int = _DEFAULT_TIMEOUT) -> dict:
 
 def health_check() -> bool:
     """Return True if the backend is reachable and healthy."""
+    import requests
+
     try:
         resp = requests.get(f"{get_api_url()}/health", timeout=5)
         return resp.status_code == 200
@@ -100,20 +107,27 @@ def health_check() -> bool:
 # ── Analysis helpers ──────────────────────────────────────────────────────────
 
 def analyze_docker_compose(content: str, filename: Optional[str] = None,
-                           timeout: int = _DEFAULT_TIMEOUT) -> dict:
-    """POST docker-compose YAML content and return the analysis result dict."""
+                           timeout: int = _DEFAULT_TIMEOUT, include_fixes: bool = True) -> dict:
+    """POST docker-compose YAML content and return the analysis result dict.
+
+    ``include_fixes=False`` asks the API for issues only (no fixes, no AI).
+    """
     payload: dict = {"content": content}
     if filename:
         payload["filename"] = filename
+    if not include_fixes:
+        payload["include_fixes"] = False
     return _post("/analyze/docker-compose", payload, timeout=timeout)
 
 
 def analyze_kubernetes(content: str, filename: Optional[str] = None,
-                       timeout: int = _DEFAULT_TIMEOUT) -> dict:
+                       timeout: int = _DEFAULT_TIMEOUT, include_fixes: bool = True) -> dict:
     """POST Kubernetes manifest YAML content and return the analysis result dict."""
     payload: dict = {"content": content}
     if filename:
         payload["filename"] = filename
+    if not include_fixes:
+        payload["include_fixes"] = False
     return _post("/analyze/kubernetes", payload, timeout=timeout)
 
 
@@ -130,6 +144,8 @@ def analyze_playground(content: str, filename: Optional[str] = None,
 
 def validate_token(token: str) -> dict:
     """POST a JWT to /auth/cli-token to validate it; returns user info dict."""
+    import requests
+
     url = f"{get_api_url()}/auth/cli-token"
     resp = requests.post(
         url, json={"token": token},
@@ -13,13 +13,10 @@ from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from ..client import get_api_url, get_current_user, validate_token
+from ..display import get_console
 
-_console = Console()
 _ENV_FILE = Path.home() / ".checkdk" / ".env"
 
 
@@ -107,6 +104,9 @@ def login_cmd() -> None:
     Starts a local callback server, opens the sign-in page in your browser,
     and receives the token automatically - no copy-pasting required.
     """
+    console = get_console()
+    from rich.panel import Panel
+
     port = _find_free_port()
     callback_url = f"http://127.0.0.1:{port}/callback"
 
@@ -115,8 +115,8 @@ def login_cmd() -> None:
     encoded_cb = urllib.parse.quote(callback_url, safe="")
     login_url = f"{base}/login?cli_callback={encoded_cb}"
 
-    _console.print("\n[bold]Opening browser for sign-in...[/]")
-    _console.print(
+    console.print("\n[bold]Opening browser for sign-in...[/]")
+    console.print(
         "  [dim]If the browser did not open, visit:[/]\n"
         f"  [cyan]{login_url}[/]\n"
     )
@@ -124,25 +124,25 @@ def login_cmd() -> None:
     try:
         webbrowser.open(login_url)
     except Exception:
-        _console.print(f"[yellow]Open this URL in your browser:[/] [cyan]{login_url}[/]\n")
+        console.print(f"[yellow]Open this URL in your browser:[/] [cyan]{login_url}[/]\n")
 
-    with _console.status("[bold cyan]Waiting for authentication (2-min timeout)...[/]"):
+    with console.status("[bold cyan]Waiting for authentication (2-min timeout)...[/]"):
         token = _wait_for_token(port, timeout=120)
 
     if not token:
-        _console.print("[bold red]Login timed out or was cancelled.[/]")
+        console.print("[bold red]Login timed out or was cancelled.[/]")
         sys.exit(1)
 
     try:
         user = validate_token(token)
     except Exception as exc:
-        _console.print(f"[bold red]Token validation failed:[/] {exc}")
+        console.print(f"[bold red]Token validation failed:[/] {exc}")
         sys.exit(1)
 
     _save_token(token)
     os.environ["CHECKDK_TOKEN"] = token
 
-    _console.print(Panel(
+    console.print(Panel(
         f"[bold green]Logged in successfully![/]\n\n"
         f"  Name:     {user.get('name', '?')}\n"
         f"  Email:    {user.get('email', '?')}\n"
@@ -155,20 +155,25 @@ def login_cmd() -> None:
 @auth_cmd.command("logout")
 def logout_cmd() -> None:
     """Remove the stored JWT token."""
+    console = get_console()
     _remove_token()
     if "CHECKDK_TOKEN" in os.environ:
         del os.environ["CHECKDK_TOKEN"]
-    _console.print("[bold green]Logged out.[/] Token removed from local config.")
+    console.print("[bold green]Logged out.[/] Token removed from local config.")
 
 
 @auth_cmd.command("whoami")
 def whoami_cmd() -> None:
     """Show the currently logged-in user."""
+    console = get_console()
+    from rich.panel import Panel
+    from rich.table import Table
+
     try:
         user = get_current_user()
     except Exception as exc:
-        _console.print(f"[bold red]Not logged in or API unreachable:[/] {exc}")
-        _console.print("[dim]Run [bold]checkdk auth login[/] first.[/]")
+        console.print(f"[bold red]Not logged in or API unreachable:[/] {exc}")
+        console.print("[dim]Run [bold]checkdk auth login[/] first.[/]")
         sys.exit(1)
 
     t = Table.grid(padding=(0, 2))
@@ -178,4 +183,4 @@ def whoami_cmd() -> None:
     t.add_row("Email:",    user.get("email", "?"))
     t.add_row("Provider:", user.get("provider", "?"))
     t.add_row("User ID:",  user.get("userId", "?"))
-    _console.print(Panel(t, title="Current User", border_style="cyan"))
+    console.print(Panel(t, title="Current User", border_style="cyan"))
@@ -8,11 +8,8 @@ import time
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-_console = Console()
+from ..display import get_console
 
 _EXPERIMENTS = ["cpu", "memory", "disk", "network"]
 
@@ -72,30 +69,33 @@ def chaos_docker(container: str, experiment: str, duration: int, auto_yes: bool)
         checkdk chaos docker my-api --experiment cpu --duration 60
         checkdk chaos docker my-db  --experiment memory --duration 30 --yes
     """
+    console = get_console()
+    from rich.panel import Panel
+
     if not auto_yes:
-        _console.print(Panel(
+        console.print(Panel(
             f"[bold yellow]About to inject [red]{experiment}[/] chaos into container [cyan]{container}[/][/]\n"
             f"Duration: {duration}s",
             border_style="yellow",
         ))
         click.confirm("Continue?", abort=True)
 
-    _console.print(f"[bold]Injecting [red]{experiment}[/] into [cyan]{container}[/]...[/]")
+    console.print(f"[bold]Injecting [red]{experiment}[/] into [cyan]{container}[/]...[/]")
     stress_cmd = _STRESS_ARGS[experiment] + ["--timeout", f"{duration}s"]
     ok = _docker_exec(container, stress_cmd)
     if not ok:
-        _console.print("[yellow]stress-ng not found in container or exec failed.[/]")
-        _console.print("[dim]Install stress-ng in the container image to use chaos testing.[/]")
+        console.print("[yellow]stress-ng not found in container or exec failed.[/]")
+        console.print("[dim]Install stress-ng in the container image to use chaos testing.[/]")
         sys.exit(1)
 
-    _console.print(f"[green]Experiment running for {duration}s...[/]")
+    console.print(f"[green]Experiment running for {duration}s...[/]")
     time.sleep(duration)
 
     undo = _UNDO_ARGS.get(experiment)
     if undo:
         _docker_exec(container, undo)
 
-    _console.print("[bold green]Chaos experiment complete.[/]")
+    console.print("[bold green]Chaos experiment complete.[/]")
 
     _show_summary(container=container, platform="docker", experiment=experiment, duration=duration)
 
@@ -117,8 +117,11 @@ def chaos_k8s(pod: str, namespace: str, experiment: str, duration: int, auto_yes
         checkdk chaos k8s my-pod -n production --experiment cpu --duration 60
         checkdk chaos k8s api-pod --experiment pod-kill --yes
     """
+    console = get_console()
+    from rich.panel import Panel
+
     if not auto_yes:
-        _console.print(Panel(
+        console.print(Panel(
             f"[bold yellow]About to inject [red]{experiment}[/] chaos into pod [cyan]{pod}[/] "
             f"(ns: {namespace})[/]\n"
             f"Duration: {duration}s",
@@ -126,7 +129,7 @@ def chaos_k8s(pod: str, namespace: str, experiment: str, duration: int, auto_yes
         ))
         click.confirm("Continue?", abort=True)
 
-    _console.print(f"[bold]Injecting [red]{experiment}[/] into pod [cyan]{pod}[/]...[/]")
+    console.print(f"[bold]Injecting [red]{experiment}[/] into pod [cyan]{pod}[/]...[/]")
 
     if experiment == "pod-kill":
         result = subprocess.run(
@@ -134,23 +137,23 @@ def chaos_k8s(pod: str, namespace: str, experiment: str, duration: int, auto_yes
             capture_output=True,
         )
         if result.returncode == 0:
-            _console.print(f"[bold red]Pod {pod} deleted (pod-kill experiment).[/]")
+            console.print(f"[bold red]Pod {pod} deleted (pod-kill experiment).[/]")
         else:
-            _console.print(f"[red]Failed to kill pod:[/] {result.stderr.decode()}")
+            console.print(f"[red]Failed to kill pod:[/] {result.stderr.decode()}")
             sys.exit(1)
     else:
         stress_cmd = _STRESS_ARGS[experiment] + ["--timeout", f"{duration}s"]
         ok = _kubectl_exec(pod, namespace, stress_cmd)
         if not ok:
-            _console.print("[yellow]stress-ng exec failed. Install stress-ng in the pod image.[/]")
+            console.print("[yellow]stress-ng exec failed. Install stress-ng in the pod image.[/]")
             sys.exit(1)
-        _console.print(f"[green]Experiment running for {duration}s...[/]")
+        console.print(f"[green]Experiment running for {duration}s...[/]")
         time.sleep(duration)
         undo = _UNDO_ARGS.get(experiment)
         if undo:
             _kubectl_exec(pod, namespace, undo)
 
-    _console.print("[bold green]Chaos experiment complete.[/]")
+    console.print("[bold green]Chaos experiment complete.[/]")
     _show_summary(pod=pod, namespace=namespace, platform="kubernetes", experiment=experiment, duration=duration)
 
 
@@ -158,6 +161,10 @@ def _show_summary(
     platform: str, experiment: str, duration: int,
     container: str = "", pod: str = "", namespace: str = "",
 ) -> None:
+    console = get_console()
+    from rich.panel import Panel
+    from rich.table import Table
+
     t = Table.grid(padding=(0, 2))
     t.add_column(style="bold")
     t.add_column()
@@ -166,4 +173,4 @@ def _show_summary(
     t.add_row("Target:",     target)
     t.add_row("Experiment:", experiment)
     t.add_row("Duration:",   f"{duration}s")
-    _console.print(Panel(t, title="Chaos Summary", border_style="magenta"))
+    console.print(Panel(t, title="Chaos Summary", border_style="magenta"))
@@ -2,25 +2,40 @@
 
 from __future__ import annotations
 
-import subprocess
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
 
 from ..client import analyze_docker_compose, get_api_url
-from ..display import display_analysis_result
+from ..display import display_analysis_result, get_console, print_json
+from ..process import handoff
 
-_console = Console()
+
+# Checked in this order when several are present.
+_COMPOSE_FILENAMES = ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml")
 
 
 def _find_compose_file() -> Optional[Path]:
-    for name in ["docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml"]:
-        p = Path.cwd() / name
-        if p.exists():
-            return p
+    """Return the compose file in the current directory, if any.
+
+    One directory read instead of a ``stat`` per candidate name — noticeable
+    on network filesystems, and this runs on every ``checkdk docker`` call.
+    """
+    cwd = Path.cwd()
+    found: set[str] = set()
+    try:
+        with os.scandir(cwd) as it:
+            for entry in it:
+                if entry.name in _COMPOSE_FILENAMES and entry.is_file():
+                    found.add(entry.name)
+    except OSError:
+        return None
+    for name in _COMPOSE_FILENAMES:
+        if name in found:
+            return cwd / name
     return None
 
 
@@ -41,8 +56,14 @@ def _find_compose_file_in_args(args: list) -> Optional[str]:
 @click.option("--force",   is_flag=True, help="Execute even if critical issues are found")
 @click.option("--yes", "--ci", "yes", is_flag=True, help="Auto-confirm warnings (non-TTY/CI safe)")
 @click.option("--timeout", default=60, show_default=True, type=int, help="API request timeout in seconds")
+@click.option("--max-issues", default=50, show_default=True, type=click.IntRange(min=0),
+              help="Issues to show per severity (0 = all)")
+@click.option("--plain", is_flag=True, help="Plain-text analysis report (no colours or panels)")
+@click.option("--json", "output_json", is_flag=True, help="Print the analysis as raw JSON")
+@click.option("--quiet-analysis", "quiet", is_flag=True, help="Suppress the analysis report")
 @click.pass_context
-def docker_cmd(ctx, command: tuple, dry_run: bool, force: bool, yes: bool, timeout: int) -> None:
+def docker_cmd(ctx, command: tuple, dry_run: bool, force: bool, yes: bool, timeout: int,
+               max_issues: int, plain: bool, output_json: bool, quiet: bool) -> None:
     """Wrap Docker commands with pre-execution analysis (via API).
 
     \b
@@ -50,52 +71,64 @@ def docker_cmd(ctx, command: tuple, dry_run: bool, force: bool, yes: bool, timeo
         checkdk docker compose up -d
         checkdk docker compose -f my-compose.yml up -d
         checkdk docker compose up --dry-run
+        checkdk docker compose up --dry-run --json | jq .issues
     """
+    # Keep stdout clean for --json / --quiet-analysis; status lines go to stderr.
+    quiet = quiet or output_json
+    console = get_console(stderr=quiet)
     full_command = ["docker"] + list(command)
     args = list(command)
 
     if "compose" not in args:
-        _console.print("[dim]Non-compose command detected. Passing through...[/]\n")
-        sys.exit(subprocess.call(full_command))
+        console.print("[dim]Non-compose command detected. Passing through...[/]\n")
+        handoff(full_command)
 
     compose_file: str | Path | None = _find_compose_file_in_args(args)
     if not compose_file:
         compose_file = _find_compose_file()
 
     if not compose_file:
-        _console.print("[bold yellow]Warning:[/] No docker-compose.yml found in current directory")
-        _console.print("[dim]Skipping analysis...[/]\n")
-        sys.exit(subprocess.call(full_command))
+        console.print("[bold yellow]Warning:[/] No docker-compose.yml found in current directory")
+        console.print("[dim]Skipping analysis...[/]\n")
+        handoff(full_command)
 
     content = Path(compose_file).read_text(encoding="utf-8")
-    _console.print(f"[bold]Analysing:[/] [cyan]{compose_file}[/] via [dim]{get_api_url()}[/]\n")
+    if not quiet:
+        console.print(f"[bold]Analysing:[/] [cyan]{compose_file}[/] via [dim]{get_api_url()}[/]\n")
 
     try:
-        result = analyze_docker_compose(content, filename=str(compose_file), timeout=timeout)
+        # --quiet-analysis shows no fixes, so don't ask the API to build them
+        result = analyze_docker_compose(content, filename=str(compose_file), timeout=timeout,
+                                        include_fixes=output_json or not quiet)
     except Exception as exc:
-        _console.print(f"[bold red]API error:[/] {exc}")
-        _console.print("[yellow]Is the backend running? Check CHECKDK_API_URL.[/]")
+        if output_json:
+            print_json({"error": str(exc)}, indent=False)
+        console.print(f"[bold red]API error:[/] {exc}")
+        console.print("[yellow]Is the backend running? Check CHECKDK_API_URL.[/]")
         sys.exit(1)
 
-    display_analysis_result(result)
+    if output_json:
+        print_json(result)
+    elif not quiet:
+        display_analysis_result(result, max_issues, plain=plain)
 
     if dry_run:
-        _console.print("\n[bold cyan]--dry-run:[/] Analysis complete. Skipping execution.")
+        console.print("\n[bold cyan]--dry-run:[/] Analysis complete. Skipping execution.")
         sys.exit(0 if result.get("success", True) else 1)
 
     has_critical = any(i.get("severity") == "critical" for i in result.get("issues", []))
     if has_critical and not force:
-        _console.print("\n[bold red]Critical issues found. Fix them or use --force to proceed.[/]")
+        console.print("\n[bold red]Critical issues found. Fix them or use --force to proceed.[/]")
         sys.exit(1)
 
     if result.get("issues") and not force:
         if yes or not sys.stdin.isatty():
-            _console.print("\n[yellow]Warnings detected. Auto-confirming (--yes/--ci).[/]")
+            console.print("\n[yellow]Warnings detected. Auto-confirming (--yes/--ci).[/]")
         else:
-            response = _console.input("\n[yellow]Warnings detected. Continue? (y/N):[/] ").strip().lower()
+            response = console.input("\n[yellow]Warnings detected. Continue? (y/N):[/] ").strip().lower()
             if response not in ("y", "yes"):
-                _console.print("[yellow]Execution cancelled.[/]")
+                console.print("[yellow]Execution cancelled.[/]")
                 sys.exit(0)
 
-    _console.print(f"\n[bold green]Executing:[/] [cyan]{' '.join(full_command)}[/]\n")
-    sys.exit(subprocess.call(full_command))
+    console.print(f"\n[bold green]Executing:[/] [cyan]{' '.join(full_command)}[/]\n")
+    handoff(full_command)
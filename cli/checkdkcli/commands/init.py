@@ -6,14 +6,13 @@ import os
 from pathlib import Path
 
 import click
-from rich.console import Console
-
-console = Console()
+from ..display import get_console
 
 
 @click.command("init")
 def init_cmd() -> None:
     """Configure checkDK CLI (set API URL, API keys, etc.)."""
+    console = get_console()
     console.print("[bold]checkDK CLI configuration[/]\n")
 
     default_url = os.getenv("CHECKDK_API_URL", "https://checkdk.app/api")
@@ -9,18 +9,15 @@ from __future__ import annotations
 import subprocess
 import sys
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-import requests
-from rich.console import Console
-from rich.live import Live
-from rich.table import Table
-from rich.text import Text
 
 from ..client import get_api_url
+from ..display import get_console
 
-_console = Console()
+if TYPE_CHECKING:
+    from rich.table import Table
 
 
 def _risk_color(label: str) -> str:
@@ -77,6 +74,8 @@ def _predict(api_url: str, stats: dict, platform: str, service: str, no_ai: bool
     """POST to /predict and return the prediction dict, or None on error."""
     # docker stats CPUPerc can exceed 100% on multi-core machines (e.g. 200% = 2 cores at max).
     # The /predict endpoint validates cpu/memory in [0, 100], so clamp before sending.
+    import requests
+
     cpu = min(stats["cpu"], 100.0)
     memory = min(stats["memory"], 100.0)
     try:
@@ -107,14 +106,17 @@ def _predict(api_url: str, stats: dict, platform: str, service: str, no_ai: bool
             "risk_level": pred.get("risk_level", "unknown"),
         }
     except requests.HTTPError as exc:
-        _console.log(f"[dim red]Predict HTTP {exc.response.status_code}: {exc.response.text[:200]}[/]")
+        get_console().log(f"[dim red]Predict HTTP {exc.response.status_code}: {exc.response.text[:200]}[/]")
         return None
     except Exception as exc:
-        _console.log(f"[dim red]Predict error: {exc}[/]")
+        get_console().log(f"[dim red]Predict error: {exc}[/]")
         return None
 
 
 def _build_table(history: list[dict]) -> Table:
+    from rich.table import Table
+    from rich.text import Text
+
     t = Table(title="checkDK Real-Time Monitor", expand=True)
     t.add_column("#",          style="dim",    width=4)
     t.add_column("CPU %",      style="cyan",   width=8)
@@ -161,12 +163,15 @@ def monitor_docker(container: str, duration: int, interval: int, no_ai: bool) ->
         checkdk monitor docker api --duration 120 --interval 3
         checkdk monitor docker api --no-ai
     """
+    console = get_console()
+    from rich.live import Live
+
     api_url = get_api_url()
     history: list[dict] = []
     start = time.time()
 
-    _console.print(f"[bold]Monitoring container:[/] [cyan]{container}[/]  [dim]{api_url}/predict[/]")
-    _console.print("[dim]Press Ctrl-C to stop.[/]\n")
+    console.print(f"[bold]Monitoring container:[/] [cyan]{container}[/]  [dim]{api_url}/predict[/]")
+    console.print("[dim]Press Ctrl-C to stop.[/]\n")
 
     try:
         with Live(_build_table(history), refresh_per_second=1) as live:
@@ -191,7 +196,7 @@ def monitor_docker(container: str, duration: int, interval: int, no_ai: bool) ->
                 time.sleep(interval)
     except KeyboardInterrupt:
         pass
-    _console.print("\n[bold green]Monitor stopped.[/]")
+    console.print("\n[bold green]Monitor stopped.[/]")
 
 
 @monitor_cmd.command("k8s")
@@ -214,13 +219,16 @@ def monitor_k8s(pod: str, namespace: str, duration: int, interval: int, no_ai: b
         checkdk monitor k8s api-pod --duration 120
         checkdk monitor k8s api-pod --no-ai --interval 15
     """
+    console = get_console()
+    from rich.live import Live
+
     api_url = get_api_url()
     history: list[dict] = []
     start = time.time()
 
-    _console.print(f"[bold]Monitoring pod:[/] [cyan]{pod}[/] (ns: {namespace})  [dim]{api_url}/predict[/]")
-    _console.print(f"[dim]Polling every {interval}s (metrics-server refresh lag: ~15-60s)[/]")
-    _console.print("[dim]Press Ctrl-C to stop.[/]\n")
+    console.print(f"[bold]Monitoring pod:[/] [cyan]{pod}[/] (ns: {namespace})  [dim]{api_url}/predict[/]")
+    console.print(f"[dim]Polling every {interval}s (metrics-server refresh lag: ~15-60s)[/]")
+    console.print("[dim]Press Ctrl-C to stop.[/]\n")
 
     try:
         with Live(_build_table(history), refresh_per_second=1) as live:
@@ -245,4 +253,4 @@ def monitor_k8s(pod: str, namespace: str, duration: int, interval: int, no_ai: b
                 time.sleep(interval)
     except KeyboardInterrupt:
         pass
-    _console.print("\n[bold green]Monitor stopped.[/]")
+    console.print("\n[bold green]Monitor stopped.[/]")
@@ -2,17 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
 
 from ..client import analyze_playground, get_api_url
-from ..display import console, display_playground_result
-
-_console = Console()
+from ..display import display_playground_result, get_console, print_json
 
 
 def _detect_filename(path: str) -> str:
@@ -38,24 +34,25 @@ def playground_cmd(file_path: str, output_json: bool, timeout: int) -> None:
         checkdk playground -f k8s/deployment.yaml
         checkdk playground -f docker-compose.yml --json | jq .score
     """
+    console = get_console()
     content = Path(file_path).read_text(encoding="utf-8")
     filename = _detect_filename(file_path)
 
     if not output_json:
-        _console.print(f"[bold]Analysing:[/] [cyan]{file_path}[/] via [dim]{get_api_url()}[/]\n")
-        _console.print("[dim]Running AI + rule-based analysis (this may take a moment)...[/]\n")
+        console.print(f"[bold]Analysing:[/] [cyan]{file_path}[/] via [dim]{get_api_url()}[/]\n")
+        console.print("[dim]Running AI + rule-based analysis (this may take a moment)...[/]\n")
 
     try:
         result = analyze_playground(content, filename=filename, timeout=timeout)
     except Exception as exc:
         if output_json:
-            print(json.dumps({"error": str(exc)}))
+            print_json({"error": str(exc)}, indent=False)
         else:
-            _console.print(f"[bold red]API error:[/] {exc}")
-            _console.print("[yellow]Is the backend running? Check CHECKDK_API_URL.[/]")
+            console.print(f"[bold red]API error:[/] {exc}")
+            console.print("[yellow]Is the backend running? Check CHECKDK_API_URL.[/]")
         sys.exit(1)
 
     if output_json:
-        print(json.dumps(result, indent=2))
+        print_json(result)
     else:
         display_playground_result(result, file_path)
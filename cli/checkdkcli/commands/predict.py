@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import sys
 from typing import Optional
 
 import click
 
 from ..client import get_api_url, predict_pod_health
-from ..display import console, display_predict_result
+from ..display import display_predict_result, get_console, print_json
 
 
 @click.command("predict")
@@ -49,6 +48,7 @@ def predict_cmd(
     CI/scripting:
         checkdk predict --cpu 85 --memory 70 --json | jq .prediction.label
     """
+    console = get_console()
     if not output_json:
         console.print(f"[dim]Sending metrics to API: {get_api_url()}[/]")
 
@@ -62,13 +62,13 @@ def predict_cmd(
         )
     except Exception as exc:
         if output_json:
-            print(json.dumps({"error": str(exc)}))
+            print_json({"error": str(exc)}, indent=False)
         else:
             console.print(f"[bold red]API error:[/] {exc}")
             console.print("[yellow]Is the backend running? Check CHECKDK_API_URL.[/]")
         sys.exit(1)
 
     if output_json:
-        print(json.dumps(resp, indent=2))
+        print_json(resp)
     else:
         display_predict_result(resp, service, platform)
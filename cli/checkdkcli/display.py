@@ -2,22 +2,49 @@
 
 from __future__ import annotations
 
+import json
 import re
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from rich.console import Console, Group
-from rich.markdown import Markdown
-from rich.markup import escape
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+
+@lru_cache(maxsize=None)
+def get_console(stderr: bool = False) -> Console:
+    """Return the shared rich Console, importing rich on first use.
+
+    rich (and markdown-it behind ``rich.markdown``) dominates CLI start-up, so
+    nothing here imports it at module level — ``checkdk --help`` never pays
+    for it.  ``stderr=True`` gives a console for status chatter that must not
+    mix with machine-readable stdout (``--json``).
+    """
+    from rich.console import Console
+
+    return Console(stderr=stderr)
 
 
 # ── Banners / helpers ─────────────────────────────────────────────────────────
 
+def print_json(data, indent: bool = True) -> None:
+    """Write *data* to stdout as JSON — via orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        print(json.dumps(data, indent=2 if indent else None))
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0) + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def print_banner(version: str = "0.1.0") -> None:
-    console.print(
+    if not sys.stdout.isatty():
+        sys.stdout.write(f"checkDK v{version}\n")
+        return
+    get_console().print(
         f"\n[bold cyan]checkDK[/] v{version}\n"
         "[dim]Predict. Diagnose. Fix – Before You Waste Time.[/]\n"
     )
@@ -25,8 +52,105 @@ def print_banner(version: str = "0.1.0") -> None:
 
 # ── Analysis result display ───────────────────────────────────────────────────
 
-def display_analysis_result(result: dict) -> None:
-    """Render an AnalysisResult dict returned by the API."""
+def _group_by_severity(issues: list[dict]) -> dict[str, list[tuple[int, dict]]]:
+    """Bucket issues by severity as ``(index in issues, issue)`` pairs."""
+    groups: dict[str, list[tuple[int, dict]]] = {"critical": [], "warning": [], "info": []}
+    for n, issue in enumerate(issues):
+        bucket = groups.get(issue.get("severity"))
+        if bucket is not None:
+            bucket.append((n, issue))
+    return groups
+
+
+def _capped(group: list, max_issues: int | None) -> tuple[list, int]:
+    """Split *group* into the rows to show and the number elided."""
+    if not max_issues or len(group) <= max_issues:
+        return group, 0
+    return group[:max_issues], len(group) - max_issues
+
+
+def _more_line(hidden: int) -> str:
+    return f"… {hidden} more (use --max-issues 0 to show all)"
+
+
+def _print_issue_group(
+    console: Console,
+    group: list[tuple[int, dict]],
+    number_style: str,
+    gap: bool = True,
+    max_issues: int | None = None,
+) -> None:
+    """Print a severity group one issue at a time.
+
+    Each row is a pre-built ``Text`` handed straight to the console, so the
+    first issue is on screen before the rest are laid out (a ``Table`` has to
+    measure every row first).  Messages are never parsed as markup.
+    """
+    from rich.text import Text
+
+    shown, hidden = _capped(group, max_issues)
+    width = len(str(len(shown)))
+    indent = " " * (width + 2)
+    for idx, (_, issue) in enumerate(shown, 1):
+        line = Text.assemble(
+            "\n" if gap else "",
+            (f"{idx:>{width}}.", number_style),
+            " ",
+            issue.get("message", "?"),
+        )
+        if issue.get("service_name"):
+            line.append(f"\n{indent}Service: {issue['service_name']}", style="dim")
+        console.print(line)
+    if hidden:
+        console.print(Text(("\n" if gap else "") + indent + _more_line(hidden), style="dim"))
+
+
+def _write_plain_analysis(result: dict, max_issues: int | None = None) -> None:
+    """Plain-text report for pipes and CI logs — no rich involved at all."""
+    issues = result.get("issues", [])
+    fixes  = result.get("fixes",  [])
+    if not issues:
+        sys.stdout.write("No issues found.\n")
+        return
+    lines: list[str] = []
+    groups = _group_by_severity(issues)
+    for sev in ("critical", "warning", "info"):
+        shown, hidden = _capped(groups[sev], max_issues)
+        for idx, (n, issue) in enumerate(shown, 1):
+            service = f" (service: {issue['service_name']})" if issue.get("service_name") else ""
+            lines.append(f"{sev.upper()} {idx}. {issue.get('message', '?')}{service}")
+            fix = fixes[n] if sev == "critical" and n < len(fixes) else None
+            if fix:
+                lines.extend(f"  -> {step}" for step in fix.get("steps", []))
+        if hidden:
+            lines.append(f"{sev.upper()} {_more_line(hidden)}")
+    counts = ", ".join(f"{sev}: {len(groups[sev])}" for sev in ("critical", "warning", "info") if groups[sev])
+    lines.append(f"Summary: {counts}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def display_analysis_result(
+    result: dict,
+    max_issues: int | None = None,
+    plain: bool = False,
+) -> None:
+    """Render an AnalysisResult dict returned by the API.
+
+    At most *max_issues* issues are shown per severity (``None``/0 = all); the
+    rest are summarised in one line.  ``result`` itself is left untouched.
+    ``plain`` (or a non-TTY stdout) skips rich for a plain-text report.
+    """
+    if plain or not sys.stdout.isatty():
+        _write_plain_analysis(result, max_issues)
+        return
+
+    from rich.markdown import Markdown
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
     issues = result.get("issues", [])
     fixes  = result.get("fixes",  [])
 
@@ -39,55 +163,50 @@ def display_analysis_result(result: dict) -> None:
         )
         return
 
-    critical = [i for i in issues if i.get("severity") == "critical"]
-    warnings = [i for i in issues if i.get("severity") == "warning"]
-    info     = [i for i in issues if i.get("severity") == "info"]
-
-    # Build a map from Python object identity → original index in `issues`.
-    # This is safe even when two issues have identical field values (which would
-    # cause list.index() to always return the first match).
-    issue_pos: dict[int, int] = {id(i): n for n, i in enumerate(issues)}
+    # One pass: bucket by severity, keeping each issue's index in `issues` —
+    # fixes[n] is the fix for issues[n], so no searching is needed later.
+    groups = _group_by_severity(issues)
+    critical, warnings, info = groups["critical"], groups["warning"], groups["info"]
 
     if critical:
         console.print("\n[bold red]✗ Critical Issues:[/]")
-        for idx, issue in enumerate(critical, 1):
-            console.print(f"\n[bold red]{idx}.[/] {issue['message']}")
-            if issue.get("service_name"):
-                console.print(f"   [dim]Service: {issue['service_name']}[/]")
-
-            issue_idx = issue_pos.get(id(issue), -1)
-            fix = fixes[issue_idx] if 0 <= issue_idx < len(fixes) else None
-            if fix:
-                is_ai = fix.get("explanation") or fix.get("root_cause")
-                if is_ai:
-                    console.print("\n   [bold green]💡 AI-Enhanced Fix:[/]")
-                    if fix.get("explanation"):
-                        console.print(Markdown(fix["explanation"]))
-                    if fix.get("root_cause"):
-                        console.print("   [bold cyan]Root Cause:[/]")
-                        console.print(Markdown(fix["root_cause"]))
-                    if fix.get("steps"):
-                        console.print("   [bold cyan]Steps:[/]")
+        shown, hidden = _capped(critical, max_issues)
+        for idx, (n, issue) in enumerate(shown, 1):
+            with console:  # one write per issue, not one per line
+                console.print(Text.assemble("\n", (f"{idx}.", "bold red"), " ", issue["message"]))
+                if issue.get("service_name"):
+                    console.print(Text(f"   Service: {issue['service_name']}", style="dim"))
+
+                fix = fixes[n] if n < len(fixes) else None
+                if fix:
+                    is_ai = fix.get("explanation") or fix.get("root_cause")
+                    if is_ai:
+                        console.print("\n   [bold green]💡 AI-Enhanced Fix:[/]")
+                        if fix.get("explanation"):
+                            console.print(Markdown(fix["explanation"]))
+                        if fix.get("root_cause"):
+                            console.print("   [bold cyan]Root Cause:[/]")
+                            console.print(Markdown(fix["root_cause"]))
+                        if fix.get("steps"):
+                            console.print("   [bold cyan]Steps:[/]")
+                            for step in fix.get("steps", []):
+                                console.print(f"   • {escape(step)}")
+                    else:
+                        console.print("\n   [bold green]💡 Fix:[/]")
+                        if fix.get("description"):
+                            console.print(Markdown(fix["description"]))
                         for step in fix.get("steps", []):
-                            console.print(f"   • {escape(step)}")
-                else:
-                    console.print("\n   [bold green]💡 Fix:[/]")
-                    if fix.get("description"):
-                        console.print(Markdown(fix["description"]))
-                    for step in fix.get("steps", []):
-                        console.print(f"   [cyan]→[/] {escape(step)}")
+                            console.print(f"   [cyan]→[/] {escape(step)}")
+        if hidden:
+            console.print(Text(f"\n   {_more_line(hidden)}", style="dim"))
 
     if warnings:
         console.print("\n[bold yellow]⚠ Warnings:[/]")
-        for idx, issue in enumerate(warnings, 1):
-            console.print(f"\n[bold yellow]{idx}.[/] {issue['message']}")
-            if issue.get("service_name"):
-                console.print(f"   [dim]Service: {issue['service_name']}[/]")
+        _print_issue_group(console, warnings, "bold yellow", max_issues=max_issues)
 
     if info:
         console.print("\n[bold blue]ℹ Info:[/]")
-        for idx, issue in enumerate(info, 1):
-            console.print(f"[blue]{idx}.[/] {issue['message']}")
+        _print_issue_group(console, info, "blue", gap=False, max_issues=max_issues)
 
     # Summary
     console.print()
@@ -107,6 +226,13 @@ def display_analysis_result(result: dict) -> None:
 
 def display_predict_result(resp: dict, service: str | None, platform: str) -> None:
     """Render a PredictResponse dict returned by the API."""
+    from rich.console import Group
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
     pred = resp.get("prediction", {})
     risk_colour = {
         "low":      "green",
@@ -234,6 +360,12 @@ def display_predict_result(resp: dict, service: str | None, platform: str) -> No
 
 def display_playground_result(result: dict, file_path: str = "") -> None:
     """Render a PlaygroundAnalysisResult dict returned by /analyze/playground."""
+    from rich.markdown import Markdown
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
     score  = result.get("score", 0)
     status = result.get("status", "unknown")
     issues = result.get("issues", [])
@@ -270,23 +402,22 @@ def display_playground_result(result: dict, file_path: str = "") -> None:
         console.print("[bold green]✓ No issues found![/]")
         return
 
-    issue_pos: dict[int, int] = {id(i): n for n, i in enumerate(issues)}
+    groups = _group_by_severity(issues)
 
     for sev, colour, label in [
         ("critical", "red",    "✗ Critical Issues"),
         ("warning",  "yellow", "⚠ Warnings"),
         ("info",     "blue",   "ℹ Info"),
     ]:
-        group = [i for i in issues if i.get("severity") == sev]
+        group = groups[sev]
         if not group:
             continue
         console.print(f"\n[bold {colour}]{label}:[/]")
-        for idx, issue in enumerate(group, 1):
+        for idx, (n, issue) in enumerate(group, 1):
             console.print(f"\n[bold {colour}]{idx}.[/] {issue.get('message', '?')}")
             if issue.get("service_name"):
                 console.print(f"   [dim]Service: {issue['service_name']}[/]")
-            n = issue_pos.get(id(issue), -1)
-            fix = fixes[n] if 0 <= n < len(fixes) else None
+            fix = fixes[n] if n < len(fixes) else None
             if fix:
                 steps = fix.get("steps") or []
                 if fix.get("explanation"):
@@ -314,7 +445,7 @@ def display_monitor_result(frame: dict, history: list[dict]) -> None:
     col   = {"healthy": "green", "warning": "yellow", "critical": "red"}.get(
         label.lower(), "white"
     )
-    console.print(
+    get_console().print(
         f"[dim]{frame.get('ts', '')}[/]  "
         f"CPU: [cyan]{frame.get('cpu', 0):.1f}%[/]  "
         f"MEM: [cyan]{frame.get('mem', 0):.1f}%[/]  "
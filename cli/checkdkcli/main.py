@@ -6,7 +6,6 @@ import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
 
 from . import __version__
 from .commands.init       import init_cmd
@@ -17,8 +16,7 @@ from .commands.playground import playground_cmd
 from .commands.auth       import auth_cmd
 from .commands.monitor    import monitor_cmd
 from .commands.chaos      import chaos_cmd
-
-console = Console()
+from .display            import get_console
 
 # ── Load ~/.checkdk/.env automatically (if it exists) ────────────────────────
 
@@ -68,7 +66,7 @@ def cli(ctx: click.Context, debug: bool = False) -> None:
     if sub and sub not in _PUBLIC_COMMANDS:
         from .client import get_stored_token
         if not get_stored_token():
-            console.print(
+            get_console().print(
                 "\n[bold red]Not logged in.[/]\n\n"
                 "Run [bold cyan]checkdk auth login[/] to authenticate with your\n"
                 "GitHub or Google account, then try again.\n"
@@ -76,6 +74,7 @@ def cli(ctx: click.Context, debug: bool = False) -> None:
             sys.exit(1)
 
     if ctx.invoked_subcommand is None:
+        console = get_console()
         console.print(
             f"\n[bold cyan]checkDK[/] v{__version__}\n"
             "[dim]Predict. Diagnose. Fix – Before You Waste Time.[/]\n"
@@ -101,12 +100,12 @@ def main() -> None:
     try:
         cli(standalone_mode=False, obj={})
     except (KeyboardInterrupt, click.exceptions.Abort):
-        console.print("\n[yellow]Cancelled.[/]")
+        get_console().print("\n[yellow]Cancelled.[/]")
         sys.exit(130)
     except SystemExit:
         raise
     except Exception as exc:
-        console.print(f"\n[bold red]Error:[/] {exc}")
+        get_console().print(f"\n[bold red]Error:[/] {exc}")
         if "--debug" in sys.argv:
             raise
         sys.exit(1)
@@ -0,0 +1,29 @@
+"""Hand-off to the wrapped docker / kubectl command."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import NoReturn
+
+
+def handoff(command: list[str]) -> NoReturn:
+    """Replace this process with *command*, or run it and exit with its status.
+
+    checkDK has nothing left to do once the wrapped command starts, so on
+    POSIX ``os.execvp`` swaps the process image in place — no resident Python
+    interpreter for the length of a ``docker compose up`` session.  Windows'
+    ``execvp`` does not preserve the console semantics, so it keeps the
+    subprocess path.
+    """
+    if os.name != "posix":
+        sys.exit(subprocess.call(command))
+    # exec skips interpreter shutdown, so pending output must be written now
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvp(command[0], command)
+    except FileNotFoundError:
+        sys.stderr.write(f"checkdk: command not found: {command[0]}\n")
+        sys.exit(127)